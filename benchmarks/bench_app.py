@@ -0,0 +1,294 @@
+"""종단 벤치마크: 실제 앱 경로 (play_piano → run() / Pipeline) 의 단계별 지연 분포
+
+    python -m benchmarks.bench_app --frames 300 --json out.json
+    python -m benchmarks.bench_app --detector synthetic --pipeline --workers 2
+    python -m benchmarks.bench_app --camera replay --source DIR --detector replay
+
+루프를 따로 흉내 내지 않고 app.play_piano 를 그대로 돌린다. 카메라 / 검출기 / sink /
+오버레이 / 화면을 시간 재는 래퍼로 감싸고, app.run 에 넘어가는 infer / output 도 감싼다.
+그래서 --pipeline, --workers, --roi, --motion-gate, --one-euro 같은 앱 옵션을 그대로 쓴다
+(bench 옵션 말고 나머지는 app.parse_args 로 넘어간다).
+
+    capture   camera.read() (Pipeline 이면 캡처 스레드)
+    color     MediaPipe 용 RGB 변환 (--workers 면 작업 프로세스 안이라 없음)
+    detect    detector.detect (color 포함, 래퍼 체인 전체)
+    count     infer - detect: 랜드마크 배열 + 필터 + 손가락 세기
+    bgr       화면 / 녹화용 BGR 변환
+    draw      OverlayRenderer.render
+    show      display.show + poll (--show 일 때 imshow / waitKey)
+    sound     sink play / stop (기본은 FakeGPIO)
+    total     캡처 시각 → output 끝 (Pipeline 큐 대기 포함한 종단 지연)
+
+헤드리스에서 미리보기가 없으면 앱은 그리지 않으므로, bench 는 그림을 그리고 버리는
+화면을 끼워 draw 를 잰다 (--no-draw 면 앱과 똑같이 건너뜀).
+JSON 결과에는 커밋, 기기 모델, 옵션이 같이 남아 커밋 / Pi 모델끼리 비교할 수 있다.
+"""
+import argparse
+import collections
+import contextlib
+import json
+import platform
+import subprocess
+import time
+
+import cv2
+import numpy as np
+
+from handpiano import app
+from handpiano.camera import CAMERAS
+from handpiano.display import HeadlessDisplay
+
+STAGES = ("capture", "color", "detect", "count", "bgr", "draw", "show", "sound", "total")
+DETECTORS = {
+    "mediapipe": ["--backend", "solutions"],
+    "tasks": ["--backend", "tasks"],
+    "synthetic": ["--backend", "synthetic"],
+    "replay": ["--replay-landmarks"],
+}
+
+
+class StageTimer:
+    """단계별 소요 시간 모음. recording 이 False 인 동안 (워밍업) 은 버린다"""
+
+    def __init__(self, stages=STAGES):
+        self.samples = {name: [] for name in stages}
+        self.recording = False
+
+    def add(self, name, seconds):
+        if self.recording:
+            self.samples[name].append(seconds)
+
+    def timed(self, name, func):
+        clock = time.perf_counter
+
+        def call(*args, **kwargs):
+            t0 = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(name, clock() - t0)
+        return call
+
+    def summary(self):
+        out = {}
+        for name, values in self.samples.items():
+            if not values:
+                continue
+            ms = np.array(values) * 1000
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            out[name] = {
+                "count": len(values),
+                "mean_ms": round(float(ms.mean()), 3),
+                "p50_ms": round(float(p50), 3),
+                "p95_ms": round(float(p95), 3),
+                "p99_ms": round(float(p99), 3),
+            }
+        return out
+
+
+class _Timed:
+    """obj 의 methods 를 StageTimer 단계로 재고, 나머지 속성은 그대로 넘긴다"""
+
+    def __init__(self, obj, timer, **methods):
+        self._obj = obj
+        for method, stage in methods.items():
+            setattr(self, method, timer.timed(stage, getattr(obj, method)))
+
+    def __getattr__(self, name):
+        return getattr(self._obj, name)
+
+
+class TimedCamera(_Timed):
+    """read() 시간 + 프레임이 손에 들어온 시각 (replay --max-speed 의 capture_time 은
+    녹화 시각표라 지금보다 앞설 수 있어서, 종단 지연은 둘 중 이른 쪽부터 잰다)
+    """
+
+    def __init__(self, camera, timer):
+        super().__init__(camera, timer)
+        self._timer = timer
+        self._read_at = collections.OrderedDict()  # id(프레임) → read() 가 돌아온 시각
+
+    def read(self):
+        t0 = time.perf_counter()
+        frame = self._obj.read()
+        now = time.perf_counter()
+        self._timer.add("capture", now - t0)
+        if frame is not None:
+            self._read_at[id(frame)] = now
+            while len(self._read_at) > 64:  # Pipeline 큐에서 버려진 프레임 몫
+                self._read_at.popitem(last=False)
+        return frame
+
+    def read_at(self, frame):
+        return self._read_at.pop(id(frame), time.perf_counter())
+
+    @property
+    def normalizer(self):
+        # Picamera2 는 start() 뒤에 normalizer 가 생기므로 그때그때 감싼다
+        return _Timed(self._obj.normalizer, self._timer, to_rgb="color", to_bgr="bgr")
+
+
+class TimedDetector:
+    """detect 시간을 재고 마지막 값을 남긴다 (infer 에서 count = infer - detect 로 쓴다)"""
+
+    def __init__(self, detector, timer):
+        self.detector = detector  # warm_up / close_detector 가 체인을 따라간다
+        self.timer = timer
+        self.last = 0.0
+
+    def detect(self, frame):
+        t0 = time.perf_counter()
+        result = self.detector.detect(frame)
+        self.last = time.perf_counter() - t0
+        self.timer.add("detect", self.last)
+        return result
+
+    def stats(self):
+        return self.detector.stats()
+
+
+class DrawOnlyDisplay(HeadlessDisplay):
+    """매 프레임 그림을 받아서 버린다 (헤드리스에서 draw 단계를 재기 위함)"""
+
+    def wants_frame(self):
+        return True
+
+
+@contextlib.contextmanager
+def instrumented(timer, frames, warmup, draw=True):
+    """app 의 부품 생성 함수와 run() 을 시간 재는 버전으로 바꿔 둔다"""
+    originals = {name: getattr(app, name) for name in
+                 ("camera_from_args", "start_up", "overlay_from_args", "display_from_args",
+                  "run")}
+    state = {"outputs": 0, "first": None, "last": None}
+    clock = time.perf_counter
+
+    def camera_from_args(args):
+        return TimedCamera(originals["camera_from_args"](args), timer)
+
+    def start_up(args, camera, sink=True, metrics=None, **hands_kwargs):
+        startup, sink, detector = originals["start_up"](args, camera, sink, metrics,
+                                                        **hands_kwargs)
+        if sink is not None:
+            sink = _Timed(sink, timer, play="sound", stop="sound")
+        return startup, sink, TimedDetector(detector, timer)
+
+    def overlay_from_args(args, notes=None):
+        return _Timed(originals["overlay_from_args"](args, notes), timer, render="draw")
+
+    def display_from_args(args, window):
+        if draw and args.headless and args.preview is None:
+            display = DrawOnlyDisplay()
+        else:
+            display = originals["display_from_args"](args, window)
+        return _Timed(display, timer, show="show", poll="show")
+
+    def run(camera, infer, output, detector=None, **kwargs):
+        def timed_infer(item):
+            t0 = clock()
+            item = infer(item)
+            timer.add("count", clock() - t0 - detector.last)
+            return item
+
+        def counted_output(item):
+            keep_going = output(item)
+            now = clock()
+            start = min(item["t_capture"], camera.read_at(item["frame"]))
+            timer.add("total", now - start)
+            state["outputs"] += 1
+            if state["outputs"] == warmup:
+                timer.recording = True
+                state["first"] = now
+            state["last"] = now
+            return keep_going is not False and state["outputs"] < warmup + frames
+
+        if warmup == 0:
+            timer.recording = True
+            state["first"] = clock()
+        originals["run"](camera, timed_infer, counted_output, detector=detector, **kwargs)
+
+    for name, func in (("camera_from_args", camera_from_args), ("start_up", start_up),
+                       ("overlay_from_args", overlay_from_args),
+                       ("display_from_args", display_from_args), ("run", run)):
+        setattr(app, name, func)
+    try:
+        yield state
+    finally:
+        for name, func in originals.items():
+            setattr(app, name, func)
+
+
+def machine_info():
+    info = {"machine": platform.machine(), "python": platform.python_version(),
+            "opencv": cv2.__version__}
+    try:
+        with open("/proc/device-tree/model") as f:
+            info["model"] = f.read().strip("\x00\n")
+    except OSError:
+        info["model"] = platform.node()
+    try:
+        info["commit"] = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                        capture_output=True, text=True,
+                                        timeout=2).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        info["commit"] = None
+    return info
+
+
+def run_bench(args, frames=300, warmup=10, draw=True):
+    """app.play_piano(args) 를 frames 장 (워밍업 제외) 돌려 단계별 분포를 모은다"""
+    timer = StageTimer()
+    with instrumented(timer, frames, warmup, draw) as state:
+        app.play_piano(args, window="handpiano bench")
+
+    measured = len(timer.samples["total"])
+    elapsed = (state["last"] - state["first"]) if state["first"] is not None else 0.0
+    return {
+        "frames": measured,
+        "fps": round(measured / elapsed, 2) if elapsed > 0 else 0.0,
+        "stages": timer.summary(),
+    }
+
+
+def print_report(report):
+    print(f"{report['frames']} frames, {report['fps']:.1f} fps"
+          f"  ({report['machine'].get('model')}, commit {report['machine'].get('commit')})")
+    print(f"{'stage':<10} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for name, s in report["stages"].items():
+        print(f"{name:<10} {s['mean_ms']:8.3f} {s['p50_ms']:8.3f} "
+              f"{s['p95_ms']:8.3f} {s['p99_ms']:8.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="hand piano 단계별 지연 벤치마크 (나머지 옵션은 앱과 같다: --pipeline 등)")
+    parser.add_argument("--camera", choices=CAMERAS, default="synthetic")
+    parser.add_argument("--detector", choices=tuple(DETECTORS), default="mediapipe",
+                        help="replay = 녹화된 랜드마크 (--camera replay 필요)")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--show", action="store_true", help="창을 띄워 imshow 까지 포함")
+    parser.add_argument("--no-draw", action="store_true",
+                        help="헤드리스에서 앱처럼 그리기를 건너뜀")
+    parser.add_argument("--json", default=None, metavar="PATH", help="결과를 JSON 으로 저장")
+    args, rest = parser.parse_known_args(argv)
+    if args.detector == "replay" and args.camera != "replay":
+        parser.error("--detector replay 는 --camera replay 와 같이 써야 한다")
+
+    # 최대 속도 / fake 부저가 기본. 뒤에 오는 사용자 옵션이 앞의 기본값을 덮는다
+    app_argv = ["--camera", args.camera, "--fps", "0", "--max-speed"]
+    app_argv += DETECTORS[args.detector] + ([] if args.show else ["--headless"]) + rest
+    app_args = app.parse_args("hand piano bench", sound="fake", argv=app_argv)
+
+    report = run_bench(app_args, frames=args.frames, warmup=args.warmup,
+                       draw=not args.no_draw)
+    report["machine"] = machine_info()
+    report["options"] = {**vars(args), "app": vars(app_args)}
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""손 모양 분류: 규칙 기반 FingerCounter vs 학습한 LandmarkClassifier
+
+    python -m benchmarks.bench_classifier --model models/gesture.npz rec/zero=0 rec/one=1 ...
+
+세션마다 뒤쪽 20% (학습 때 쓰지 않은 부분) 로
+    정확도      : 그대로 / 손목 기준으로 ±30° 돌린 랜드마크
+    처리량      : 배치 한 번 (us/hand), 한 프레임 한 손씩 부르기 (us/call)
+"""
+import argparse
+import time
+
+import numpy as np
+
+from handpiano.classifier import LandmarkClassifier, load_dataset
+from handpiano.gesture import FingerCounter
+
+
+def rotated(landmarks, degrees):
+    """손목(0) 기준으로 화면 평면에서 회전 (x, y 비율은 정사각형이라고 본다)"""
+    theta = np.radians(degrees)
+    c, s = np.cos(theta), np.sin(theta)
+    rel = landmarks[..., :2] - landmarks[..., :1, :2]
+    out = landmarks.copy()
+    out[..., 0] = landmarks[..., :1, 0] + c * rel[..., 0] - s * rel[..., 1]
+    out[..., 1] = landmarks[..., :1, 1] + s * rel[..., 0] + c * rel[..., 1]
+    return out
+
+
+def throughput(classifier, landmarks, is_left, calls=2000):
+    t0 = time.perf_counter()
+    classifier.count_array(landmarks, is_left)
+    batch = (time.perf_counter() - t0) / len(landmarks)
+    n = min(calls, len(landmarks))
+    t0 = time.perf_counter()
+    for i in range(n):
+        classifier.count_array(landmarks[i:i + 1], is_left[i:i + 1])
+    single = (time.perf_counter() - t0) / n
+    return batch, single
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sessions", nargs="+", help="DIR=라벨 또는 DIR")
+    parser.add_argument("--model", default="models/gesture.npz")
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    args = parser.parse_args()
+
+    _, (landmarks, is_left, labels) = load_dataset(args.sessions, args.test_fraction)
+    classifiers = [("규칙 (FingerCounter)", FingerCounter(handed=True)),
+                   ("학습 (LandmarkClassifier)", LandmarkClassifier.load(args.model))]
+
+    print(f"시험 {len(labels)} 손, 라벨 {np.unique(labels).tolist()}")
+    for name, classifier in classifiers:
+        acc = [(classifier.count_array(lm, is_left) == labels).mean()
+               for lm in (landmarks, rotated(landmarks, 30), rotated(landmarks, -30))]
+        batch, single = throughput(classifier, landmarks, is_left)
+        print(f"  {name:<26} 정확도 {acc[0]:.3f}  (±30° {acc[1]:.3f} / {acc[2]:.3f})  "
+              f"배치 {batch * 1e6:6.3f} us/hand  한 손씩 {single * 1e6:6.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
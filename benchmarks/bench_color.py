@@ -0,0 +1,53 @@
+"""프레임당 색 변환 비용: 기존 RGBA→BGR→RGB 두 번 vs FrameNormalizer
+
+    python -m benchmarks.bench_color
+"""
+import argparse
+import timeit
+
+import cv2
+import numpy as np
+
+from handpiano.frames import FrameNormalizer
+
+
+def legacy(frame):
+    """기존 스크립트의 채널 보정 + RGB 변환"""
+    if frame.shape[-1] == 4:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR)
+    elif len(frame.shape) == 2:
+        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return frame, rgb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("-n", "--number", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    xbgr = rng.integers(0, 256, (args.height, args.width, 4), dtype=np.uint8)
+    rgb888 = np.ascontiguousarray(xbgr[..., :3])
+
+    norm_xbgr = FrameNormalizer("XBGR8888")
+    norm_rgb888 = FrameNormalizer("RGB888")
+
+    cases = [
+        ("legacy  XBGR8888 (RGBA→BGR→RGB)", lambda: legacy(xbgr)),
+        ("normal  XBGR8888 (RGB + BGR)", lambda: (norm_xbgr.to_rgb(xbgr), norm_xbgr.to_bgr(xbgr))),
+        ("normal  XBGR8888 (RGB 만, headless)", lambda: norm_xbgr.to_rgb(xbgr)),
+        ("normal  RGB888   (RGB + BGR)", lambda: (norm_rgb888.to_rgb(rgb888), norm_rgb888.to_bgr(rgb888))),
+    ]
+
+    print(f"{args.width}x{args.height}, {args.number}회 평균")
+    for name, func in cases:
+        func()  # 버퍼 할당은 측정에서 제외
+        sec = timeit.timeit(func, number=args.number) / args.number
+        print(f"  {name:<36} {sec * 1e6:8.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
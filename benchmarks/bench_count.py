@@ -0,0 +1,87 @@
+"""손가락 세기: 예전 속성 단위 루프 vs NumPy 벡터화 vs 녹화 전체 배치
+
+    python -m benchmarks.bench_count
+"""
+import argparse
+import gc
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from handpiano.gesture import FingerCounter, count_fingers_array
+from handpiano.hands import landmark_array
+
+
+def as_objects(landmarks):
+    """(손, 21, 3) 배열 → MediaPipe 결과처럼 .landmark[i].x 로 읽는 객체"""
+    return [SimpleNamespace(landmark=[SimpleNamespace(x=p[0], y=p[1], z=p[2]) for p in hand.tolist()])
+            for hand in landmarks]
+
+
+def timed(func, repeat=3):
+    """timeit 처럼 GC 를 끄고 repeat 번 중 가장 빠른 시간"""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            out = func()
+            best = min(best, time.perf_counter() - t0)
+    finally:
+        gc.enable()
+    return out, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--hands", type=int, default=2)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    landmarks = rng.random((args.frames, args.hands, 21, 3), dtype=np.float32)
+    is_left = rng.random((args.frames, args.hands)) < 0.5
+    objects = [as_objects(frame) for frame in landmarks]
+    labels = [["Left" if left else "Right" for left in frame] for frame in is_left]
+    results = [SimpleNamespace(multi_hand_landmarks=hs, multi_handedness=[
+        SimpleNamespace(classification=[SimpleNamespace(label=label)]) for label in ls])
+        for hs, ls in zip(objects, labels)]
+    counter = FingerCounter(handed=True)
+
+    # 1) 예전 방식: 손마다 protobuf 속성을 하나씩 읽기
+    loop, t_loop = timed(lambda: [[counter.count(h, label) for h, label in zip(hs, ls)]
+                                  for hs, ls in zip(objects, labels)])
+
+    # 2) 프레임마다 landmark_array 로 (손, 21, 3) 한 번 변환 후 벡터화
+    def per_frame():
+        out = []
+        for result in results:
+            arr, left = landmark_array(result)
+            out.append(counter.count_array(arr, left).tolist())
+        return out
+    frame_vec, t_frame = timed(per_frame)
+
+    # 2-1) 그중 배열 변환만 (다음 단계들도 이 배열을 그대로 쓴다)
+    _, t_convert = timed(lambda: [landmark_array(result) for result in results])
+    # 2-2) 비교: 중첩 리스트 → np.array
+    _, t_nested = timed(lambda: [np.array([[(p.x, p.y, p.z) for p in h.landmark] for h in hs],
+                                          dtype=np.float32) for hs in objects])
+
+    # 3) 녹화 전체를 한 번에
+    batch, t_batch = timed(lambda: count_fingers_array(landmarks, is_left))
+
+    assert loop == frame_vec == batch.tolist(), "결과가 서로 다름"
+
+    n = args.frames * args.hands
+    print(f"{args.frames} 프레임 x {args.hands} 손")
+    for name, sec in [("속성 단위 루프", t_loop),
+                      ("프레임별 변환 + 벡터화", t_frame),
+                      ("  └ 그중 배열 변환", t_convert),
+                      ("  └ (중첩 리스트 변환이었다면)", t_nested),
+                      ("배치 (count_fingers_array)", t_batch)]:
+        print(f"  {name:<28} {sec * 1e3:9.2f} ms  ({sec / n * 1e6:7.3f} us/hand)")
+
+
+if __name__ == "__main__":
+    main()
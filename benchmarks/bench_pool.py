@@ -0,0 +1,99 @@
+"""추론 풀: 작업 프로세스 수별 처리량 / 지연
+
+    python -m benchmarks.bench_pool [--workers 1,2,3,4] [--detector busy|mediapipe]
+                                    [--unordered]
+
+카메라를 기다리지 않고 합성 프레임을 최대 속도로 밀어 넣어 추론 처리량 상한을 잰다.
+busy 는 MediaPipe 대신 busy-ms 만큼 CPU 를 태우는 가짜 Hands 라
+mediapipe 없는 PC 에서도 프로세스 수에 따른 확장성을 볼 수 있다.
+지연은 submit 부터 결과를 받을 때까지 (ordered 면 앞 번호를 기다린 시간 포함).
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from handpiano.camera import SyntheticCamera
+from handpiano.pool import InferencePool
+from handpiano.results import HandResult
+
+
+class BusyHands:
+    """hands.process 대신 ms 동안 CPU 를 쓰는 객체"""
+
+    def __init__(self, ms=20.0):
+        self.seconds = ms / 1000
+
+    def process(self, rgb):
+        end = time.perf_counter() + self.seconds
+        while time.perf_counter() < end:
+            pass
+        return HandResult()
+
+
+def bench_pool(workers, frames=200, ordered=True, factory=None, **kwargs):
+    camera = SyntheticCamera(frames=None)
+    camera.start()
+    pool = InferencePool(workers, ordered=ordered, factory=factory, **kwargs)
+    first = camera.read()
+    pool.start(first.shape, first.dtype, camera.normalizer.fmt)
+
+    def feed():
+        for _ in range(frames):
+            pool.submit(camera.read(), tag=time.perf_counter())
+
+    latencies = []
+    t0 = time.perf_counter()
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    last = 0
+    while len(latencies) + pool.stale < frames:  # ordered 는 도착한 결과가 아직 안 나갔을 수 있다
+        got = pool.get(timeout=5)
+        if got is None:
+            break
+        seq, t_submit, _ = got
+        assert seq > last, "결과 번호가 거꾸로 나왔다"
+        last = seq
+        latencies.append(time.perf_counter() - t_submit)
+    elapsed = time.perf_counter() - t0
+    feeder.join()
+    stats = pool.stats()
+    pool.close()
+
+    ms = np.array(latencies) * 1000
+    return {
+        "workers": workers,
+        "fps": len(latencies) / elapsed,
+        "delivered": len(latencies),
+        "stale": stats["stale"],
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,3,4")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--detector", choices=("busy", "mediapipe"), default="busy")
+    parser.add_argument("--busy-ms", type=float, default=20.0)
+    parser.add_argument("--unordered", action="store_true", help="순서 대신 최저 지연")
+    args = parser.parse_args()
+
+    if args.detector == "busy":
+        factory, kwargs = BusyHands, {"ms": args.busy_ms}
+    else:
+        factory, kwargs = None, {"max_num_hands": 1}
+
+    print(f"{'workers':>7} {'fps':>7} {'x':>5} {'p50':>8} {'p95':>8} {'stale':>6}")
+    base = None
+    for workers in map(int, args.workers.split(",")):
+        r = bench_pool(workers, args.frames, not args.unordered, factory, **kwargs)
+        base = base or r["fps"]
+        print(f"{workers:7d} {r['fps']:7.1f} {r['fps'] / base:5.2f} "
+              f"{r['p50_ms']:6.1f}ms {r['p95_ms']:6.1f}ms {r['stale']:6d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""ROI 추론 vs 전체 프레임 추적 모드: 프레임당 검출 시간 / 찾은 손
+
+    python -m benchmarks.bench_roi --camera file --source hands.mp4 [--roi 256]
+    python -m benchmarks.bench_roi --camera replay --source session.npz --hands 2
+
+같은 프레임 묶음을 세 방식으로 돌린다.
+    full       : 전체 프레임 HandDetector (추적 모드, 평소 기본값)
+    roi        : RoiDetector, crop_hands 추적 모드 (--roi 기본값)
+    roi-static : RoiDetector, crop_hands static_image_mode=True (ROI 마다 손바닥 검출)
+프레임을 먼저 메모리에 읽어 두므로 카메라 / 디코딩 시간은 빠진다.
+--backend synthetic 은 mediapipe 없이 흐름만 확인할 때 (시간 비교 의미 없음).
+"""
+import argparse
+import time
+
+import numpy as np
+
+from handpiano.camera import open_camera
+from handpiano.hands import HandDetector, create_hands
+from handpiano.roi import RoiDetector
+from handpiano.startup import close_detector
+
+
+def load_frames(camera, limit):
+    camera.start()
+    frames = []
+    try:
+        while len(frames) < limit and (frame := camera.read()) is not None:
+            frames.append(frame)
+    finally:
+        camera.stop()
+    return frames
+
+
+def bench_mode(mode, frames, camera, make_hands, size, hands_kwargs):
+    detector = HandDetector(make_hands(**hands_kwargs), camera)
+    if mode != "full":
+        crop_hands = make_hands(static_image_mode=mode == "roi-static", **hands_kwargs)
+        detector = RoiDetector(detector, crop_hands, size=size,
+                               max_hands=hands_kwargs["max_num_hands"])
+    times, found = [], []
+    for frame in frames:
+        t0 = time.perf_counter()
+        result = detector.detect(frame)
+        times.append(time.perf_counter() - t0)
+        found.append(len(result.multi_hand_landmarks or ()))
+    stats = detector.stats()
+    close_detector(detector)
+
+    ms = np.array(times[1:]) * 1000  # 첫 프레임은 모델 초기화가 섞인다
+    return {
+        "mode": mode,
+        "mean_ms": float(ms.mean()),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "hands": float(np.mean(found)),
+        "roi_frames": stats.get("roi_frames", 0),
+        "full_frames": stats.get("full_frames", len(frames)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--camera", default="file",
+                        choices=("file", "opencv", "picamera2", "replay", "synthetic"))
+    parser.add_argument("--source", default=0)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--roi", type=int, default=256, metavar="SIZE")
+    parser.add_argument("--hands", type=int, default=1, help="max_num_hands")
+    parser.add_argument("--model", choices=("lite", "full"), default="full")
+    parser.add_argument("--backend", choices=("mediapipe", "synthetic"), default="mediapipe")
+    parser.add_argument("--modes", default="full,roi,roi-static")
+    args = parser.parse_args()
+
+    camera = open_camera(args.camera, args.source, realtime=False)
+    frames = load_frames(camera, args.frames)
+    if len(frames) < 2:
+        parser.error("프레임을 읽지 못했다")
+    if args.backend == "synthetic":
+        from handpiano.synthetic import SyntheticHands
+
+        make_hands = SyntheticHands
+    else:
+        def make_hands(**kwargs):
+            return create_hands(model_complexity=0 if args.model == "lite" else 1, **kwargs)
+    hands_kwargs = {"max_num_hands": args.hands}
+
+    h, w = frames[0].shape[:2]
+    print(f"{len(frames)} 프레임 {w}x{h}, ROI {args.roi}px, 손 {args.hands}")
+    print(f"{'mode':>10} {'mean':>8} {'p50':>8} {'p95':>8} {'hands':>6} {'roi':>5} {'full':>5}")
+    for mode in args.modes.split(","):
+        r = bench_mode(mode, frames, camera, make_hands, args.roi, hands_kwargs)
+        print(f"{mode:>10} {r['mean_ms']:6.2f}ms {r['p50_ms']:6.2f}ms {r['p95_ms']:6.2f}ms "
+              f"{r['hands']:6.2f} {r['roi_frames']:5d} {r['full_frames']:5d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""손가락 개수 필터: 초당 음 바뀜 횟수와 추가 지연
+
+    python -m benchmarks.bench_smoothing [--budget 0.15] [--session DIR]
+
+--session 으로 녹화 폴더(--record)를 주면 녹화된 랜드마크로 개수를 다시 세어 쓰고,
+없으면 "몇 초마다 음을 바꾸고, 가끔 한두 프레임 튀는" 열을 만들어 쓴다.
+"""
+import argparse
+
+import numpy as np
+
+from handpiano.gesture import count_fingers_array
+from handpiano.record import load_session
+from handpiano.smoothing import evaluate, make_filter
+
+
+def noisy_session(seconds=60, fps=30, hold=1.5, jitter=0.05, seed=0):
+    """hold 초마다 바뀌는 진짜 개수 + jitter 확률로 1~2 프레임 튀는 값"""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * fps)
+    times = np.arange(n) / fps
+    true = rng.integers(0, 6, int(seconds / hold) + 1)[(times // hold).astype(int)]
+    values = true.copy()
+    for i in np.flatnonzero(rng.random(n) < jitter):
+        values[i:i + rng.integers(1, 3)] = rng.integers(0, 6)
+    return values.tolist(), times.tolist()
+
+
+def recorded_session(path):
+    """녹화 랜드마크 → 프레임별 첫 번째 손의 손가락 개수 (손이 없으면 0)"""
+    session = load_session(path)
+    counts = count_fingers_array(session["landmarks"][:, 0])
+    return counts.tolist(), session["t"].tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.15, help="허용 추가 지연 (초)")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--session", default=None, help="녹화 폴더 (없으면 합성 열)")
+    parser.add_argument("filters", nargs="*",
+                        default=["none", "majority:3", "majority:5", "dwell:0.07", "dwell:0.1"])
+    args = parser.parse_args()
+
+    if args.session:
+        values, times = recorded_session(args.session)
+    else:
+        values, times = noisy_session(fps=args.fps)
+    print(f"{'filter':<12} {'flips/s':>8} {'(raw)':>7} {'mean ms':>8} {'p95 ms':>7} {'max ms':>7}  budget")
+    for spec in args.filters:
+        r = evaluate(make_filter(spec), values, times, args.budget)
+        print(f"{spec:<12} {r['flips_per_s']:8.2f} {r['flips_per_s_raw']:7.2f} "
+              f"{r['latency_mean_ms']:8.1f} {r['latency_p95_ms']:7.1f} {r['latency_max_ms']:7.1f}  "
+              f"{'ok' if r['within_budget'] else 'OVER'}")
+
+
+if __name__ == "__main__":
+    main()
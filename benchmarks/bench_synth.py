@@ -0,0 +1,70 @@
+"""신스 목소리 수별 렌더 비용: 실시간 몇 배속으로 섞을 수 있나
+
+    python -m benchmarks.bench_synth [--block 256] [--rate 44100] [--seconds 5]
+
+한 블록을 렌더하는 시간을 블록 길이(= 오디오 콜백 마감)와 비교한다.
+load = 렌더 시간 / 블록 길이. 콜백 하나가 마감의 절반(load 0.5) 안에 끝나야
+다른 스레드(카메라, MediaPipe)와 같이 돌아도 끊기지 않는다고 본다.
+
+측정 예 (vCPU 1 개 공유 x86 VM, Intel Xeon, Python 3.11.7, NumPy 2.4.6,
+sine, block 256 @ 44100 Hz = 5.80 ms 마감, 5 초씩 3 번):
+    32 목소리  p99 543-659 us  p99 load 0.09-0.11   → 세 번 모두 통과
+    64 목소리  p99 1.26-3.48 ms p99 load 0.22-0.60  → 한 번은 0.5 초과
+이 기기에서 믿을 수 있는 상한은 32 목소리다 (SynthSink 기본 max_voices=8 은 p99 load 0.04).
+Pi 4 수치는 아직 기기에서 재지 않았다.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from handpiano.synth import WAVEFORMS, Synth
+
+
+def bench_voices(voices, rate=44100, block=256, seconds=5.0, waveform="sine"):
+    synth = Synth(rate=rate, block=block, max_voices=voices, waveform=waveform)
+    freqs = 261.0 * 2 ** (np.arange(voices) / 12)
+    for v, f in enumerate(freqs):
+        synth.note_on(v, f)
+    blocks = max(1, int(seconds * rate / block))
+    for _ in range(20):  # 엔벨로프 상승 / 캐시 워밍업
+        synth.render()
+
+    times = np.empty(blocks)
+    for i in range(blocks):
+        t0 = time.perf_counter()
+        synth.render()
+        times[i] = time.perf_counter() - t0
+    period = block / rate
+    return {
+        "voices": voices,
+        "mean_us": times.mean() * 1e6,
+        "p99_us": np.percentile(times, 99) * 1e6,
+        "load": times.mean() / period,
+        "p99_load": np.percentile(times, 99) / period,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument("--block", type=int, default=256)
+    parser.add_argument("--seconds", type=float, default=5.0, help="목소리 수마다 렌더할 오디오 길이")
+    parser.add_argument("--waveform", choices=WAVEFORMS, default="sine")
+    parser.add_argument("--voices", default="1,2,4,8,16,32,64")
+    args = parser.parse_args()
+
+    print(f"block {args.block} @ {args.rate} Hz = {args.block / args.rate * 1000:.2f} ms 마감")
+    print(f"{'voices':>6} {'mean':>9} {'p99':>9} {'load':>6} {'p99load':>8}")
+    best = 0
+    for voices in map(int, args.voices.split(",")):
+        r = bench_voices(voices, args.rate, args.block, args.seconds, args.waveform)
+        print(f"{voices:6d} {r['mean_us']:7.1f}us {r['p99_us']:7.1f}us "
+              f"{r['load']:6.3f} {r['p99_load']:8.3f}")
+        if r["p99_load"] < 0.5:
+            best = voices
+    print(f"p99 load < 0.5 를 지키는 최대 목소리 수: {best}")
+
+
+if __name__ == "__main__":
+    main()
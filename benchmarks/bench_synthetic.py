@@ -0,0 +1,116 @@
+"""합성 손으로 개수 세기 / 스무딩 / 채점 경로를 따로 재기 (정답과 비교)
+
+    python -m benchmarks.bench_synthetic [--frames 2000000] [--hands 2] [--glitch 0.02]
+
+    generate  SyntheticHands.generate 청크 (frames/min)
+    count     FingerCounter.count_array 배치: 정확도 + us/hand
+    process   hands.process 대용 HandResult 한 프레임씩 + landmark_array
+    smooth    make_filter 를 첫 손 개수열에 프레임마다: 정답 일치율, 초당 음 바뀜
+    score     정답 개수가 바뀌는 순간으로 만든 채보를 정답 / 센 값 / 스무딩 값으로 채점
+"""
+import argparse
+import time
+
+import numpy as np
+
+from handpiano.gesture import FingerCounter
+from handpiano.hands import landmark_array
+from handpiano.scoring import Chart, ChartNote, ScoringEngine
+from handpiano.smoothing import flips_per_second, make_filter
+from handpiano.synthetic import SyntheticHands
+
+
+def chart_from_truth(counts, times):
+    """정답 개수가 1~5 로 바뀌는 프레임 시각을 목표로 하는 채보"""
+    changed = np.flatnonzero(np.diff(counts) != 0) + 1
+    return Chart([ChartNote(float(times[i]), int(counts[i])) for i in changed
+                  if counts[i] > 0])
+
+
+def score(counts, times, truth, latency_offset=0.0):
+    chart = chart_from_truth(truth, times)  # 채점하면 음마다 판정이 남으므로 매번 새로
+    engine = ScoringEngine(chart, latency_offset)
+    engine.start(float(times[0]))
+    t0 = time.perf_counter()
+    for value, t in zip(counts, times):
+        engine.update(value, t)
+    sec = time.perf_counter() - t0
+    return engine.summary(), sec / len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2_000_000)
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument("--chunk", type=int, default=65536)
+    parser.add_argument("--rotation", type=float, default=20.0)
+    parser.add_argument("--noise", type=float, default=0.003)
+    parser.add_argument("--glitch", type=float, default=0.02)
+    parser.add_argument("--dropout", type=float, default=0.01)
+    parser.add_argument("--smooth", nargs="*", default=["none", "majority:5", "dwell:0.1"])
+    parser.add_argument("--stream", type=int, default=30 * 600,
+                        help="스무딩 / 채점에 쓸 프레임 수 (프레임마다 파이썬 호출)")
+    args = parser.parse_args()
+
+    hands = SyntheticHands(max_num_hands=args.hands, rotation=args.rotation, noise=args.noise,
+                           glitch=args.glitch, dropout=args.dropout)
+    counter = FingerCounter(handed=True)
+
+    # generate + count (청크 단위, 메모리는 청크 크기만)
+    t_gen = t_count = 0.0
+    correct = visible = 0
+    done = 0
+    while done < args.frames:
+        n = min(args.chunk, args.frames - done)
+        t0 = time.perf_counter()
+        data = hands.generate(n)
+        t1 = time.perf_counter()
+        counts = counter.count_array(data["landmarks"], data["is_left"])
+        t2 = time.perf_counter()
+        t_gen += t1 - t0
+        t_count += t2 - t1
+        correct += int((counts == data["count"])[data["visible"]].sum())
+        visible += int(data["visible"].sum())
+        done += n
+    n_hands = args.frames * args.hands
+    print(f"{args.frames} 프레임 x {args.hands} 손 (회전 ±{args.rotation}°, 잡음 {args.noise}, "
+          f"glitch {args.glitch}, dropout {args.dropout})")
+    print(f"  generate  {args.frames / t_gen * 60 / 1e6:8.1f} M frames/min")
+    print(f"  count     {t_count / n_hands * 1e6:8.3f} us/hand   정확도 {correct / visible:.4f}")
+
+    # hands.process 대용 경로
+    single = SyntheticHands(max_num_hands=args.hands, chunk=4096)
+    m = 20000
+    t0 = time.perf_counter()
+    for _ in range(m):
+        landmark_array(single.process())
+    print(f"  process   {(time.perf_counter() - t0) / m * 1e6:8.1f} us/frame (HandResult + 배열 변환)")
+
+    # 스무딩 / 채점: 한 손의 개수열을 프레임마다 (실제 루프처럼 파이썬 호출)
+    stream = SyntheticHands(max_num_hands=1, rotation=args.rotation, noise=args.noise,
+                            glitch=args.glitch, dropout=args.dropout, seed=1)
+    data = stream.generate(args.stream)
+    truth = data["count"][:, 0]
+    raw = counter.count_array(data["landmarks"], data["is_left"])[:, 0]
+    times = data["t"]
+    print(f"  smooth    ({args.stream} 프레임, 정답 음 바뀜 {flips_per_second(truth, times):.2f}/s)")
+    smoothed = {}
+    for spec in args.smooth:
+        filt = make_filter(spec)
+        t0 = time.perf_counter()
+        out = [filt.update(v, t) for v, t in zip(raw.tolist(), times.tolist())]
+        sec = time.perf_counter() - t0
+        smoothed[spec] = out
+        match = (np.array(out) == truth).mean()
+        print(f"    {spec:<12} {sec / len(out) * 1e6:6.2f} us/frame  정답 일치 {match:.4f}  "
+              f"음 바뀜 {flips_per_second(out, times):.2f}/s")
+
+    print("  score")
+    for name, values in [("정답", truth.tolist()), ("센 값", raw.tolist())] + \
+            [(f"스무딩 {spec}", out) for spec, out in smoothed.items()]:
+        summary, per = score(values, times.tolist(), truth)
+        print(f"    {name:<18} {per * 1e6:6.2f} us/frame  {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""손가락 피아노 공통 모듈
+
+무거운 의존성(cv2, mediapipe, RPi.GPIO, picamera2)은 각 하위 모듈에서
+필요할 때만 가져오므로, 패키지 자체는 카메라 없이도 import 할 수 있다.
+"""
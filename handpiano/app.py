@@ -0,0 +1,424 @@
+"""공통 실행 루프와 명령행 옵션
+
+각 스크립트(piano.py, test.py, ...)는 여기 있는 부품을 조합하는 얇은 진입점이다.
+"""
+import argparse
+import time
+
+from handpiano.camera import CAMERAS, frame_time, open_camera
+from handpiano.display import open_display
+from handpiano.gesture import FingerCounter
+from handpiano.hands import HandDetector, create_hands, landmark_array
+from handpiano.metrics import PianoMetrics
+from handpiano.motion import MotionGatedDetector
+from handpiano.notes import NOTE_FREQ
+from handpiano.overlay import OverlayRenderer
+from handpiano.pipeline import Pipeline
+from handpiano.record import FRAME_MODES, ReplayDetector, SessionRecorder
+from handpiano.roi import RoiDetector
+from handpiano.smoothing import OneEuroFilter, make_filter
+from handpiano.sound import SINKS, open_sink
+from handpiano.startup import Startup, close_detector, warm_up
+
+
+def parse_args(description, camera="picamera2", sound="buzzer", argv=None):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--camera", choices=CAMERAS, default=camera,
+                        help="카메라 백엔드")
+    parser.add_argument("--source", default="0",
+                        help="opencv 장치 번호, file 경로 또는 replay 녹화 폴더")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--codec", choices=("mjpeg", "yuv420"), default="mjpeg",
+                        help="libcamera-vid 출력 형식 (yuv420 = 압축 없음, 디코드 생략)")
+    parser.add_argument("--sound", choices=tuple(SINKS), default=sound,
+                        help="소리 출력 (GPIO 가 없으면 null, synth* = 다성 신스)")
+    parser.add_argument("--wav", default="synth.wav", metavar="PATH",
+                        help="--sound synth-wav 가 쓸 WAV 파일")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="캡처 / 추론 / 출력을 별도 스레드 단계로 실행")
+    parser.add_argument("--record", default=None, metavar="DIR",
+                        help="프레임 + 랜드마크 + 시각을 DIR 에 녹화")
+    parser.add_argument("--record-frames", choices=FRAME_MODES, default="video",
+                        help="프레임 저장 방식 (video=MJPEG, raw=원본, none=랜드마크만)")
+    parser.add_argument("--label", type=int, default=None,
+                        help="녹화 내내 든 손 모양의 정답 (분류기 학습용, meta.json 에 남는다)")
+    parser.add_argument("--classifier", default=None, metavar="NPZ",
+                        help="규칙 기반 대신 학습한 손 모양 분류기 (handpiano.classifier)")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="replay 를 녹화 속도가 아니라 최대 속도로 재생")
+    parser.add_argument("--replay-landmarks", action="store_true",
+                        help="replay 때 MediaPipe 대신 녹화된 랜드마크 사용")
+    parser.add_argument("--smooth", default="none",
+                        help="손가락 개수 필터: none / majority:N / dwell:SEC")
+    parser.add_argument("--one-euro", action="store_true",
+                        help="랜드마크 좌표에 One-Euro 필터 적용")
+    parser.add_argument("--backend", choices=("solutions", "tasks", "synthetic"),
+                        default="solutions",
+                        help="solutions = Hands.process (동기), "
+                             "tasks = HandLandmarker LIVE_STREAM (비동기), "
+                             "synthetic = 정답을 아는 합성 손 (카메라 / mediapipe 없이)")
+    parser.add_argument("--model", choices=("full", "lite"), default="full",
+                        help="손 랜드마크 모델 크기")
+    parser.add_argument("--model-path", default=None, metavar="TASK",
+                        help="--backend tasks 에서 쓸 .task 파일 "
+                             "(기본 models/hand_landmarker[_lite].task)")
+    parser.add_argument("--motion-gate", type=float, default=None, metavar="THRESH",
+                        help="장면 변화가 THRESH 미만이면 MediaPipe 를 건너뜀 (예: 3)")
+    parser.add_argument("--max-skip", type=int, default=10,
+                        help="움직임이 없어도 이 프레임 수마다 한 번은 추론")
+    parser.add_argument("--roi", type=int, default=None, metavar="SIZE",
+                        help="손을 찾은 뒤에는 주변만 SIZE x SIZE 로 잘라 추론 (예: 256)")
+    parser.add_argument("--workers", type=int, default=0, metavar="N",
+                        help="MediaPipe 를 N 개 프로세스에서 돌림 (공유 메모리로 프레임 전달)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="--workers 결과를 순서 대신 도착 순으로 (늦은 결과는 버림)")
+    parser.add_argument("--metrics", type=int, default=None, metavar="PORT",
+                        help="127.0.0.1:PORT/metrics 에 Prometheus 형식 지표")
+    parser.add_argument("--headless", action="store_true",
+                        help="창 없이 실행 (그리기 / imshow / waitKey 생략)")
+    parser.add_argument("--preview", type=int, default=None, metavar="PORT",
+                        help="headless 일 때 127.0.0.1:PORT 에 MJPEG 미리보기")
+    parser.add_argument("--preview-fps", type=float, default=5)
+    parser.add_argument("--preview-width", type=int, default=320)
+    parser.add_argument("--display-fps", type=float, default=None,
+                        help="창에 그리는 최대 fps (검출 속도와 별개, 기본은 매 프레임)")
+    parser.add_argument("--display-width", type=int, default=None,
+                        help="창에 그릴 가로 크기 (줄여서 그리면 오버레이 / imshow 가 싸다)")
+    parser.add_argument("--governor", action="store_true",
+                        help="온도 / 추론 시간을 보고 fps, 추론 해상도, 추론 간격을 자동 조절")
+    parser.add_argument("--target-latency", type=float, default=0.08, metavar="SEC",
+                        help="--governor 가 지키려는 추론 시간")
+    parser.add_argument("--chart", default=None, metavar="JSON",
+                        help="게임 채보 파일 (없으면 --chart-seed 로 랜덤 채보)")
+    parser.add_argument("--chart-seed", type=int, default=None,
+                        help="랜덤 채보 시드 (같은 시드 = 같은 채보)")
+    parser.add_argument("--latency-offset", type=float, default=0.0, metavar="SEC",
+                        help="게임 판정에서 손동작 시각을 이만큼 앞당겨 본다 (스무딩 지연 보정)")
+    args = parser.parse_args(argv)
+    if args.replay_landmarks and args.camera != "replay":
+        parser.error("--replay-landmarks 는 --camera replay 와 같이 써야 한다")
+    return args
+
+
+def camera_from_args(args):
+    source = int(args.source) if args.source.isdigit() else args.source
+    camera = open_camera(args.camera, source, args.width, args.height, args.fps,
+                         realtime=not args.max_speed, codec=args.codec)
+    governor = None
+    if args.governor:
+        from handpiano.governor import GovernedCamera, Governor
+
+        governor = Governor(target_latency=args.target_latency)
+        camera = GovernedCamera(camera, governor)
+    if args.workers and not args.replay_landmarks:
+        from handpiano.pool import InferencePool, PooledCamera
+
+        factory = None
+        if args.backend == "synthetic":
+            from handpiano.synthetic import SyntheticHands
+
+            factory = SyntheticHands
+        # max_num_hands 같은 스크립트별 Hands 옵션은 start_up 이 카메라를 켜기 전에 더한다
+        pool = InferencePool(args.workers, ordered=not args.unordered, factory=factory,
+                             model_complexity=_complexity(args))
+        camera = PooledCamera(camera, pool)
+        camera.governor = governor  # detector_from_args 가 찾는다
+    return camera
+
+
+def sink_from_args(args):
+    if args.sound == "synth-wav":
+        return open_sink(args.sound, path=args.wav)
+    return open_sink(args.sound)
+
+
+def display_from_args(args, window):
+    return open_display(window, headless=args.headless, preview_port=args.preview,
+                        preview_fps=args.preview_fps, preview_width=args.preview_width,
+                        display_fps=args.display_fps)
+
+
+def overlay_from_args(args, notes=None):
+    """헤드리스 미리보기는 미리보기 크기로 바로 그린다"""
+    width = args.preview_width if args.headless else args.display_width
+    return OverlayRenderer(width=width, notes=notes)
+
+
+def recorder_from_args(args, camera):
+    if args.record is None:
+        return None
+    return SessionRecorder(args.record, camera, frames=args.record_frames, fps=args.fps,
+                           label=args.label)
+
+
+def classifier_from_args(args, default):
+    """--classifier 가 있으면 학습한 분류기, 없으면 스크립트가 정한 분류기"""
+    if args.classifier is None:
+        return default
+    from handpiano.classifier import LandmarkClassifier
+
+    return LandmarkClassifier.load(args.classifier)
+
+
+def detector_from_args(args, camera, **hands_kwargs):
+    """MediaPipe Hands + (옵션) ROI 추론 + (옵션) 움직임 게이트 + (옵션) 거버너
+
+    --workers 면 추론은 PooledCamera 의 작업 프로세스가 하므로 ROI / 움직임 게이트는 쓰지 않는다.
+    거버너도 이때는 캡처 fps 만 조절한다 (공유 메모리 슬롯 크기가 고정이라 축소는 안 한다).
+    """
+    if args.replay_landmarks:
+        return ReplayDetector(camera)
+    if args.workers:
+        from handpiano.pool import PooledDetector
+
+        return PooledDetector(camera)
+    if args.backend == "tasks":
+        from handpiano.landmarker import TasksHandDetector
+
+        detector = TasksHandDetector(camera, args.model_path, args.model, **hands_kwargs)
+        if args.roi is not None:
+            print("--roi 는 tasks 백엔드에서 쓰지 않는다 (결과가 늦게 와서 ROI 좌표와 맞지 않음)")
+    else:
+        if args.backend == "synthetic":
+            from handpiano.synthetic import SyntheticHands
+
+            make_hands = SyntheticHands
+        else:
+            def make_hands(**kwargs):
+                return create_hands(model_complexity=_complexity(args), **kwargs)
+        detector = HandDetector(make_hands(**hands_kwargs), camera)
+        if args.roi is not None:
+            detector = RoiDetector(detector, make_hands(**hands_kwargs), size=args.roi,
+                                   max_hands=hands_kwargs.get("max_num_hands", 1))
+    if args.motion_gate is not None:
+        detector = MotionGatedDetector(detector, args.motion_gate, args.max_skip)
+    governor = getattr(camera, "governor", None)
+    if governor is not None:
+        from handpiano.governor import GovernedDetector
+
+        detector = GovernedDetector(detector, governor)
+    return detector
+
+
+def _complexity(args):
+    return 0 if args.model == "lite" else 1
+
+
+def metrics_from_args(args):
+    """지표는 항상 모으고 (핫 루프 비용이 작다), --metrics 가 있을 때만 HTTP 로 내보낸다"""
+    metrics = PianoMetrics()
+    if args.metrics is not None:
+        metrics.serve(args.metrics)
+    return metrics
+
+
+def start_up(args, camera, sink=True, metrics=None, **hands_kwargs):
+    """카메라 시작, sink(GPIO) 준비, MediaPipe 로딩 + 워밍업을 동시에 → (startup, sink, detector)
+
+    이 뒤의 run() 에는 started=True 를 넘긴다.
+    metrics 를 주면 sink 를 감싸 음 변화를 세고, 카메라 / 검출기 지표를 연결한다.
+    """
+    startup = Startup()
+    pool = getattr(camera, "pool", None)
+    if pool is not None:
+        # 풀은 카메라의 첫 프레임에서 뜨므로 병렬 시작 전에 Hands 옵션을 채워 둔다
+        pool.hands_kwargs.update(hands_kwargs)
+    tasks = {
+        "camera": camera.start,
+        "detector": lambda: warm_up(detector_from_args(args, camera, **hands_kwargs),
+                                    args.width, args.height),
+    }
+    if sink:
+        tasks["sink"] = lambda: sink_from_args(args)
+    done = startup.parallel(**tasks)
+    sink, detector = done.get("sink"), done["detector"]
+    if metrics is not None:
+        metrics.watch_camera(camera)
+        metrics.watch_detector(detector)
+        if getattr(camera, "governor", None) is not None:
+            metrics.watch_governor(camera.governor)
+        if sink is not None:
+            sink = metrics.watch_sink(sink)
+    return startup, sink, detector
+
+
+def filters_from_args(args):
+    """(랜드마크 필터 또는 None, 개수 필터)"""
+    euro = OneEuroFilter() if args.one_euro else None
+    return euro, make_filter(args.smooth)
+
+
+def run(camera, infer, output, pipeline=False, sink=None, detector=None, recorder=None,
+        display=None, started=False, metrics=None):
+    """camera → infer(item) → output(item) 반복. output 이 False 를 돌려주면 종료
+
+    item 은 "frame"(카메라 원본), "t_capture" 를 가진 dict 이다.
+    detector 를 주면 끝날 때 추론 / 건너뜀 횟수를 출력하고 검출기를 닫는다.
+    recorder 를 주면 infer 가 끝난 item 을 녹화한다.
+    display 를 주면 끝날 때 창 / 미리보기 서버를 닫는다.
+    started=True 면 camera.start() 를 이미 불렀다는 뜻 (start_up 참고).
+    metrics 를 주면 추론 시간, 종단 지연, 프레임 수를 기록하고 끝날 때 서버를 닫는다.
+    """
+    if recorder is not None:
+        infer = _recording(infer, recorder)
+    if metrics is not None:
+        infer, output = _metered(infer, output, metrics)
+
+    def stamp(frame):
+        t = frame_time(camera, frame)
+        if metrics is not None:
+            metrics.captured(t)
+        return t
+
+    if not started:
+        camera.start()
+    try:
+        if pipeline:
+            p = Pipeline(camera.read, [("inference", infer)], timestamp=stamp)
+            if metrics is not None:
+                metrics.watch_pipeline(p)
+            p.run(output)
+            p.report()
+        else:
+            while True:
+                frame = camera.read()
+                if frame is None:
+                    break
+                item = {"frame": frame, "t_capture": stamp(frame)}
+                if output(infer(item)) is False:
+                    break
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        camera.stop()
+        if display is not None:
+            display.close()
+        if sink is not None:
+            sink.close()
+        if detector is not None:
+            print(f"detector: {detector.stats()}")
+            close_detector(detector)  # LIVE_STREAM landmarker 의 콜백 스레드 등
+        if recorder is not None:
+            recorder.close()
+        if metrics is not None:
+            metrics.close()
+
+
+def detect_item(detector, item):
+    """item["frame"] 을 검출. 결과가 늦게 오는 검출기(tasks)면 t_capture 를 결과를 낸 프레임의
+    캡처 시각으로 바꾼다 → 필터 / 판정 / 지연 지표가 실제로 본 장면의 시각을 쓴다
+    """
+    result = detector.detect(item["frame"])
+    t_capture = getattr(result, "t_capture", None)
+    if t_capture is not None:
+        item["t_capture"] = t_capture
+    return result
+
+
+def _metered(infer, output, metrics):
+    clock = time.perf_counter
+
+    def timed_infer(item):
+        t0 = clock()
+        item = infer(item)
+        metrics.inference.observe(clock() - t0)
+        return item
+
+    def counted_output(item):
+        keep_going = output(item)
+        metrics.frames.inc()
+        metrics.latency.observe(clock() - item["t_capture"])
+        return keep_going
+
+    return timed_infer, counted_output
+
+
+def _recording(infer, recorder):
+    def infer_and_record(item):
+        item = infer(item)
+        recorder.add(item)
+        return item
+    return infer_and_record
+
+
+# -------------------------------
+# 한 손 피아노 (piano.py, color_to_sound_*.py)
+# -------------------------------
+def play_piano(args, window="MediaPipe Hand Piano", classifier=None):
+    camera = camera_from_args(args)
+    metrics = metrics_from_args(args)
+    startup, sink, detector = start_up(args, camera, metrics=metrics, max_num_hands=1,
+                                       min_detection_confidence=0.7)
+    recorder = recorder_from_args(args, camera)
+    display = display_from_args(args, window)
+    overlay = overlay_from_args(args, notes=sorted(NOTE_FREQ))
+    classifier = classifier_from_args(args, classifier or FingerCounter())
+    euro, smoother = filters_from_args(args)
+
+    def infer(item):
+        result = detect_item(detector, item)
+
+        landmarks, is_left = landmark_array(result)
+        if euro is not None:
+            landmarks = euro.update(landmarks, item["t_capture"])
+        counts = classifier.count_array(landmarks, is_left)
+        finger_count = int(counts[-1]) if len(counts) else 0
+        finger_count = smoother.update(finger_count, item["t_capture"])
+
+        item["result"] = result
+        item["landmarks"], item["is_left"] = landmarks, is_left
+        item["finger_count"] = finger_count
+        return item
+
+    def output(item):
+        startup.mark("first_frame")
+        finger_count = item["finger_count"]
+        if finger_count in NOTE_FREQ:
+            freq = NOTE_FREQ[finger_count][1]
+            sink.play(freq)
+            if startup.mark("first_note"):
+                print(startup.report())
+        else:
+            sink.stop()
+
+        if display.wants_frame():
+            frame = overlay.render(camera.normalizer.to_bgr(item["frame"]), item["landmarks"],
+                                   [(f"Fingers: {finger_count}", (10, 30), (0, 255, 0))],
+                                   note=finger_count)
+            display.show(frame)
+        return display.poll()
+
+    run(camera, infer, output, pipeline=args.pipeline, sink=sink, detector=detector,
+        recorder=recorder, display=display, started=True, metrics=metrics)
+
+
+# -------------------------------
+# 손 인식 확인용 뷰어 (test.py, test2.py, mediapipe_test.py)
+# -------------------------------
+def show_hands(args, window="MediaPipe Hands", min_detection_confidence=0.7):
+    camera = camera_from_args(args)
+    metrics = metrics_from_args(args)
+    startup, _, detector = start_up(args, camera, sink=False, metrics=metrics, max_num_hands=1,
+                                    min_detection_confidence=min_detection_confidence)
+    recorder = recorder_from_args(args, camera)
+    display = display_from_args(args, window)
+    overlay = overlay_from_args(args)
+
+    def infer(item):
+        item["result"] = detect_item(detector, item)
+        item["landmarks"], item["is_left"] = landmark_array(item["result"])
+        return item
+
+    def output(item):
+        if startup.mark("first_frame"):
+            print(startup.report())
+        if display.wants_frame():
+            display.show(overlay.render(camera.normalizer.to_bgr(item["frame"]),
+                                        item["landmarks"]))
+        return display.poll()
+
+    run(camera, infer, output, pipeline=args.pipeline, detector=detector, recorder=recorder,
+        display=display, started=True, metrics=metrics)
@@ -0,0 +1,310 @@
+"""카메라 한 대를 여러 프로세스가 같이 쓰는 로컬 프레임 버스
+
+Picamera2 / libcamera-vid 는 한 프로세스만 열 수 있다. 발행자(publisher)가 한 번 캡처해서
+공유 메모리 링에 쓰고, 구독자(피아노, 녹화기, 대시보드 ...)는 같은 메모리를 읽는다.
+
+    python -m handpiano.bus --camera picamera2              # 발행
+    python piano.py --camera bus --source /tmp/handpiano.sock   # 구독
+
+공유 메모리 구성 (slots 개 링)
+    헤더  : int64 [최신 번호, 슬롯별 번호 × slots] + float64 [슬롯별 캡처 시각 × slots]
+    캡처 시각은 frame_time 과 같은 perf_counter 기준 (Linux 에선 CLOCK_MONOTONIC 이라
+    프로세스가 달라도 같은 시계) → 구독자의 지연 지표가 발행자 쪽 캡처부터 잰다.
+    프레임: slots × 프레임 크기
+
+Unix 소켓
+    접속하면 JSON 한 줄(공유 메모리 이름, 모양, 포맷, 슬롯 수)을 받고,
+    이후 프레임마다 8바이트 번호가 온다. 보내기는 non-blocking 이라
+    소켓 버퍼가 찬 느린 구독자는 알림을 놓칠 뿐 카메라를 막지 않는다.
+    구독자는 알림을 몰아서 비우고 가장 최신 번호만 읽는다 (중간 프레임은 건너뜀).
+
+슬롯 번호를 복사 앞뒤로 확인해서(seqlock) 쓰는 중이거나 덮어쓴 프레임은 다시 읽는다.
+"""
+import argparse
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from handpiano.camera import frame_time
+from handpiano.frames import FrameNormalizer
+
+SOCKET_PATH = "/tmp/handpiano.sock"
+_SEQ = struct.Struct("<q")
+_ALIGN = 64
+
+
+def _layout(slots):
+    """헤더 크기 (프레임 시작 오프셋)"""
+    header = 8 * (1 + slots) + 8 * slots
+    return (header + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class _Ring:
+    """공유 메모리 위의 헤더 / 프레임 배열 보기"""
+
+    def __init__(self, shm, slots, shape, dtype):
+        buf = shm.buf
+        self.seqs = np.ndarray((1 + slots,), dtype=np.int64, buffer=buf)
+        self.times = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=8 * (1 + slots))
+        self.frames = np.ndarray((slots,) + tuple(shape), dtype=dtype, buffer=buf,
+                                 offset=_layout(slots))
+
+    def release(self):
+        self.seqs = self.times = self.frames = None
+
+
+class FrameBusPublisher:
+    """camera 를 읽어 공유 메모리 링에 쓰고 구독자에게 번호를 알린다"""
+
+    def __init__(self, camera, path=SOCKET_PATH, slots=4):
+        self.camera = camera
+        self.path = path
+        self.slots = slots
+        self.seq = 0
+        self.notify_dropped = 0   # 버퍼가 차서 못 보낸 알림 수
+        self._shm = None
+        self._ring = None
+        self._meta = None
+        self._clients = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _open(self, frame):
+        self._claim_socket()
+        nbytes = _layout(self.slots) + self.slots * frame.nbytes
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._ring = _Ring(self._shm, self.slots, frame.shape, frame.dtype)
+        self._ring.seqs[:] = 0
+        self._meta = json.dumps({
+            "shm": self._shm.name, "slots": self.slots, "shape": list(frame.shape),
+            "dtype": frame.dtype.str, "format": self.camera.normalizer.fmt,
+        }).encode() + b"\n"
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        threading.Thread(target=self._accept, name="bus-accept", daemon=True).start()
+
+    def _claim_socket(self):
+        """소켓 파일이 남아 있으면 살아 있는 발행자인지 확인하고, 죽은 것만 지운다"""
+        if not os.path.exists(self.path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.path)  # 이전 발행자가 비정상 종료하며 남긴 파일
+        else:
+            raise RuntimeError(f"{self.path}: 다른 발행자가 이미 쓰고 있다")
+        finally:
+            probe.close()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            try:
+                conn.sendall(self._meta)
+            except OSError:  # 메타데이터 전에 끊은 접속 (_claim_socket 의 확인 접속 등)
+                conn.close()
+                continue
+            conn.setblocking(False)
+            with self._lock:
+                self._clients.append(conn)
+
+    def publish(self, frame, t_capture=None):
+        """t_capture 가 없으면 지금 시각 (perf_counter)"""
+        if self._ring is None:
+            self._open(frame)
+        ring = self._ring
+        self.seq += 1
+        slot = self.seq % self.slots
+        ring.seqs[1 + slot] = -1                 # 쓰는 중
+        np.copyto(ring.frames[slot], frame)
+        ring.times[slot] = time.perf_counter() if t_capture is None else t_capture
+        ring.seqs[1 + slot] = self.seq
+        ring.seqs[0] = self.seq
+
+        message = _SEQ.pack(self.seq)
+        with self._lock:
+            clients = list(self._clients)
+        for conn in clients:
+            try:
+                conn.send(message)
+            except BlockingIOError:
+                self.notify_dropped += 1         # 느린 구독자: 이번 알림은 건너뜀
+            except OSError:
+                self._drop(conn)
+
+    def _drop(self, conn):
+        with self._lock:
+            if conn in self._clients:
+                self._clients.remove(conn)
+        conn.close()
+
+    @property
+    def subscribers(self):
+        return len(self._clients)
+
+    def serve(self, frames=None):
+        """카메라가 끝나거나 frames 장을 보낼 때까지 발행"""
+        self.camera.start()
+        try:
+            while frames is None or self.seq < frames:
+                frame = self.camera.read()
+                if frame is None:
+                    break
+                self.publish(frame, frame_time(self.camera, frame))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.camera.stop()
+            self.close()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        with self._lock:
+            for conn in self._clients:
+                conn.close()
+            self._clients = []
+        if self._shm is not None:
+            self._ring.release()
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class FrameBusSubscriber:
+    """발행자의 링에서 가장 최신 프레임을 읽는다"""
+
+    def __init__(self, path=SOCKET_PATH, timeout=5.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.sock.settimeout(timeout)
+        line = b""
+        while not line.endswith(b"\n"):
+            chunk = self.sock.recv(1)
+            if not chunk:
+                raise ConnectionError("버스 발행자가 메타데이터 전에 끊었다")
+            line += chunk
+        self.meta = json.loads(line)
+        self.shm = shared_memory.SharedMemory(name=self.meta["shm"])
+        # 붙기만 한 프로세스가 끝날 때 resource_tracker 가 발행자의 메모리를 지우지 않도록
+        resource_tracker.unregister(self.shm._name, "shared_memory")
+        self.slots = self.meta["slots"]
+        self.shape = tuple(self.meta["shape"])
+        self._ring = _Ring(self.shm, self.slots, self.shape, np.dtype(self.meta["dtype"]))
+        self.last = 0       # 마지막으로 읽은 번호
+        self.skipped = 0    # 건너뛴 프레임 수
+        self.retries = 0    # 읽는 중 덮어써져 다시 읽은 횟수
+
+    def wait(self):
+        """새 번호가 올 때까지 기다렸다가 쌓인 알림을 모두 비운다. 끊기면 None"""
+        self.sock.setblocking(True)
+        if not self.sock.recv(4096):
+            return None
+        # 번호 자체는 헤더에서 읽으므로 알림 내용은 버리기만 한다
+        self.sock.setblocking(False)
+        try:
+            while self.sock.recv(65536):
+                pass
+        except BlockingIOError:
+            pass
+        return int(self._ring.seqs[0])
+
+    def read(self, copy=True):
+        """(번호, 캡처 시각, 프레임). 발행자가 끝나면 None
+
+        copy=False 면 공유 메모리를 그대로 가리키는 배열을 돌려준다.
+        그 배열은 발행자가 링을 한 바퀴 돌기 전(slots - 1 프레임)까지만 유효하다.
+        """
+        while True:
+            latest = self.wait()
+            if latest is None:
+                return None
+            if latest <= self.last:
+                continue
+            slot = latest % self.slots
+            frame = self._ring.frames[slot]
+            if copy:
+                frame = frame.copy()
+            t = float(self._ring.times[slot])
+            if int(self._ring.seqs[1 + slot]) != latest:  # 복사 중 덮어씀 → 더 새 프레임으로
+                self.retries += 1
+                continue
+            self.skipped += max(0, latest - self.last - 1) if self.last else 0
+            self.last = latest
+            return latest, t, frame
+
+    def close(self):
+        self.sock.close()
+        self._ring.release()
+        self.shm.close()
+
+
+class BusCamera:
+    """프레임 버스 구독을 카메라 백엔드처럼 (source = 소켓 경로)"""
+
+    def __init__(self, path=SOCKET_PATH):
+        self.path = path
+        self.subscriber = None
+        self.normalizer = None
+        self._t_capture = None  # 발행자가 적어 둔 마지막 프레임의 캡처 시각
+
+    def start(self):
+        self.subscriber = FrameBusSubscriber(self.path)
+        self.normalizer = FrameNormalizer(self.subscriber.meta["format"])
+
+    def read(self):
+        got = self.subscriber.read()
+        if got is None:
+            return None
+        _, self._t_capture, frame = got
+        return frame
+
+    def capture_time(self, frame):
+        return self._t_capture
+
+    def stop(self):
+        if self.subscriber is not None:
+            print(f"bus: 읽음 #{self.subscriber.last}, 건너뜀 {self.subscriber.skipped}")
+            self.subscriber.close()
+
+
+def main(argv=None):
+    from handpiano.camera import CAMERAS, open_camera
+
+    parser = argparse.ArgumentParser(description="카메라 프레임을 로컬 버스로 발행")
+    parser.add_argument("--camera", choices=[c for c in CAMERAS if c != "bus"],
+                        default="picamera2")
+    parser.add_argument("--source", default="0")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=None, help="이 수만큼 보내고 끝")
+    args = parser.parse_args(argv)
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    camera = open_camera(args.camera, source, args.width, args.height, args.fps)
+    publisher = FrameBusPublisher(camera, args.socket, args.slots)
+    print(f"bus: {args.camera} → {args.socket}")
+    publisher.serve(args.frames)
+    print(f"bus: 보냄 {publisher.seq}, 못 보낸 알림 {publisher.notify_dropped}")
+
+
+if __name__ == "__main__":
+    main()
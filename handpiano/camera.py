@@ -0,0 +1,206 @@
+"""카메라 백엔드
+
+모든 백엔드는 start() / read() / stop() 과 normalizer 속성을 제공한다.
+read() 는 카메라가 주는 그대로의 프레임(numpy 배열)을 돌려주고, 스트림이 끝나면 None.
+MediaPipe 용 RGB / 화면용 BGR 은 camera.normalizer.to_rgb() / to_bgr() 로 얻는다.
+프레임의 캡처 시각은 frame_time(camera, frame) 으로 얻는다 (아래 참고).
+"""
+import subprocess
+import time
+
+import cv2
+import numpy as np
+
+from handpiano.frames import FrameNormalizer
+
+
+class OpenCVCamera:
+    """cv2.VideoCapture (USB 카메라 번호 또는 동영상 파일 경로)"""
+
+    def __init__(self, source=0):
+        self.source = source
+        self.cap = None
+        # OpenCV 는 BGR 로 준다 (= Picamera2 의 RGB888 배치)
+        self.normalizer = FrameNormalizer("RGB888")
+
+    def start(self):
+        self.cap = cv2.VideoCapture(self.source)
+
+    def read(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def stop(self):
+        if self.cap is not None:
+            self.cap.release()
+
+
+class LibcameraVidCamera:
+    """libcamera-vid 의 stdout 을 읽는 백엔드
+
+    codec="mjpeg"  : JPEG 경계를 직접 찾아 최신 프레임만 디코드 (handpiano.mjpeg)
+    codec="yuv420" : 압축 없는 I420 을 그대로 읽음 (JPEG 인코딩 / 디코딩 없음)
+    """
+
+    CODECS = ("mjpeg", "yuv420")
+
+    def __init__(self, width=640, height=480, fps=30, codec="mjpeg"):
+        if codec not in self.CODECS:
+            raise ValueError(f"알 수 없는 libcamera 코덱: {codec}")
+        self.size = (width, height)
+        self.codec = codec
+        self.cmd = [
+            "libcamera-vid",
+            "-t", "0",                 # 무제한 실행
+            "--inline",                # 헤더를 매 프레임마다 포함
+            "--codec", codec,          # MJPEG 또는 YUV420
+            "-o", "-",                 # stdout으로 출력
+            "--width", str(width),
+            "--height", str(height),
+            "--framerate", str(fps)
+        ]
+        self.proc = None
+        self.reader = None
+        # imdecode 는 numpy BGR(= RGB888 배치), yuv420 은 읽을 때 RGB 로 바꿔 둔다
+        self.normalizer = FrameNormalizer("RGB888" if codec == "mjpeg" else "BGR888")
+
+    def start(self):
+        from handpiano.mjpeg import MjpegStreamReader, Yuv420StreamReader
+
+        # bufsize=0: readinto 가 버퍼를 거치지 않고 파이프에서 바로 채운다
+        self.proc = subprocess.Popen(self.cmd, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, bufsize=0)
+        if self.codec == "mjpeg":
+            self.reader = MjpegStreamReader(self.proc.stdout)
+        else:
+            self.reader = Yuv420StreamReader(self.proc.stdout, *self.size)
+        self.reader.start()
+
+    def read(self):
+        # 새 프레임이 올 때까지 잠들어 기다린다. libcamera-vid 가 죽으면 None
+        return self.reader.read()
+
+    def stop(self):
+        if self.proc is not None:
+            self.proc.terminate()   # libcamera 프로세스 종료
+            self.proc.wait()
+            self.proc.stdout.close()
+
+
+class Picamera2Camera:
+    """Picamera2 (RGB888 로 설정해서 변환 횟수를 줄인다)
+
+    캡처 시각은 요청 메타데이터의 SensorTimestamp (센서 노출 시작, CLOCK_MONOTONIC ns) 를
+    perf_counter 기준으로 옮겨 capture_time() 으로 알려준다.
+    """
+
+    def __init__(self, width=640, height=480):
+        self.size = (width, height)
+        self.picam2 = None
+        self.normalizer = None
+        self._offset = 0.0      # perf_counter - CLOCK_MONOTONIC (초)
+        self._t_capture = None  # 마지막으로 읽은 프레임의 캡처 시각
+
+    def start(self):
+        from picamera2 import Picamera2
+
+        self.picam2 = Picamera2()
+        self.normalizer = FrameNormalizer.for_picamera2(self.picam2, self.size)
+        self._offset = time.perf_counter() - time.clock_gettime(time.CLOCK_MONOTONIC)
+        self.picam2.start()
+
+    def read(self):
+        # capture_array() 와 같지만 같은 요청에서 메타데이터도 꺼낸다
+        request = self.picam2.capture_request()
+        try:
+            frame = request.make_array("main")
+            ns = request.get_metadata().get("SensorTimestamp")
+        finally:
+            request.release()
+        self._t_capture = None if ns is None else ns / 1e9 + self._offset
+        return frame
+
+    def capture_time(self, frame):
+        return self._t_capture
+
+    def set_fps(self, fps):
+        """센서 프레임 간격 바꾸기 (거버너용)"""
+        us = int(1_000_000 / fps)
+        self.picam2.set_controls({"FrameDurationLimits": (us, us)})
+
+    def stop(self):
+        if self.picam2 is not None:
+            self.picam2.stop()
+
+
+class SyntheticCamera:
+    """카메라 없이 파이프라인을 돌려보기 위한 가짜 프레임 소스"""
+
+    def __init__(self, width=640, height=480, frames=300, fps=None):
+        self.width = width
+        self.height = height
+        self.frames = frames  # None 이면 무한
+        self.fps = fps        # None 이면 최대 속도
+        self.normalizer = FrameNormalizer("RGB888")
+        self._n = 0
+        self._next = None
+
+    def start(self):
+        self._n = 0
+        self._next = time.perf_counter()
+
+    def read(self):
+        if self.frames is not None and self._n >= self.frames:
+            return None
+        if self.fps:
+            # 실제 카메라처럼 프레임 간격 맞추기
+            delay = self._next - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self._next += 1.0 / self.fps
+        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # 프레임마다 조금씩 움직이는 사각형 (움직임이 있는 장면 흉내)
+        x = (self._n * 8) % max(1, self.width - 80)
+        frame[200:280, x:x + 80] = (0, 200, 255)
+        self._n += 1
+        return frame
+
+    def set_fps(self, fps):
+        self.fps = fps
+
+    def stop(self):
+        pass
+
+
+def frame_time(camera, frame):
+    """read() 가 방금 돌려준 frame 의 캡처 시각 (perf_counter 기준 초)
+
+    카메라가 capture_time(frame) 으로 read() 보다 이른 시각을 알려주면 그 값을 쓰고
+    (추론 풀은 추론이 끝난 뒤에야 프레임을 돌려준다), 아니면 지금 시각.
+    """
+    get = getattr(camera, "capture_time", None)
+    t = get(frame) if get is not None else None
+    return time.perf_counter() if t is None else t
+
+
+CAMERAS = ("picamera2", "opencv", "libcamera", "file", "synthetic", "replay", "bus")
+
+
+def open_camera(kind, source=0, width=640, height=480, fps=30, realtime=True,
+                codec="mjpeg"):
+    """이름으로 카메라 백엔드 만들기 (source: opencv 장치 번호 / file, replay 경로, bus 소켓)"""
+    if kind in ("opencv", "file"):
+        return OpenCVCamera(source)
+    if kind == "picamera2":
+        return Picamera2Camera(width, height)
+    if kind == "libcamera":
+        return LibcameraVidCamera(width, height, fps, codec)
+    if kind == "synthetic":
+        return SyntheticCamera(width, height, frames=None, fps=fps)
+    if kind == "replay":
+        from handpiano.record import ReplayCamera
+        return ReplayCamera(source, realtime=realtime)
+    if kind == "bus":
+        from handpiano.bus import SOCKET_PATH, BusCamera
+        return BusCamera(source if isinstance(source, str) else SOCKET_PATH)
+    raise ValueError(f"알 수 없는 카메라: {kind}")
@@ -0,0 +1,200 @@
+"""학습한 손 모양 분류기 (작은 MLP, NumPy 추론)
+
+규칙 기반 FingerCounter 는 tip / PIP 의 y 비교라 손이 기울면 틀리고, 0~5 밖에 못 센다.
+여기서는 랜드마크를
+    손목 기준 → 손목~중지 MCP 길이로 크기 정규화 → 그 방향이 위를 보게 회전 → 왼손은 좌우 반전
+한 60 차원 벡터로 바꾸고, 녹화 세션에서 학습한 MLP (60 → hidden → 클래스) 로 분류한다.
+손동작과 음 번호(0~8)의 대응은 녹화할 때 정한 라벨을 따른다 (6~8 도 한 손으로 낼 수 있다).
+
+FingerCounter 와 같은 count_array(landmarks, is_left) 를 가지므로 그대로 바꿔 끼운다.
+    python piano.py --classifier models/gesture.npz
+
+학습 (라벨: DIR=숫자, DIR/labels.npy 의 프레임별 라벨(-1 은 제외), 또는 --label 로 녹화한 meta)
+    python piano.py --record rec/three --record-frames none --label 3
+    python -m handpiano.classifier rec/zero rec/one ... rec/eight -o models/gesture.npz
+정확도 / 처리량 비교는 benchmarks/bench_classifier.py
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+WRIST = 0
+MIDDLE_MCP = 9
+FEATURES = 20 * 3
+
+
+def features(landmarks, is_left=None):
+    """(..., 21, 3) → (..., 60) float32. 손이 없는 자리(NaN)는 NaN 그대로"""
+    lm = np.asarray(landmarks, dtype=np.float32)
+    rel = lm[..., 1:, :] - lm[..., WRIST:WRIST + 1, :]
+    ref = rel[..., MIDDLE_MCP - 1, :2]
+    scale = np.maximum(np.hypot(ref[..., 0], ref[..., 1]), 1e-6)[..., None]
+    ux, uy = ref[..., :1] / scale, ref[..., 1:2] / scale
+
+    # (ux, uy) 가 (0, -1) (화면 위쪽) 로 가는 회전
+    x, y, z = rel[..., 0], rel[..., 1], rel[..., 2]
+    out = np.empty(rel.shape, dtype=np.float32)
+    out[..., 0] = (-uy * x + ux * y) / scale
+    out[..., 1] = (-ux * x - uy * y) / scale
+    out[..., 2] = z / scale
+    if is_left is not None:
+        # 왼손은 거울상으로 오른손과 같은 모양이 되게
+        out[..., 0] *= np.where(np.asarray(is_left), -1, 1)[..., None]
+    return out.reshape(lm.shape[:-2] + (FEATURES,))
+
+
+class LandmarkClassifier:
+    """MLP 한 층 (ReLU). 입력 표준화는 첫 층 가중치에 접어 넣어 두었다"""
+
+    def __init__(self, w1, b1, w2, b2, classes):
+        self.w1 = np.asarray(w1, dtype=np.float32)
+        self.b1 = np.asarray(b1, dtype=np.float32)
+        self.w2 = np.asarray(w2, dtype=np.float32)
+        self.b2 = np.asarray(b2, dtype=np.float32)
+        self.classes = np.asarray(classes, dtype=np.int64)
+
+    def predict_features(self, x):
+        """(N, 60) → (N,) 클래스"""
+        hidden = np.maximum(x @ self.w1 + self.b1, 0)
+        return self.classes[np.argmax(hidden @ self.w2 + self.b2, axis=1)]
+
+    def count_array(self, landmarks, is_left=None):
+        x = features(landmarks, is_left)
+        flat = x.reshape(-1, FEATURES)
+        valid = ~np.isnan(flat).any(axis=1)
+        out = np.zeros(len(flat), dtype=np.int64)
+        if valid.all():
+            out[:] = self.predict_features(flat)
+        elif valid.any():
+            out[valid] = self.predict_features(flat[valid])
+        return out.reshape(x.shape[:-1])
+
+    def save(self, path):
+        """float16 으로 저장 (수 KB)"""
+        np.savez_compressed(path, w1=self.w1.astype(np.float16), b1=self.b1.astype(np.float16),
+                            w2=self.w2.astype(np.float16), b2=self.b2.astype(np.float16),
+                            classes=self.classes.astype(np.int8))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["w1"], data["b1"], data["w2"], data["b2"], data["classes"])
+
+
+def train(x, labels, hidden=32, epochs=200, batch=256, lr=0.01, weight_decay=1e-4, seed=0):
+    """(N, 60) 특징 + (N,) 라벨로 미니배치 Adam 학습 → LandmarkClassifier"""
+    rng = np.random.default_rng(seed)
+    classes, y = np.unique(labels, return_inverse=True)
+    mean, std = x.mean(axis=0), x.std(axis=0) + 1e-6
+    xn = ((x - mean) / std).astype(np.float32)
+    n, k = len(xn), len(classes)
+
+    params = [rng.normal(0, np.sqrt(2 / FEATURES), (FEATURES, hidden)).astype(np.float32),
+              np.zeros(hidden, np.float32),
+              rng.normal(0, np.sqrt(1 / hidden), (hidden, k)).astype(np.float32),
+              np.zeros(k, np.float32)]
+    m = [np.zeros_like(p) for p in params]
+    v = [np.zeros_like(p) for p in params]
+    step = 0
+    for _ in range(epochs):
+        order = rng.permutation(n)
+        for start in range(0, n, batch):
+            idx = order[start:start + batch]
+            xb, yb = xn[idx], y[idx]
+            w1, b1, w2, b2 = params
+            h = np.maximum(xb @ w1 + b1, 0)
+            logits = h @ w2 + b2
+            logits -= logits.max(axis=1, keepdims=True)
+            p = np.exp(logits)
+            p /= p.sum(axis=1, keepdims=True)
+            p[np.arange(len(yb)), yb] -= 1
+            p /= len(yb)
+            dh = (p @ w2.T) * (h > 0)
+            grads = [xb.T @ dh + weight_decay * w1, dh.sum(axis=0),
+                     h.T @ p + weight_decay * w2, p.sum(axis=0)]
+            step += 1
+            for i, g in enumerate(grads):
+                m[i] = 0.9 * m[i] + 0.1 * g
+                v[i] = 0.999 * v[i] + 0.001 * g * g
+                m_hat = m[i] / (1 - 0.9 ** step)
+                v_hat = v[i] / (1 - 0.999 ** step)
+                params[i] -= lr * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+    w1, b1, w2, b2 = params
+    # (x - mean) / std @ w1 + b1 = x @ (w1 / std) + (b1 - (mean / std) @ w1)
+    return LandmarkClassifier(w1 / std[:, None], b1 - (mean / std) @ w1, w2, b2, classes)
+
+
+def load_labeled(spec):
+    """"DIR=라벨" 또는 "DIR" → (landmarks (N, 21, 3), is_left (N,), labels (N,)) 손 단위"""
+    from handpiano.record import load_session
+
+    path, _, label = spec.partition("=")
+    session = load_session(path)
+    frames, hands = session["landmarks"].shape[:2]
+    if label:
+        labels = np.full(frames, int(label))
+    elif os.path.exists(os.path.join(path, "labels.npy")):
+        labels = np.load(os.path.join(path, "labels.npy"))
+    elif session.get("label") is not None:
+        labels = np.full(frames, int(session["label"]))
+    else:
+        raise ValueError(f"{path}: 라벨이 없다 (DIR=숫자, labels.npy, --label 녹화 중 하나)")
+
+    landmarks = session["landmarks"].reshape(-1, 21, 3)
+    is_left = session["is_left"].reshape(-1)
+    labels = np.repeat(labels, hands)
+    keep = ~np.isnan(landmarks).any(axis=(1, 2)) & (labels >= 0)
+    return landmarks[keep], is_left[keep], labels[keep]
+
+
+def load_dataset(specs, test_fraction=0.2):
+    """세션마다 뒤쪽 test_fraction 을 시험용으로 (이웃 프레임끼리 섞이지 않게)
+
+    → (train, test), 각각 (landmarks, is_left, labels)
+    """
+    parts = {"train": [], "test": []}
+    for spec in specs:
+        arrays = load_labeled(spec)
+        cut = int(len(arrays[0]) * (1 - test_fraction))
+        parts["train"].append([a[:cut] for a in arrays])
+        parts["test"].append([a[cut:] for a in arrays])
+    return tuple(tuple(np.concatenate(column) for column in zip(*parts[name]))
+                 for name in ("train", "test"))
+
+
+def accuracy(classifier, landmarks, is_left, labels):
+    return float((classifier.count_array(landmarks, is_left) == labels).mean())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="녹화 세션으로 손 모양 분류기 학습")
+    parser.add_argument("sessions", nargs="+", help="DIR=라벨 또는 DIR")
+    parser.add_argument("-o", "--output", default="models/gesture.npz")
+    parser.add_argument("--hidden", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=200)
+    parser.add_argument("--test-fraction", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    (lm, left, y), (lm_test, left_test, y_test) = load_dataset(args.sessions,
+                                                               args.test_fraction)
+    t0 = time.perf_counter()
+    model = train(features(lm, left), y, hidden=args.hidden, epochs=args.epochs, seed=args.seed)
+    print(f"학습: {len(y)} 손, 클래스 {model.classes.tolist()}, "
+          f"{time.perf_counter() - t0:.1f}s")
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    model.save(args.output)
+    model = LandmarkClassifier.load(args.output)  # 저장된 float16 으로 평가
+    print(f"저장: {args.output} ({os.path.getsize(args.output)} bytes)")
+    print(f"정확도: train {accuracy(model, lm, left, y):.3f}", end="")
+    if len(y_test):
+        print(f", test {accuracy(model, lm_test, left_test, y_test):.3f} ({len(y_test)} 손)")
+    else:
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""화면 출력: 창(imshow) / 헤드리스 / 로컬 HTTP MJPEG 미리보기
+
+설치 현장은 모니터 없이 돌아가므로 헤드리스에서는 그리기, putText, imshow, waitKey 를
+전부 건너뛴다. 출력 단계는 다음 순서로 쓴다.
+
+    if display.wants_frame():
+        frame = ... 그리기 ...
+        display.show(frame)
+    return display.poll()
+
+PreviewServer 는 127.0.0.1 에서만 multipart/x-mixed-replace (MJPEG) 를 내보낸다.
+접속한 클라이언트가 있을 때만, 정한 fps / 가로 크기로만 그림을 만든다.
+    http://127.0.0.1:8080/   (ssh -L 8080:127.0.0.1:8080 pi 로 원격 확인)
+"""
+import threading
+import time
+
+import cv2
+
+BOUNDARY = "frame"
+
+
+class WindowDisplay:
+    """imshow 창, q 를 누르면 종료. fps 를 주면 그 속도로만 그림을 받는다 (검출은 매 프레임)"""
+
+    def __init__(self, window, fps=None):
+        self.window = window
+        self.interval = 1.0 / fps if fps else 0.0
+        self._next = 0.0
+
+    def wants_frame(self):
+        return time.perf_counter() >= self._next
+
+    def show(self, frame):
+        self._next = time.perf_counter() + self.interval
+        cv2.imshow(self.window, frame)
+
+    def poll(self):
+        return not cv2.waitKey(1) & 0xFF == ord("q")
+
+    def close(self):
+        cv2.destroyAllWindows()
+
+
+class HeadlessDisplay:
+    """창 없음. preview 가 있으면 보는 사람이 있을 때만 그림을 넘긴다"""
+
+    def __init__(self, preview=None):
+        self.preview = preview
+
+    def wants_frame(self):
+        return self.preview is not None and self.preview.wants_frame()
+
+    def show(self, frame):
+        if self.preview is not None:
+            self.preview.submit(frame)
+
+    def poll(self):
+        return True
+
+    def close(self):
+        if self.preview is not None:
+            self.preview.close()
+
+
+class PreviewServer:
+    """루프백 전용 MJPEG 미리보기
+
+    fps   : 미리보기 최대 프레임 속도 (본 루프와 별개)
+    width : 미리보기 가로 크기 (세로는 비율 유지)
+    """
+
+    def __init__(self, port=8080, fps=5, width=320, quality=70, host="127.0.0.1"):
+        self.interval = 1.0 / fps
+        self.width = width
+        self.quality = quality
+        self.clients = 0
+        self.sent = 0
+        self._cond = threading.Condition()
+        self._jpeg = None
+        self._seq = 0
+        self._next = 0.0
+        self._closed = False
+
+        # 미리보기를 켤 때만 import (시작 시간)
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._serve(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.address = self.httpd.server_address
+        self._thread = threading.Thread(target=self.httpd.serve_forever,
+                                        name="preview-http", daemon=True)
+        self._thread.start()
+
+    def wants_frame(self):
+        """클라이언트가 있고 다음 미리보기 시각이 됐을 때만 True (락 없이 읽기만)"""
+        return self.clients > 0 and time.perf_counter() >= self._next
+
+    def submit(self, frame):
+        self._next = time.perf_counter() + self.interval
+        h, w = frame.shape[:2]
+        if w > self.width:
+            frame = cv2.resize(frame, (self.width, h * self.width // w),
+                               interpolation=cv2.INTER_AREA)
+        ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+        if not ok:
+            return
+        with self._cond:
+            self._jpeg = jpeg.tobytes()
+            self._seq += 1
+            self._cond.notify_all()
+
+    def _serve(self, handler):
+        if handler.path not in ("/", "/stream.mjpg"):
+            handler.send_error(404)
+            return
+        handler.send_response(200)
+        handler.send_header("Content-Type",
+                            f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.end_headers()
+
+        with self._cond:
+            self.clients += 1
+        seen = self._seq
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._seq != seen or self._closed, timeout=1.0)
+                    if self._closed:
+                        break
+                    if self._seq == seen:
+                        continue
+                    jpeg, seen = self._jpeg, self._seq
+                handler.wfile.write(
+                    f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode())
+                handler.wfile.write(jpeg)
+                handler.wfile.write(b"\r\n")
+                self.sent += 1
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self._cond:
+                self.clients -= 1
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def open_display(window, headless=False, preview_port=None, preview_fps=5, preview_width=320,
+                 display_fps=None):
+    if not headless:
+        return WindowDisplay(window, display_fps)
+    preview = None
+    if preview_port:
+        preview = PreviewServer(preview_port, fps=preview_fps, width=preview_width)
+        print(f"preview: http://{preview.address[0]}:{preview.address[1]}/")
+    return HeadlessDisplay(preview)
@@ -0,0 +1,111 @@
+"""협동 모드 (together.py): 오른손 → 멜로디, 왼손 → 코드(화음)"""
+import numpy as np
+
+from handpiano.app import (camera_from_args, classifier_from_args, detect_item,
+                           display_from_args, metrics_from_args, overlay_from_args,
+                           recorder_from_args, run, start_up)
+from handpiano.gesture import FingerCounter
+from handpiano.hands import landmark_array
+from handpiano.notes import NOTE_FREQ
+from handpiano.smoothing import OneEuroFilter, make_filter
+from handpiano.tracking import HandTracker
+
+
+def play_duet(args, window="Hand Piano - 협동 모드", classifier=None):
+    camera = camera_from_args(args)
+    metrics = metrics_from_args(args)
+    startup, sink, detector = start_up(args, camera, metrics=metrics, max_num_hands=2,
+                                       min_detection_confidence=0.7)
+    classifier = classifier_from_args(args, classifier or FingerCounter())
+    recorder = recorder_from_args(args, camera)
+    display = display_from_args(args, window)
+    overlay = overlay_from_args(args)
+    # 라벨이 튀어도 역할이 바뀌지 않도록 손마다 ID 를 붙이고, 필터도 ID 별로 둔다
+    tracker = HandTracker()
+
+    def track_state(track):
+        state = track.state
+        if not state:
+            state["euro"] = OneEuroFilter() if args.one_euro else None
+            state["smoother"] = make_filter(args.smooth)
+            state["count"] = 0
+        return state
+
+    def infer(item):
+        t = item["t_capture"]
+        result = detect_item(detector, item)
+
+        landmarks, is_left = landmark_array(result)
+        tracks = tracker.update(landmarks, is_left, t)
+        for i, track in enumerate(tracks):
+            state = track_state(track)
+            if state["euro"] is not None:
+                landmarks[i] = state["euro"].update(landmarks[i], t)
+        # 매 프레임 전부 센다 (배열 한 번에 수 us). 느린 움직임이나 One-Euro 가 천천히
+        # 수렴하는 경우도 놓치지 않도록 이전 개수를 재사용하지 않는다
+        if tracks:
+            counts = classifier.count_array(
+                landmarks, np.array([track.is_left for track in tracks]))
+            for track, finger_count in zip(tracks, counts.tolist()):
+                track.state["count"] = finger_count
+
+        # 잠깐 안 보이는 ID 도 역할을 유지하고, 필터에는 0 을 넣어 흔들림만 걸러낸다
+        for track in tracker.tracks:
+            state = track_state(track)
+            finger_count = state["count"] if track.missing == 0 else 0
+            state["smoothed"] = state["smoother"].update(finger_count, t)
+
+        # 역할: 투표로 정한 왼손 / 오른손 중 가장 먼저 나타난 ID
+        roles = {}
+        for track in sorted(tracker.tracks, key=lambda track: track.first_seen):
+            roles.setdefault(track.is_left, track)
+        left_fingers = roles[True].state["smoothed"] if True in roles else 0
+        right_fingers = roles[False].state["smoothed"] if False in roles else 0
+
+        item["result"] = result
+        item["landmarks"], item["is_left"] = landmarks, is_left
+        item["tracks"] = tracks
+        item["left"], item["right"] = left_fingers, right_fingers
+        return item
+
+    def output(item):
+        startup.mark("first_frame")
+        left_fingers, right_fingers = item["left"], item["right"]
+        show = display.wants_frame()
+
+        # -------------------------------
+        # 협동 모드 로직
+        # 오른손 → 멜로디, 왼손 → 코드(화음)
+        # -------------------------------
+        labels = []
+        if sink.voices > 1:
+            # 다성 sink: 두 손을 각자 목소리로 동시에 (왼손은 한 옥타브 아래)
+            for voice, fingers, name, org, color, shift in (
+                    (0, right_fingers, "Right", (10, 60), (255, 0, 0), 1),
+                    (1, left_fingers, "Left", (10, 100), (0, 255, 0), 0.5)):
+                if fingers in NOTE_FREQ:
+                    sink.play(NOTE_FREQ[fingers][1] * shift, voice=voice)
+                    labels.append((f"{name}: {NOTE_FREQ[fingers][0]}", org, color))
+                else:
+                    sink.stop(voice)
+        elif right_fingers in NOTE_FREQ:
+            sink.play(NOTE_FREQ[right_fingers][1])
+            labels.append((f"Right: {NOTE_FREQ[right_fingers][0]}", (10, 60), (255, 0, 0)))
+        elif left_fingers in NOTE_FREQ:
+            sink.play(NOTE_FREQ[left_fingers][1] + 20)  # 살짝 변형
+            labels.append((f"Left: {NOTE_FREQ[left_fingers][0]} (Chord)", (10, 100),
+                           (0, 255, 0)))
+        else:
+            sink.stop()
+        if labels and startup.mark("first_note"):
+            print(startup.report())
+
+        if show:
+            # 화면에 손가락 개수 + 연주 중인 음
+            texts = [(f"L:{left_fingers}  R:{right_fingers}", (10, 30), (0, 255, 255))] + labels
+            display.show(overlay.render(camera.normalizer.to_bgr(item["frame"]),
+                                        item["landmarks"], texts))
+        return display.poll()
+
+    run(camera, infer, output, pipeline=args.pipeline, sink=sink, detector=detector,
+        recorder=recorder, display=display, started=True, metrics=metrics)
@@ -0,0 +1,67 @@
+"""RPi.GPIO 흉내 모듈 (라즈베리파이 없이 부저 동작 확인용)
+
+RPi.GPIO 와 같은 이름의 함수 / 상수를 제공하고, 하드웨어에 닿는 호출을
+calls 목록에 (시각, 핀, 이름, 인자) 로 기록한다.
+"""
+import time
+
+BCM = "BCM"
+BOARD = "BOARD"
+OUT = "OUT"
+IN = "IN"
+
+
+class FakeGPIO:
+    """import RPi.GPIO as GPIO 대신 넘겨 줄 수 있는 객체"""
+
+    BCM = BCM
+    BOARD = BOARD
+    OUT = OUT
+    IN = IN
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.calls = []
+
+    def _record(self, pin, name, *args):
+        self.calls.append((self.clock(), pin, name, args))
+
+    def setmode(self, mode):
+        self._record(None, "setmode", mode)
+
+    def setup(self, pin, mode):
+        self._record(pin, "setup", mode)
+
+    def PWM(self, pin, freq):
+        self._record(pin, "PWM", freq)
+        return FakePWM(self, pin)
+
+    def cleanup(self):
+        self._record(None, "cleanup")
+
+    def count(self, *names):
+        """PWM 관련 호출 수. 이름을 주면 그 호출만 센다"""
+        pwm_calls = [c for c in self.calls if c[2] in FakePWM.METHODS]
+        if names:
+            pwm_calls = [c for c in pwm_calls if c[2] in names]
+        return len(pwm_calls)
+
+
+class FakePWM:
+    METHODS = ("start", "stop", "ChangeFrequency", "ChangeDutyCycle")
+
+    def __init__(self, gpio, pin):
+        self.gpio = gpio
+        self.pin = pin
+
+    def start(self, duty):
+        self.gpio._record(self.pin, "start", duty)
+
+    def stop(self):
+        self.gpio._record(self.pin, "stop")
+
+    def ChangeFrequency(self, freq):
+        self.gpio._record(self.pin, "ChangeFrequency", freq)
+
+    def ChangeDutyCycle(self, duty):
+        self.gpio._record(self.pin, "ChangeDutyCycle", duty)
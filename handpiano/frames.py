@@ -0,0 +1,79 @@
+"""프레임 채널 정규화
+
+기존 스크립트는 매 프레임 RGBA → BGR → RGB 로 cvtColor 를 두 번 돌렸다.
+여기서는 카메라 포맷을 시작할 때 한 번만 보고 변환 방법을 정해 둔 뒤,
+MediaPipe 용 RGB 는 원본 프레임에서 곧바로 (최대 1번 변환) 만든다.
+RGB 출력 버퍼는 미리 잡아 두고 매 프레임 재사용한다.
+
+Picamera2 포맷 이름과 실제 numpy 채널 순서는 반대다.
+    RGB888   → [B, G, R]        XRGB8888 → [B, G, R, X]
+    BGR888   → [R, G, B]        XBGR8888 → [R, G, B, X]  (preview 기본값)
+"""
+import cv2
+import numpy as np
+
+# 포맷 → (RGB 변환 코드, BGR 변환 코드). None 이면 변환 없이 그대로 사용
+_CONVERSIONS = {
+    "RGB888": (cv2.COLOR_BGR2RGB, None),
+    "BGR888": (None, cv2.COLOR_RGB2BGR),
+    "XRGB8888": (cv2.COLOR_BGRA2RGB, cv2.COLOR_BGRA2BGR),
+    "XBGR8888": (cv2.COLOR_RGBA2RGB, cv2.COLOR_RGBA2BGR),
+    "GRAY": (cv2.COLOR_GRAY2RGB, cv2.COLOR_GRAY2BGR),
+}
+
+# 포맷을 모를 때는 기존 "채널 보정" 블록과 같은 규칙으로 추정
+_GUESS_BY_CHANNELS = {1: "GRAY", 3: "RGB888", 4: "XBGR8888"}
+
+
+def guess_format(frame):
+    channels = 1 if frame.ndim == 2 else frame.shape[-1]
+    return _GUESS_BY_CHANNELS[channels]
+
+
+class FrameNormalizer:
+    """카메라 프레임 → MediaPipe RGB / 화면용 BGR
+
+    fmt 을 주지 않으면 첫 프레임 모양을 보고 한 번만 정한다.
+    """
+
+    def __init__(self, fmt=None):
+        self.fmt = None
+        self._rgb_code = self._bgr_code = None
+        self._rgb = None
+        if fmt is not None:
+            self._set_format(fmt)
+
+    @classmethod
+    def for_picamera2(cls, picam2, size=(640, 480)):
+        """RGB888(= numpy BGR) 로 설정 → 화면은 변환 없이, MediaPipe 는 1번 변환"""
+        config = picam2.create_preview_configuration(main={"size": size, "format": "RGB888"})
+        picam2.configure(config)
+        return cls(picam2.camera_config["main"]["format"])
+
+    def _set_format(self, fmt):
+        if fmt not in _CONVERSIONS:
+            raise ValueError(f"지원하지 않는 프레임 포맷: {fmt}")
+        self.fmt = fmt
+        self._rgb_code, self._bgr_code = _CONVERSIONS[fmt]
+
+    def to_rgb(self, frame):
+        """MediaPipe 에 넘길 RGB. 내부 버퍼를 재사용하므로 다음 호출 전까지만 유효"""
+        if self.fmt is None:
+            self._set_format(guess_format(frame))
+        if self._rgb_code is None:
+            return frame
+        h, w = frame.shape[:2]
+        if self._rgb is None or self._rgb.shape[:2] != (h, w):
+            self._rgb = np.empty((h, w, 3), dtype=np.uint8)
+        return cv2.cvtColor(frame, self._rgb_code, dst=self._rgb)
+
+    def to_bgr(self, frame):
+        """그리기 / imshow 용 BGR. 이미 BGR 이면 복사 없이 그대로 돌려준다
+
+        결과 프레임은 큐를 타고 다른 단계로 넘어갈 수 있으므로 버퍼를 재사용하지 않는다.
+        """
+        if self.fmt is None:
+            self._set_format(guess_format(frame))
+        if self._bgr_code is None:
+            return frame
+        return cv2.cvtColor(frame, self._bgr_code)
@@ -0,0 +1,86 @@
+"""손 모양 → 손가락 개수 분류기
+
+분류기는 count_array(landmarks, is_left) 하나만 있으면 되므로,
+규칙 기반 FingerCounter 대신 다른 분류기를 끼워 넣을 수 있다.
+
+    landmarks : (..., 21, 3) float32 배열 (x, y, z). 앞쪽 차원은 자유
+                → (손, 21, 3) 한 프레임, (프레임, 손, 21, 3) 녹화 전체 모두 가능
+    is_left   : (...) bool 배열. 왼손이면 True
+    결과      : (...) int 배열. 비어 있는 손(NaN)은 0 개
+"""
+import numpy as np
+
+TIPS = [8, 12, 16, 20]        # 검지, 중지, 약지, 새끼
+PIP_JOINTS = [6, 10, 14, 18]  # 각 손가락의 PIP 관절 (tip - 2)
+THUMB_TIP = 4
+
+# 위 인덱스는 4 칸 간격이라 팬시 인덱싱 대신 슬라이스(뷰)로 꺼낸다
+_TIP_SLICE = slice(8, 21, 4)
+_PIP_SLICE = slice(6, 19, 4)
+
+
+def finger_states(landmarks, is_left=None, thumb_ref=3):
+    """손가락별 펴짐 여부 (..., 5) bool. 순서: 엄지, 검지, 중지, 약지, 새끼
+
+    is_left 가 None 이면 예전 piano.py 처럼 모든 손을 오른손 기준으로 본다.
+    """
+    lm = np.asarray(landmarks, dtype=np.float32)
+    x, y = lm[..., 0], lm[..., 1]
+    states = np.empty(lm.shape[:-2] + (5,), dtype=bool)
+
+    # 검지~새끼: tip 이 PIP 보다 위(y 가 작음)면 펴짐
+    np.less(y[..., _TIP_SLICE], y[..., _PIP_SLICE], out=states[..., 1:])
+
+    # 엄지는 x 방향으로 판단 (거울 영상 기준 오른손은 왼쪽으로 펴짐)
+    dx = x[..., THUMB_TIP] - x[..., thumb_ref]
+    if is_left is None:
+        np.less(dx, 0, out=states[..., 0])
+    else:
+        states[..., 0] = np.where(is_left, dx > 0, dx < 0)
+    return states
+
+
+def count_fingers_array(landmarks, is_left=None, thumb_ref=3):
+    """펴진 손가락 개수 (...) int. 녹화 수천 프레임도 한 번에 계산할 수 있다"""
+    return finger_states(landmarks, is_left, thumb_ref).sum(axis=-1)
+
+
+class FingerCounter:
+    """tip / pip 비교로 펴진 손가락 개수 세기
+
+    thumb_ref : 엄지 끝(4)과 비교할 관절. 3(IP) 또는 2(MCP, pipi_2.py 방식)
+    handed    : True 면 왼손일 때 엄지 방향을 반대로 본다.
+                False 면 예전 piano.py 처럼 항상 오른손 기준.
+    """
+
+    def __init__(self, thumb_ref=3, handed=False):
+        self.thumb_ref = thumb_ref
+        self.handed = handed
+
+    def count_array(self, landmarks, is_left=None):
+        return count_fingers_array(landmarks, is_left if self.handed else None,
+                                   self.thumb_ref)
+
+    def count(self, hand_landmarks, handedness="Right"):
+        """MediaPipe 랜드마크 객체 하나를 속성 단위로 읽어 세는 예전 방식"""
+        lm = hand_landmarks.landmark
+        count = 0
+        for tip, pip in zip(TIPS, PIP_JOINTS):
+            if lm[tip].y < lm[pip].y:
+                count += 1
+
+        if self.handed and handedness == "Left":
+            if lm[THUMB_TIP].x > lm[self.thumb_ref].x:
+                count += 1
+        else:
+            if lm[THUMB_TIP].x < lm[self.thumb_ref].x:
+                count += 1
+        return count
+
+
+_default_counter = FingerCounter()
+
+
+def count_fingers(hand_landmarks, handedness="Right"):
+    """기존 스크립트의 count_fingers 와 같은 동작 (엄지 3번 관절, 손 구분 없음)"""
+    return _default_counter.count(hand_landmarks, handedness)
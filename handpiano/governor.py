@@ -0,0 +1,376 @@
+"""온도 / 부하를 보고 캡처 fps, 추론 해상도, 추론 간격을 조절하는 거버너
+
+함에 넣은 Pi 에서 몇 시간씩 640x480 전 프레임 추론을 돌리면 SoC 가 스로틀링에 걸리고
+그때부터 프레임 속도가 들쭉날쭉 떨어진다. 스로틀링을 기다리지 않고 미리 단계를 내린다.
+
+    단계(LEVELS)  0 = 최대 품질 ... 뒤로 갈수록 가볍다 (fps↓, 추론 축소↑, k 프레임마다 추론)
+    내림          온도 >= hot, 스로틀 비트가 서 있음, 또는 추론 시간 EWMA > 목표 지연
+    올림          온도 < cool, 스로틀 없음, 추론 시간 < 목표 × headroom 이 hold 초 동안 이어질 때
+
+온도와 스로틀 비트는 sensors 객체(temperature(), throttled())에서 읽는다.
+기본은 PiSensors (sysfs / vcgencmd 를 백그라운드 스레드에서), 시뮬레이션은 SimulatedSensors / TemperatureCurve.
+
+    python -m handpiano.governor --minutes 60 --ambient 40    # 가상 온도 곡선으로 제어 확인
+"""
+import argparse
+import threading
+import time
+
+import cv2
+
+from handpiano.camera import frame_time
+from handpiano.metrics import cpu_temperature, throttled
+
+# get_throttled 비트 중 "지금" 상태 (과거 발생 비트 0x10000 대는 보지 않는다)
+THROTTLE_NOW = 0x2 | 0x4 | 0x8   # ARM 클럭 제한 / 스로틀링 / 소프트 온도 한계
+
+
+class Level:
+    __slots__ = ("fps", "scale", "skip")
+
+    def __init__(self, fps, scale, skip):
+        self.fps = fps        # 캡처 fps
+        self.scale = scale    # 추론 입력 축소 비율 (1.0 = 원본)
+        self.skip = skip      # skip 프레임마다 한 번 추론, 나머지는 직전 결과
+
+    def __repr__(self):
+        return f"Level(fps={self.fps}, scale={self.scale}, skip={self.skip})"
+
+
+LEVELS = (
+    Level(30, 1.0, 1),
+    Level(30, 0.75, 1),
+    Level(24, 0.75, 1),
+    Level(24, 0.5, 2),
+    Level(15, 0.5, 2),
+    Level(10, 0.5, 3),
+)
+
+
+class PiSensors:
+    """실제 Raspberry Pi 센서 (metrics 와 같은 함수)
+
+    get_throttled 는 vcgencmd subprocess 일 수 있어 추론 스레드에서 부르지 않는다.
+    처음 읽을 때 뜨는 백그라운드 스레드가 period 초마다 읽어 두고, 여기서는 마지막 값만 돌려준다
+    (첫 값이 오기 전에는 None = 모름).
+    """
+
+    def __init__(self, period=2.0):
+        self.period = period
+        self._temp = None
+        self._throttle = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _poll(self):
+        while True:
+            self._temp = cpu_temperature()
+            self._throttle = throttled()
+            if self._stop.wait(self.period):
+                break
+
+    def _ensure_polling(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._poll, name="governor-sensors",
+                                            daemon=True)
+            self._thread.start()
+
+    def temperature(self):
+        self._ensure_polling()
+        return self._temp
+
+    def throttled(self):
+        self._ensure_polling()
+        return self._throttle
+
+    def close(self):
+        self._stop.set()
+
+
+class TemperatureCurve:
+    """[(초, 섭씨), ...] 를 선형 보간하는 가짜 센서. throttle_at 이상이면 스로틀 비트"""
+
+    def __init__(self, points, throttle_at=80.0):
+        self.points = sorted(points)
+        self.throttle_at = throttle_at
+        self.now = 0.0
+
+    def temperature(self):
+        points, t = self.points, self.now
+        if t <= points[0][0]:
+            return points[0][1]
+        for (t0, c0), (t1, c1) in zip(points, points[1:]):
+            if t <= t1:
+                return c0 + (c1 - c0) * (t - t0) / (t1 - t0)
+        return points[-1][1]
+
+    def throttled(self):
+        return 0x4 if self.temperature() >= self.throttle_at else 0
+
+
+class SimulatedSensors:
+    """1차 열 모델: 온도가 ambient + gain × CPU 부하 쪽으로 시정수 tau 초로 다가간다
+
+    advance(dt, load) 로 시간을 흘린다 (load = 추론이 차지하는 CPU 비율, 1 에서 자른다).
+    """
+
+    def __init__(self, ambient=40.0, gain=45.0, tau=120.0, throttle_at=80.0, start=None):
+        self.ambient = ambient
+        self.gain = gain
+        self.tau = tau
+        self.throttle_at = throttle_at
+        self.temp = ambient if start is None else start
+
+    def advance(self, dt, load):
+        target = self.ambient + self.gain * min(load, 1.0)
+        self.temp += (target - self.temp) * min(1.0, dt / self.tau)
+
+    def temperature(self):
+        return self.temp
+
+    def throttled(self):
+        return 0x4 if self.temp >= self.throttle_at else 0
+
+
+class Governor:
+    """단계 하나를 골라 두고 주기마다 한 칸씩 올리거나 내린다
+
+    target_latency : 추론 시간 EWMA 목표 (초)
+    period         : 판단 주기 (초). 센서도 이때만 읽는다
+    hold           : 올리기 전에 여유가 이어져야 하는 시간 (초)
+    """
+
+    def __init__(self, sensors=None, levels=LEVELS, target_latency=0.08, hot=75.0, cool=65.0,
+                 period=2.0, hold=10.0, headroom=0.6, alpha=0.2, start=0):
+        self.sensors = sensors or PiSensors(period)
+        self.levels = levels
+        self.target_latency = target_latency
+        self.hot = hot
+        self.cool = cool
+        self.period = period
+        self.hold = hold
+        self.headroom = headroom
+        self.alpha = alpha
+        self.index = start
+        self.inference = None     # 추론 시간 EWMA (초)
+        self.temp = None
+        self.throttle = None
+        self.changes = 0
+        self._next = None         # 다음 판단 시각
+        self._calm_since = None   # 올릴 조건이 처음 맞은 시각
+
+    @property
+    def level(self):
+        return self.levels[self.index]
+
+    def observe(self, seconds):
+        """실제로 돈 추론 한 번의 시간"""
+        if self.inference is None:
+            self.inference = seconds
+        else:
+            self.inference += self.alpha * (seconds - self.inference)
+
+    def update(self, now):
+        """주기가 됐으면 판단. 단계가 바뀌면 True"""
+        if self._next is None:
+            self._next = now + self.period
+            return False
+        if now < self._next:
+            return False
+        self._next = now + self.period
+        self.temp = self.sensors.temperature()
+        self.throttle = self.sensors.throttled()
+
+        hot = self.temp is not None and self.temp >= self.hot
+        throttling = bool(self.throttle and self.throttle & THROTTLE_NOW)
+        slow = self.inference is not None and self.inference > self.target_latency
+        if hot or throttling or slow:
+            self._calm_since = None
+            return self._step(+1)
+
+        cool = self.temp is None or self.temp < self.cool
+        fast = self.inference is None or self.inference < self.target_latency * self.headroom
+        if not (cool and fast):
+            self._calm_since = None
+            return False
+        if self._calm_since is None:
+            self._calm_since = now
+        if now - self._calm_since >= self.hold:
+            self._calm_since = now
+            return self._step(-1)
+        return False
+
+    def _step(self, delta):
+        index = min(max(self.index + delta, 0), len(self.levels) - 1)
+        if index == self.index:
+            return False
+        self.index = index
+        self.changes += 1
+        return True
+
+    def stats(self):
+        level = self.level
+        return {"level": self.index, "fps": level.fps, "scale": level.scale,
+                "skip": level.skip, "temp": self.temp, "changes": self.changes}
+
+
+class GovernedCamera:
+    """거버너의 fps 로 프레임을 내보낸다
+
+    카메라가 set_fps(fps) 를 지원하면 (Picamera2, synthetic) 센서 쪽 속도를 바꾸고,
+    아니면 간격이 안 된 프레임을 읽어서 버린다 (추론 / 출력 비용은 그만큼 준다).
+    """
+
+    def __init__(self, camera, governor):
+        self.camera = camera
+        self.governor = governor
+        self.dropped = 0
+        self._fps = None
+        self._next = 0.0
+
+    @property
+    def normalizer(self):
+        return self.camera.normalizer
+
+    def capture_time(self, frame):
+        return frame_time(self.camera, frame)
+
+    def start(self):
+        self.camera.start()
+        self._apply()
+
+    def _apply(self):
+        fps = self.governor.level.fps
+        if fps != self._fps:
+            self._fps = fps
+            if hasattr(self.camera, "set_fps"):
+                self.camera.set_fps(fps)
+
+    def read(self):
+        self._apply()
+        paced = not hasattr(self.camera, "set_fps")
+        while True:
+            frame = self.camera.read()
+            if frame is None or not paced:
+                return frame
+            now = time.perf_counter()
+            if now >= self._next:
+                # 늦은 만큼 몰아서 내보내지 않도록 밀린 시간은 한 프레임까지만 인정
+                interval = 1.0 / self._fps
+                self._next = max(self._next, now - interval) + interval
+                return frame
+            self.dropped += 1
+
+    def stop(self):
+        self.camera.stop()
+
+    def __getattr__(self, name):
+        return getattr(self.camera, name)
+
+
+class GovernedDetector:
+    """detector 앞에 붙어 축소 / 건너뛰기를 하고, 추론 시간을 거버너에 알린다
+
+    축소 비율이 바뀌면 안쪽 래퍼 체인에서 reset() 이 있는 것 (움직임 게이트의 기준 썸네일,
+    ROI 의 픽셀 좌표) 을 초기화한다. 둘 다 프레임 크기에 묶인 상태라 그대로 두면 깨진다.
+    """
+
+    def __init__(self, detector, governor, clock=time.perf_counter):
+        self.detector = detector
+        self.governor = governor
+        self.clock = clock
+        self.processed = 0
+        self.skipped = 0
+        self._since = 0
+        self._result = None
+        self._scale = 1.0         # 안쪽 검출기가 마지막으로 받은 축소 비율
+
+    def _reset_inner(self):
+        inner = self.detector
+        while inner is not None:
+            reset = getattr(inner, "reset", None)
+            if reset is not None:
+                reset()
+            inner = getattr(inner, "detector", None)
+
+    def detect(self, frame):
+        governor = self.governor
+        level = governor.level
+        if self._result is not None and self._since + 1 < level.skip:
+            self._since += 1
+            self.skipped += 1
+            governor.update(self.clock())
+            return self._result
+
+        if level.scale != self._scale:
+            self._scale = level.scale
+            self._reset_inner()
+        if level.scale != 1.0:
+            # 랜드마크는 0~1 정규화 좌표라 축소해도 결과를 그대로 쓴다
+            h, w = frame.shape[:2]
+            frame = cv2.resize(frame, (int(w * level.scale), int(h * level.scale)),
+                               interpolation=cv2.INTER_AREA)
+        t0 = self.clock()
+        self._result = self.detector.detect(frame)
+        t1 = self.clock()
+        governor.observe(t1 - t0)
+        governor.update(t1)
+        self._since = 0
+        self.processed += 1
+        return self._result
+
+    def stats(self):
+        stats = dict(self.detector.stats())
+        stats.update(governor=self.governor.stats(), governor_skipped=self.skipped)
+        return stats
+
+
+def simulate(governor, sensors, seconds, base_inference=0.07, throttle_penalty=1.6, step=0.1):
+    """가상 시간으로 거버너를 돌린다 → [(초, 온도, 단계, 추론 시간)] (step 초마다 한 줄)
+
+    추론 시간 = base_inference × scale² (스로틀링이면 × throttle_penalty),
+    CPU 부하 = 추론 시간 × 초당 추론 횟수 (fps / skip).
+    """
+    trace = []
+    t = 0.0
+    while t < seconds:
+        level = governor.level
+        inference = base_inference * level.scale ** 2
+        if sensors.throttled():
+            inference *= throttle_penalty
+        rate = level.fps / level.skip
+        governor.observe(inference)
+        sensors.advance(step, inference * rate)
+        governor.update(t)
+        trace.append((t, sensors.temperature(), governor.index, inference))
+        t += step
+    return trace
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가상 온도 모델로 거버너 동작 확인")
+    parser.add_argument("--minutes", type=float, default=30)
+    parser.add_argument("--ambient", type=float, default=40.0)
+    parser.add_argument("--base-inference", type=float, default=0.03,
+                        help="단계 0 (640x480) 추론 한 번 시간 (초)")
+    parser.add_argument("--target-latency", type=float, default=0.08)
+    parser.add_argument("--every", type=float, default=60, help="출력 간격 (초)")
+    args = parser.parse_args(argv)
+
+    seconds = args.minutes * 60
+    for name, levels in (("fixed", LEVELS[:1]), ("governed", LEVELS)):
+        sensors = SimulatedSensors(ambient=args.ambient)
+        governor = Governor(sensors, levels=levels, target_latency=args.target_latency)
+        trace = simulate(governor, sensors, seconds, base_inference=args.base_inference)
+        throttled_s = sum(0.1 for _, temp, _, _ in trace if temp >= sensors.throttle_at)
+        print(f"[{name}] 단계 변경 {governor.changes}회, 스로틀링 {throttled_s:.0f}s")
+        next_print = 0.0
+        for t, temp, index, inference in trace:
+            if t >= next_print:
+                next_print += args.every
+                print(f"  {t / 60:5.1f}min  {temp:5.1f}C  {levels[index]}  "
+                      f"추론 {inference * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
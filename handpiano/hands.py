@@ -0,0 +1,115 @@
+"""MediaPipe Hands 생성 / 결과 순회 / 그리기
+
+mediapipe 는 실제로 Hands 를 만들거나 그릴 때 처음 import 한다.
+(녹화 재생 / 벤치마크는 mediapipe 없는 PC 에서도 돌 수 있도록)
+"""
+import struct
+
+import cv2
+import numpy as np
+
+# MediaPipe 손 21점 연결 (mp.solutions.hands.HAND_CONNECTIONS 와 같은 구성)
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),          # 엄지
+    (0, 5), (5, 6), (6, 7), (7, 8),          # 검지
+    (5, 9), (9, 10), (10, 11), (11, 12),     # 중지
+    (9, 13), (13, 14), (14, 15), (15, 16),   # 약지
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # 새끼 + 손바닥
+)
+
+_PACKERS = {}  # 손 개수 → 63 x 손 개 float32 를 채우는 struct.Struct
+
+
+def _solutions():
+    import mediapipe as mp
+    return mp.solutions
+
+
+def create_hands(max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.5,
+                 model_complexity=1, static_image_mode=False):
+    """model_complexity=0 이 lite 모델 (Pi 에서 더 빠르다)
+
+    static_image_mode=True 면 프레임 사이 추적 없이 매번 손바닥 검출부터 한다.
+    """
+    return _solutions().hands.Hands(
+        static_image_mode=static_image_mode,
+        max_num_hands=max_num_hands,
+        model_complexity=model_complexity,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence
+    )
+
+
+class HandDetector:
+    """카메라 원본 프레임 → MediaPipe 결과
+
+    detect(frame) 하나로 감싸 두면 움직임 게이트, ROI 추론 같은 단계를
+    같은 모양의 래퍼로 겹쳐 끼울 수 있다.
+    """
+
+    def __init__(self, hands, camera):
+        self.hands = hands
+        self.camera = camera  # Picamera2 는 start() 뒤에 normalizer 가 생기므로 카메라째 보관
+        self.processed = 0
+
+    def detect(self, frame):
+        self.processed += 1
+        return self.hands.process(self.camera.normalizer.to_rgb(frame))
+
+    def stats(self):
+        return {"processed": self.processed}
+
+
+def iter_hands(result):
+    """검출된 손마다 (hand_landmarks, "Left"/"Right") 를 돌려준다"""
+    if not result.multi_hand_landmarks:
+        return
+    handedness = result.multi_handedness or []
+    for idx, hand_landmarks in enumerate(result.multi_hand_landmarks):
+        if idx < len(handedness):
+            label = handedness[idx].classification[0].label
+        else:
+            label = "Right"
+        yield hand_landmarks, label
+
+
+def landmark_array(result):
+    """검출 결과를 한 번에 (손, 21, 3) float32 배열과 왼손 여부 (손,) bool 로 변환"""
+    hands = result.multi_hand_landmarks
+    if not hands:
+        return np.empty((0, 21, 3), dtype=np.float32), np.empty(0, dtype=bool)
+    # 중첩 리스트 → np.array 는 튜플마다 모양을 검사해서 느리다 (손당 약 13 us).
+    # 한 줄 리스트로 편 뒤 struct 로 새 배열 버퍼에 바로 채우면 속성을 읽는 시간만 남는다
+    n = len(hands)
+    packer = _PACKERS.get(n)
+    if packer is None:
+        packer = _PACKERS[n] = struct.Struct(f"{n * 63}f")
+    landmarks = np.empty((n, 21, 3), dtype=np.float32)
+    packer.pack_into(landmarks, 0, *[v for hand in hands for p in hand.landmark
+                                     for v in (p.x, p.y, p.z)])
+    is_left = np.array([label == "Left" for _, label in iter_hands(result)], dtype=bool)
+    return landmarks, is_left
+
+
+def draw_hands(frame, result):
+    if not result.multi_hand_landmarks:
+        return
+    try:
+        solutions = _solutions()
+    except ImportError:  # mediapipe 없는 PC (녹화 재생 등)
+        _draw_plain(frame, result)
+        return
+    for hand_landmarks in result.multi_hand_landmarks:
+        solutions.drawing_utils.draw_landmarks(frame, hand_landmarks,
+                                               solutions.hands.HAND_CONNECTIONS)
+
+
+def _draw_plain(frame, result):
+    """mediapipe drawing_utils 없이 선 / 점만 그리기"""
+    height, width = frame.shape[:2]
+    for hand_landmarks in result.multi_hand_landmarks:
+        pts = [(int(p.x * width), int(p.y * height)) for p in hand_landmarks.landmark]
+        for a, b in HAND_CONNECTIONS:
+            cv2.line(frame, pts[a], pts[b], (224, 224, 224), 2)
+        for pt in pts:
+            cv2.circle(frame, pt, 3, (0, 0, 255), -1)
@@ -0,0 +1,131 @@
+"""MediaPipe Tasks HandLandmarker (LIVE_STREAM) 비동기 검출기
+
+mp.solutions.hands.Hands.process 는 추론이 끝날 때까지 캡처 루프를 붙잡는다.
+여기서는 detect_async 로 프레임을 넘기기만 하고, 결과는 MediaPipe 스레드의 콜백에서 받는다.
+detect(frame) 은 기다리지 않고 "지금까지 나온 가장 최근 결과" 를 돌려준다.
+그래프가 바쁘면 MediaPipe 가 들어온 프레임을 스스로 버린다.
+detect_async 타임스탬프는 프레임의 캡처 시각 (frame_time) 이고, 결과의 t_capture 에는
+그 결과를 낸 프레임의 캡처 시각을 붙인다 (넘긴 프레임보다 한두 프레임 이전일 수 있다).
+
+결과는 results.HandResult 로 바꿔 두므로 landmark_array / 손가락 세기 / 그리기는 그대로 쓴다.
+
+    python piano.py --backend tasks                    # models/hand_landmarker.task
+    python piano.py --backend tasks --model lite       # models/hand_landmarker_lite.task
+    python piano.py --backend tasks --model-path my.task
+
+.task 파일은 MediaPipe 모델 페이지에서 받아 models/ 에 둔다.
+"""
+import collections
+import os
+import threading
+import time
+
+import numpy as np
+
+from handpiano.camera import frame_time
+from handpiano.results import HandLandmarks, HandResult, Handedness
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+MODELS = {
+    "full": os.path.join(MODEL_DIR, "hand_landmarker.task"),
+    "lite": os.path.join(MODEL_DIR, "hand_landmarker_lite.task"),
+}
+
+
+def result_from_tasks(result):
+    """HandLandmarkerResult → HandResult (hands.process 결과와 같은 모양)"""
+    hands, handedness = [], []
+    for points, categories in zip(result.hand_landmarks, result.handedness):
+        hands.append(HandLandmarks([(p.x, p.y, p.z) for p in points]))
+        top = categories[0]
+        handedness.append(Handedness(top.category_name, top.score))
+    return HandResult(hands, handedness)
+
+
+class TasksHandDetector:
+    """HandDetector 와 같은 detect(frame) / stats() 를 가진 LIVE_STREAM 검출기
+
+    결과는 넘긴 프레임보다 한두 프레임 늦을 수 있다 (latency_ms 로 확인).
+    """
+
+    def __init__(self, camera, model_path=None, model="full", max_num_hands=1,
+                 min_detection_confidence=0.5, min_tracking_confidence=0.5,
+                 min_presence_confidence=0.5):
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python.vision import (HandLandmarker, HandLandmarkerOptions,
+                                                   RunningMode)
+
+        self.camera = camera
+        self.model_path = model_path or MODELS[model]
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(f"HandLandmarker 모델이 없다: {self.model_path}")
+        options = HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=self.model_path),
+            running_mode=RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_presence_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result,
+        )
+        self.landmarker = HandLandmarker.create_from_options(options)
+        self.submitted = 0
+        self.results = 0
+        self.latency_ms = 0.0     # 최근 결과의 (콜백 시각 - 캡처 시각) EWMA
+        self._latest = HandResult()
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._last_ts = -1
+        self._pending = collections.OrderedDict()  # 타임스탬프 → 캡처 시각 (결과 대기 중)
+        self._warm = threading.Event()
+
+    def _timestamp_ms(self, t_capture):
+        # LIVE_STREAM 은 타임스탬프가 반드시 증가해야 한다
+        ts = int((t_capture - self._t0) * 1000)
+        self._last_ts = max(ts, self._last_ts + 1)
+        return self._last_ts
+
+    def _submit(self, rgb, t_capture):
+        import mediapipe as mp
+
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(rgb))
+        ts = self._timestamp_ms(t_capture)
+        with self._lock:
+            self._pending[ts] = t_capture
+        self.landmarker.detect_async(image, ts)
+
+    def warm_up(self, width=640, height=480, timeout=10.0):
+        """검은 프레임 하나를 넘기고 콜백이 올 때까지 기다린다 (그래프 / 모델 초기화)"""
+        self._warm.clear()
+        self._submit(np.zeros((height, width, 3), dtype=np.uint8), time.perf_counter())
+        self._warm.wait(timeout)
+        with self._lock:
+            self._latest = HandResult()
+            self.results = 0
+            self.latency_ms = 0.0
+
+    def detect(self, frame):
+        self._submit(self.camera.normalizer.to_rgb(frame), frame_time(self.camera, frame))
+        self.submitted += 1
+        with self._lock:
+            return self._latest
+
+    def _on_result(self, result, image, timestamp_ms):
+        converted = result_from_tasks(result)
+        now_ms = (time.perf_counter() - self._t0) * 1000
+        with self._lock:
+            converted.t_capture = self._pending.pop(timestamp_ms, None)
+            while self._pending and next(iter(self._pending)) < timestamp_ms:
+                self._pending.popitem(last=False)  # MediaPipe 가 버린 프레임
+            self._latest = converted
+            self.results += 1
+            self.latency_ms += 0.2 * (now_ms - timestamp_ms - self.latency_ms)
+        self._warm.set()
+
+    def stats(self):
+        return {"submitted": self.submitted, "processed": self.results,
+                "dropped": self.submitted - self.results,
+                "latency_ms": round(self.latency_ms, 1)}
+
+    def close(self):
+        self.landmarker.close()
@@ -0,0 +1,307 @@
+"""런타임 지표: Prometheus 텍스트 형식 / 로컬 HTTP
+
+매 프레임 print 대신 카운터와 히스토그램을 쌓아 두고 스크레이프할 때만 글로 만든다.
+
+    python piano.py --headless --metrics 9100
+    curl http://127.0.0.1:9100/metrics
+
+핫 루프 비용
+    Counter.inc / Histogram.observe 는 락 없이 속성 더하기 + 고정 버킷 bisect 뿐이다.
+    지표 하나를 한 스레드만 쓴다고 가정한다 (캡처 / 추론 / 출력이 각자 자기 지표).
+    온도, 스로틀링, 큐 길이처럼 읽기만 하면 되는 값은 콜백으로 두고 스크레이프 때만 읽는다.
+"""
+import bisect
+import collections
+import subprocess
+import threading
+import time
+
+# 초 단위 지연 버킷 (1ms ~ 1s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.02, 0.03, 0.05, 0.075, 0.1, 0.15,
+                   0.25, 0.5, 1.0)
+FPS_WINDOW = 2.0  # capture_fps 를 세는 창 (초)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+
+class Counter:
+    """단조 증가 값. fn 을 주면 스크레이프 때 fn() 을 값으로 쓴다 (다른 객체의 카운터 노출)"""
+
+    kind = "counter"
+
+    def __init__(self, name, help_, labels=None, fn=None):
+        self.name = name
+        self.help = help_
+        self.labels = labels
+        self.fn = fn
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+    def samples(self):
+        value = self.fn() if self.fn is not None else self.value
+        yield self.name + _labels(self.labels), value
+
+
+class Gauge(Counter):
+    """현재 값. set() 하거나 fn 으로 스크레이프 때 읽는다 (None 이면 생략)"""
+
+    kind = "gauge"
+
+    def set(self, value):
+        self.value = value
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷마다 개수를 따로 두고 출력할 때 누적)"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_, buckets=LATENCY_BUCKETS, labels=None):
+        self.name = name
+        self.help = help_
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸 = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self):
+        labels = dict(self.labels or {})
+        cumulative = 0
+        for bound, n in zip(self.buckets + ("+Inf",), list(self.counts)):
+            cumulative += n
+            yield self.name + "_bucket" + _labels(dict(labels, le=bound)), cumulative
+        yield self.name + "_sum" + _labels(labels), self.sum
+        yield self.name + "_count" + _labels(labels), self.count
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_, **kwargs):
+        return self.add(Counter(name, help_, **kwargs))
+
+    def gauge(self, name, help_, **kwargs):
+        return self.add(Gauge(name, help_, **kwargs))
+
+    def histogram(self, name, help_, **kwargs):
+        return self.add(Histogram(name, help_, **kwargs))
+
+    def render(self):
+        # 같은 이름(라벨만 다른) 지표는 한 묶음으로 붙여 써야 한다
+        families = {}
+        for metric in list(self.metrics):
+            families.setdefault(metric.name, []).append(metric)
+        lines = []
+        for name, metrics in families.items():
+            lines.append(f"# HELP {name} {metrics[0].help}")
+            lines.append(f"# TYPE {name} {metrics[0].kind}")
+            for metric in metrics:
+                for key, value in metric.samples():
+                    if value is not None:
+                        lines.append(f"{key} {float(value):.6g}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """GET /metrics 에 registry.render() 를 돌려주는 루프백 HTTP 서버"""
+
+    def __init__(self, registry, port=9100, host="127.0.0.1"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.address = self.httpd.server_address
+        threading.Thread(target=self.httpd.serve_forever, name="metrics-http",
+                         daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# -------------------------------
+# Raspberry Pi 상태 (스크레이프 때만 읽는다)
+# -------------------------------
+THERMAL_ZONE = "/sys/class/thermal/thermal_zone0/temp"
+THROTTLED_SYSFS = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+
+
+def cpu_temperature():
+    """CPU 온도 (섭씨). 없으면 None"""
+    try:
+        with open(THERMAL_ZONE) as f:
+            return int(f.read()) / 1000
+    except (OSError, ValueError):
+        return None
+
+
+def throttled():
+    """vcgencmd get_throttled 비트 (0 = 정상, 0x4 = 지금 스로틀링, 0x40000 = 한 적 있음)"""
+    try:
+        with open(THROTTLED_SYSFS) as f:
+            return int(f.read(), 16)
+    except (OSError, ValueError):
+        pass
+    try:
+        out = subprocess.run(["vcgencmd", "get_throttled"], capture_output=True,
+                             text=True, timeout=1).stdout
+        return int(out.strip().split("=")[1], 16)
+    except (OSError, subprocess.SubprocessError, IndexError, ValueError):
+        return None
+
+
+class PianoMetrics:
+    """hand piano 공통 지표 묶음"""
+
+    def __init__(self, registry=None):
+        r = self.registry = registry or Registry()
+        self.frames = r.counter("handpiano_frames_total", "출력까지 간 카메라 프레임 수")
+        self.inference = r.histogram("handpiano_inference_seconds",
+                                     "추론 단계 (검출 + 손가락 세기) 소요 시간")
+        self.latency = r.histogram("handpiano_capture_to_output_seconds",
+                                   "캡처부터 출력 단계가 끝날 때까지")
+        self.note_changes = r.counter("handpiano_note_changes_total",
+                                      "음이 바뀌거나 켜지고 꺼진 횟수")
+        r.gauge("handpiano_capture_fps", f"최근 {FPS_WINDOW:g}초 동안 캡처된 초당 프레임",
+                fn=self._fps)
+        r.gauge("handpiano_cpu_temperature_celsius", "CPU 온도", fn=cpu_temperature)
+        r.gauge("handpiano_throttled", "get_throttled 비트 (0 = 정상)", fn=throttled)
+        self._captures = collections.deque(maxlen=1024)  # 최근 캡처 시각 (perf_counter)
+
+    def captured(self, t_capture):
+        """카메라에서 프레임 하나를 읽을 때마다 (출력까지 가지 않고 버려지는 프레임도)"""
+        self._captures.append(t_capture)
+
+    def _fps(self, window=FPS_WINDOW):
+        """캡처 시각으로 센다. 스크레이프 간격이나 출력 속도와 상관없다"""
+        times = tuple(self._captures)  # 한 번에 복사 (캡처 스레드가 계속 쌓는다)
+        if len(times) < 2:
+            return 0.0
+        now = time.perf_counter()
+        recent = sum(1 for t in times if t > now - window)
+        if recent == len(times):
+            # 기록이 창보다 짧다 (시작 직후, 또는 maxlen 을 넘는 높은 fps)
+            return (len(times) - 1) / (times[-1] - times[0]) if times[-1] > times[0] else 0.0
+        return recent / window
+
+    def watch_sink(self, sink):
+        """sink 를 감싸 음 변화 횟수를 세고, 부저면 PWM 호출 수도 노출"""
+        if hasattr(sink, "writes"):
+            self.registry.counter("handpiano_pwm_writes_total", "실제 PWM 하드웨어 호출 수",
+                                  fn=lambda: sink.writes)
+        return MeteredSink(sink, self.note_changes)
+
+    def watch_pipeline(self, pipeline):
+        r = self.registry
+        for stage, q in zip(pipeline.threads, pipeline.queues):
+            labels = {"queue": stage.name}
+            r.gauge("handpiano_queue_depth", "단계 뒤 큐에 쌓인 항목 수",
+                    labels=labels, fn=q.__len__)
+            r.counter("handpiano_dropped_frames_total", "큐가 가득 차 버린 프레임 수",
+                      labels=labels, fn=lambda q=q: q.dropped)
+
+    def watch_camera(self, camera):
+        reader = getattr(camera, "reader", None)  # libcamera-vid 스트림 리더
+        if reader is not None:
+            self.registry.counter("handpiano_dropped_frames_total",
+                                  "큐가 가득 차 버린 프레임 수", labels={"queue": "camera"},
+                                  fn=lambda: reader.dropped)
+
+    def watch_detector(self, detector):
+        """검출기 stats() 의 횟수들 (추론 / 움직임 게이트로 건너뜀 / ROI / 전체 프레임)"""
+        def stat(key):
+            return lambda: detector.stats().get(key)
+        for key in ("processed", "skipped", "roi_frames", "full_frames"):
+            if key in detector.stats():
+                self.registry.counter(f"handpiano_detector_{key}_total",
+                                      f"검출기 stats() 의 {key}", fn=stat(key))
+
+    def watch_governor(self, governor):
+        r = self.registry
+        r.gauge("handpiano_governor_level", "거버너 단계 (0 = 최대 품질)",
+                fn=lambda: governor.index)
+        r.gauge("handpiano_governor_fps", "거버너가 정한 캡처 fps", fn=lambda: governor.level.fps)
+        r.gauge("handpiano_governor_scale", "추론 입력 축소 비율", fn=lambda: governor.level.scale)
+        r.gauge("handpiano_governor_skip", "몇 프레임마다 추론하는지", fn=lambda: governor.level.skip)
+        r.counter("handpiano_governor_changes_total", "단계가 바뀐 횟수",
+                  fn=lambda: governor.changes)
+
+    def serve(self, port):
+        self.server = MetricsServer(self.registry, port)
+        print(f"metrics: http://{self.server.address[0]}:{self.server.address[1]}/metrics")
+        return self
+
+    def close(self):
+        if getattr(self, "server", None) is not None:
+            self.server.close()
+            self.server = None
+
+
+class MeteredSink:
+    """play / stop 을 그대로 넘기면서 실제로 소리가 바뀐 횟수만 센다
+
+    sink 가 freq (단음은 값, 다성은 목소리별 목록) 를 가지면 호출한 뒤의 그 값으로 판단한다.
+    부저가 release 동안 소리를 유지하거나 hold 때문에 음을 늦게 바꾸면 그 호출은 세지 않고,
+    실제로 꺼지거나 바뀐 호출에서 센다. freq 가 없는 sink 는 요청한 값 그대로.
+    """
+
+    def __init__(self, sink, changes):
+        self.sink = sink
+        self.voices = getattr(sink, "voices", 1)
+        self._changes = changes
+        self._freq = {}
+
+    def play(self, freq, **kwargs):
+        self.sink.play(freq, **kwargs)
+        self._observe(kwargs.get("voice", 0), freq)
+
+    def stop(self, *args):
+        self.sink.stop(*args)
+        for voice in (list(self._freq) if not args else [args[0]]):
+            self._observe(voice, None)
+
+    def _observe(self, voice, requested):
+        actual = getattr(self.sink, "freq", requested)
+        if isinstance(actual, list):
+            actual = actual[voice]
+        if self._freq.get(voice) != actual:
+            self._freq[voice] = actual
+            self._changes.inc()
+
+    def close(self):
+        self.sink.close()
+
+    def __getattr__(self, name):
+        return getattr(self.sink, name)
@@ -0,0 +1,201 @@
+"""libcamera-vid stdout 스트림 읽기
+
+cv2.VideoCapture(파이프, CAP_FFMPEG) 대신 직접 읽는다.
+
+MjpegStreamReader
+    읽기 스레드가 stdout 을 재사용 bytearray 에 받아 JPEG SOI(FFD8) / EOI(FFD9)
+    경계를 찾고, 한 번에 여러 장이 들어오면 가장 최신 것만 남긴다.
+    디코드 스레드가 그 JPEG 를 cv2.imdecode 하고, read() 는 새 프레임이 올 때까지
+    기다렸다가(바쁜 대기 없음) 가장 최신 프레임을 돌려준다.
+
+Yuv420StreamReader
+    --codec yuv420 출력(I420, 프레임당 w*h*3/2 바이트)을 고정 크기로 읽는다.
+    JPEG 인코딩 / 디코딩이 통째로 빠지고 색 변환 한 번만 남는다.
+
+둘 다 stream 은 읽기 가능한 바이너리 파일 객체면 되므로 파이프 없이도 시험할 수 있다.
+"""
+import threading
+
+import cv2
+import numpy as np
+
+SOI = b"\xff\xd8"
+EOI = b"\xff\xd9"
+
+
+class _Latest:
+    """가장 최신 값 하나만 보관하는 슬롯 (덮어쓴 값은 버린 것으로 센다)"""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.value = None
+        self.seq = 0
+        self.dropped = 0
+        self.closed = False
+
+    def put(self, value):
+        with self.cond:
+            if self.value is not None:
+                self.dropped += 1
+            self.value = value
+            self.seq += 1
+            self.cond.notify_all()
+
+    def take(self, timeout=None):
+        """새 값이 올 때까지 기다렸다가 꺼낸다. 닫혔거나 시간이 지나면 None"""
+        with self.cond:
+            if self.value is None and not self.closed:
+                self.cond.wait(timeout)
+            value, self.value = self.value, None
+            return value
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class MjpegStreamReader:
+    """MJPEG 바이트 스트림 → 최신 BGR 프레임"""
+
+    def __init__(self, stream, buffer_size=1 << 22, chunk_size=1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._jpeg = _Latest()    # 읽기 → 디코드
+        self._frame = _Latest()   # 디코드 → read()
+        self.parsed = 0
+        self.decoded = 0
+        self._threads = [
+            threading.Thread(target=self._read_loop, name="mjpeg-read", daemon=True),
+            threading.Thread(target=self._decode_loop, name="mjpeg-decode", daemon=True),
+        ]
+
+    def start(self):
+        for t in self._threads:
+            t.start()
+        return self
+
+    @property
+    def dropped(self):
+        """디코드 전 / 후에 더 새 프레임에 밀려 버려진 수"""
+        return self._jpeg.dropped + self._frame.dropped
+
+    def _read_loop(self):
+        buf, view = self._buf, self._view
+        end = 0
+        try:
+            while True:
+                if end == len(buf):  # 프레임 하나가 버퍼보다 크면 버리고 다시 동기화
+                    end = 0
+                n = self.stream.readinto(view[end:end + self.chunk_size])
+                if not n:
+                    break
+                scan_from = max(0, end - 1)  # 마커가 청크 경계에 걸친 경우
+                end += n
+
+                newest = None
+                start = buf.find(SOI, 0, end)
+                while start >= 0:
+                    stop = buf.find(EOI, max(start + 2, scan_from), end)
+                    if stop < 0:
+                        break
+                    newest = (start, stop + 2)
+                    self.parsed += 1
+                    start = buf.find(SOI, stop + 2, end)
+                    scan_from = stop + 2
+
+                if newest is not None:
+                    self._jpeg.put(bytes(view[newest[0]:newest[1]]))
+
+                # 끝나지 않은 프레임만 버퍼 앞으로 당긴다
+                keep = start if start >= 0 else max(0, end - 1)
+                if keep:
+                    view[:end - keep] = view[keep:end]
+                    end -= keep
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._jpeg.close()
+
+    def _decode_loop(self):
+        try:
+            while True:
+                jpeg = self._jpeg.take()
+                if jpeg is None:
+                    if self._jpeg.closed:
+                        break
+                    continue
+                frame = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if frame is not None:
+                    self.decoded += 1
+                    self._frame.put(frame)
+        finally:
+            self._frame.close()
+
+    def read(self, timeout=1.0):
+        """다음 최신 프레임. 스트림이 끝났으면 None"""
+        while True:
+            frame = self._frame.take(timeout)
+            if frame is not None or self._frame.closed:
+                return frame
+
+
+class Yuv420StreamReader:
+    """I420 원본 스트림 → 최신 RGB 프레임 (numpy [R, G, B] = Picamera2 의 BGR888 배치)
+
+    I420 은 여러 단계가 채널 축을 기대하므로 읽기 스레드에서 바로 변환해 둔다.
+    MediaPipe 가 RGB 를 받으므로 추론 쪽은 추가 변환 없이 그대로 쓴다.
+    """
+
+    FORMAT = "BGR888"
+
+    def __init__(self, stream, width, height, ring=3):
+        self.stream = stream
+        self._yuv = np.empty((height * 3 // 2, width), dtype=np.uint8)
+        self._ring = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(ring)]
+        self._frame = _Latest()
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self._thread = threading.Thread(target=self._read_loop, name="yuv-read", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def dropped(self):
+        return self._frame.dropped
+
+    def _read_loop(self):
+        view = memoryview(self._yuv).cast("B")
+        i = 0
+        try:
+            while True:
+                got = 0
+                while got < len(view):
+                    n = self.stream.readinto(view[got:])
+                    if not n:
+                        return
+                    got += n
+                self.parsed += 1
+                with self._lock:
+                    cv2.cvtColor(self._yuv, cv2.COLOR_YUV2RGB_I420, dst=self._ring[i])
+                self._frame.put(i)
+                i = (i + 1) % len(self._ring)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._frame.close()
+
+    def read(self, timeout=1.0):
+        """다음 최신 프레임. 스트림이 끝났으면 None"""
+        while True:
+            i = self._frame.take(timeout)
+            if i is not None:
+                with self._lock:
+                    # 링 버퍼는 곧 다시 채워지므로 넘겨줄 때만 복사
+                    return self._ring[i].copy()
+            if self._frame.closed:
+                return None
@@ -0,0 +1,63 @@
+"""움직임 게이트: 장면이 그대로면 MediaPipe 를 건너뛰고 이전 결과를 재사용
+
+프레임을 step 간격으로 솎아낸 한 채널끼리 비교하므로 640x480 에서도 수십 us 면 된다.
+(cv2.resize INTER_AREA 는 같은 크기로 줄이는 데 수백 us 가 들어 쓰지 않는다)
+비교 기준은 마지막으로 추론한 프레임이라, 아주 느린 움직임도 쌓이면 잡힌다.
+"""
+import cv2
+import numpy as np
+
+
+class MotionGatedDetector:
+    """detector.detect 앞에 붙는 움직임 게이트
+
+    threshold    : 축소 프레임 평균 밝기 차이 (0~255). 이보다 작으면 건너뜀
+    max_interval : 아무리 조용해도 이 프레임 수마다 한 번은 추론
+    step         : 솎아내는 간격 (8 → 640x480 이 80x60)
+    """
+
+    def __init__(self, detector, threshold=3.0, max_interval=10, step=8):
+        self.detector = detector
+        self.threshold = threshold
+        self.max_interval = max_interval
+        self.step = step
+        self.processed = 0
+        self.skipped = 0
+        self.score = 0.0
+        self._ref = None
+        self._result = None
+        self._since = 0
+
+    def _thumbnail(self, frame):
+        # 초록 채널은 RGB / BGR / RGBA 어느 배치든 1번 자리라 변환 없이 바로 쓴다
+        n = self.step
+        channel = frame[::n, ::n] if frame.ndim == 2 else frame[::n, ::n, 1]
+        return np.ascontiguousarray(channel)
+
+    def reset(self):
+        """프레임 크기가 바뀌면 (거버너 축소) 기준 썸네일을 버리고 다음 프레임은 추론"""
+        self._ref = None
+        self._result = None
+        self._since = 0
+
+    def detect(self, frame):
+        thumb = self._thumbnail(frame)
+        if self._ref is not None and self._since < self.max_interval:
+            self.score = float(cv2.absdiff(thumb, self._ref).mean())
+            if self.score < self.threshold:
+                self.skipped += 1
+                self._since += 1
+                return self._result
+
+        self._result = self.detector.detect(frame)
+        self._ref = thumb
+        self._since = 0
+        self.processed += 1
+        return self._result
+
+    def stats(self):
+        total = self.processed + self.skipped
+        stats = dict(self.detector.stats())
+        stats.update(processed=self.processed, skipped=self.skipped,
+                     skip_ratio=round(self.skipped / total, 3) if total else 0.0)
+        return stats
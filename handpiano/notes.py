@@ -0,0 +1,12 @@
+"""손가락 개수 → 음계 매핑 (도~높은 도)"""
+
+NOTE_FREQ = {
+    1: ("도", 261),
+    2: ("레", 293),
+    3: ("미", 329),
+    4: ("파", 349),
+    5: ("솔", 392),
+    6: ("라", 440),
+    7: ("시", 493),
+    8: ("도", 523)  # 높은 도
+}
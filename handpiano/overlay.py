@@ -0,0 +1,156 @@
+"""화면에 보여줄 프레임에만 그리는 캐시 오버레이
+
+예전에는 매 프레임 원본 크기에 draw_landmarks(점 / 선마다 호출) + putText(글자마다 래스터화)
+를 했다. 여기서는
+    - 바뀌지 않는 층 (HUD 배경, 아래쪽 음 이름 띠) 은 처음 한 번만 그려 두고 띠 영역만 합성
+    - 글자는 문자열마다 한 번 그려 둔 조각 (patch + mask) 을 복사
+    - 랜드마크는 손 / 손가락 전부를 cv2.polylines 한 번 (선) + 한 번 (점) 으로
+    - 표시 크기(width) 의 재사용 버퍼에 줄여 담은 뒤 그 위에 그린다 (원본 프레임은 건드리지 않음)
+출력 단계에서 display.wants_frame() 일 때만 부르므로 표시 속도(--display-fps)와 검출 속도는 따로 간다.
+
+    frame = overlay.render(camera.normalizer.to_bgr(item["frame"]), item["landmarks"],
+                           texts=[(f"Fingers: {n}", (10, 30), (0, 255, 0))], note=n)
+    display.show(frame)
+"""
+import collections
+
+import cv2
+import numpy as np
+
+from handpiano.notes import NOTE_FREQ
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# HAND_CONNECTIONS 를 이어지는 꺾은선으로 (손가락 5개 + 손바닥 가로선)
+HAND_CHAINS = (
+    (0, 1, 2, 3, 4),
+    (0, 5, 6, 7, 8),
+    (9, 10, 11, 12),
+    (13, 14, 15, 16),
+    (0, 17, 18, 19, 20),
+    (5, 9, 13, 17),
+)
+# 모든 꺾은선 점을 한 번에 모으는 인덱스와 선마다의 구간
+_CHAIN_INDEX = np.concatenate(HAND_CHAINS)
+_CHAIN_BOUNDS = np.cumsum([0] + [len(chain) for chain in HAND_CHAINS])
+
+
+class OverlayRenderer:
+    """width : 표시 가로 크기 (None 이면 프레임 크기 그대로, 세로는 비율 유지)
+    notes : 아래 띠에 그릴 음 번호들 (None 이면 띠 없음)
+    """
+
+    TEXT_CACHE = 64
+
+    def __init__(self, width=None, hud_height=40, notes=None, line_color=(224, 224, 224),
+                 point_color=(0, 0, 255)):
+        self.width = width
+        self.hud_height = hud_height
+        self.notes = notes
+        self.line_color = line_color
+        self.point_color = point_color
+        self.rendered = 0
+        self.buffer = None
+        self._hud = None          # HUD 배경 (hud_height, w, 3)
+        self._strip = None        # 음 이름 띠 (patch, mask)
+        self._cells = None        # 음 번호 → 띠 안의 (x0, x1)
+        self._texts = collections.OrderedDict()
+
+    # -------------------------------
+    # 정적인 층 (크기가 정해질 때 한 번)
+    # -------------------------------
+    def _prepare(self, height, width):
+        self.buffer = np.empty((height, width, 3), dtype=np.uint8)
+        self._hud = np.full((min(self.hud_height, height), width, 3), 32, dtype=np.uint8)
+        if not self.notes:
+            return
+        cell = width // len(self.notes)
+        strip = np.zeros((28, width, 3), dtype=np.uint8)
+        self._cells = {}
+        for i, note in enumerate(self.notes):
+            x0 = i * cell
+            self._cells[note] = (x0, x0 + cell)
+            cv2.rectangle(strip, (x0, 0), (x0 + cell - 1, 27), (200, 200, 200), 1)
+            # 음 이름(한글)은 Hershey 글꼴로 못 그리므로 번호와 주파수만 (좁으면 번호만)
+            label = f"{note}:{NOTE_FREQ[note][1]:.0f}Hz" if cell >= 72 else str(note)
+            cv2.putText(strip, label, (x0 + 4, 20), FONT, 0.4,
+                        (255, 255, 255), 1, cv2.LINE_AA)
+        self._strip = (strip, strip.any(axis=2).astype(np.uint8))
+
+    def _text(self, text, color, scale):
+        key = (text, color, scale)
+        cached = self._texts.get(key)
+        if cached is None:
+            (w, h), base = cv2.getTextSize(text, FONT, scale, 2)
+            patch = np.zeros((h + base + 4, w + 4, 3), dtype=np.uint8)
+            cv2.putText(patch, text, (2, h + 2), FONT, scale, color, 2)
+            cached = (patch, patch.any(axis=2).astype(np.uint8), h + 2)
+            self._texts[key] = cached
+            if len(self._texts) > self.TEXT_CACHE:
+                self._texts.popitem(last=False)
+        else:
+            self._texts.move_to_end(key)
+        return cached
+
+    # -------------------------------
+    # 표시할 프레임마다
+    # -------------------------------
+    def render(self, frame, landmarks=None, texts=(), note=None):
+        """frame : BGR 원본. landmarks : (손, 21, 3) 정규화 좌표 (NaN 손은 건너뜀)
+        texts : [(글자, (x, y) 기준선 왼쪽, BGR 색)], note : 띠에서 강조할 음 번호
+        → 오버레이가 그려진 self.buffer (다음 render 때 덮어쓴다)
+        """
+        height, width = frame.shape[:2]
+        if self.width and self.width < width:
+            height, width = height * self.width // width, self.width
+        if self.buffer is None or self.buffer.shape[:2] != (height, width):
+            self._prepare(height, width)
+        buf = self.buffer
+        if frame.shape[:2] == (height, width):
+            np.copyto(buf, frame)
+        else:
+            cv2.resize(frame, (width, height), dst=buf, interpolation=cv2.INTER_AREA)
+
+        hud = self._hud
+        band = buf[:len(hud)]
+        cv2.addWeighted(band, 0.4, hud, 0.6, 0, dst=band)
+        if self._strip is not None:
+            strip, mask = self._strip
+            band = buf[height - len(strip):]
+            if note in self._cells:
+                x0, x1 = self._cells[note]
+                cv2.rectangle(band, (x0, 0), (x1 - 1, len(strip) - 1), (255, 160, 0), -1)
+            cv2.copyTo(strip, mask, band)
+
+        if landmarks is not None and len(landmarks):
+            self._draw_landmarks(buf, landmarks, width, height)
+
+        scale = max(0.4, width / 640)
+        for text, (x, y), color in texts:
+            self._put(buf, text, int(x * width / frame.shape[1]),
+                      int(y * height / frame.shape[0]), color, scale)
+        self.rendered += 1
+        return buf
+
+    def _draw_landmarks(self, buf, landmarks, width, height):
+        lm = np.asarray(landmarks)[..., :2]
+        lm = lm[~np.isnan(lm).any(axis=(1, 2))]
+        if not len(lm):
+            return
+        pts = np.rint(lm * (width, height)).astype(np.int32)        # (손, 21, 2)
+        chains = np.ascontiguousarray(pts[:, _CHAIN_INDEX])          # (손, 26, 2)
+        lines = [hand[a:b] for hand in chains
+                 for a, b in zip(_CHAIN_BOUNDS[:-1], _CHAIN_BOUNDS[1:])]
+        cv2.polylines(buf, lines, False, self.line_color, 2)
+        # 길이 0 선분은 둥근 점으로 그려진다 → 점 21 개 x 손을 한 번에
+        dots = np.repeat(pts.reshape(-1, 1, 2), 2, axis=1)
+        cv2.polylines(buf, list(dots), False, self.point_color, 6)
+
+    def _put(self, buf, text, x, y, color, scale):
+        patch, mask, ascent = self._text(text, color, round(scale, 2))
+        y0 = max(0, y - ascent)
+        h = min(len(patch), len(buf) - y0)
+        w = min(patch.shape[1], buf.shape[1] - x)
+        if h <= 0 or w <= 0 or x < 0:
+            return
+        cv2.copyTo(patch[:h, :w], mask[:h, :w], buf[y0:y0 + h, x:x + w])
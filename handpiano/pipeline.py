@@ -0,0 +1,198 @@
+"""캡처 / 추론 / 출력 단계를 분리해서 돌리는 파이프라인
+
+    capture ──▶ [큐] ──▶ inference ──▶ [큐] ──▶ output(메인 스레드)
+
+- 각 단계는 자기 스레드에서 돌고, 단계 사이에는 크기가 정해진 큐를 둔다.
+- 큐가 가득 차면 가장 오래된 프레임을 버린다 → 느린 단계가 앞 단계를 막지 않는다.
+- 마지막 출력 단계(cv2.imshow, 부저)는 호출한 스레드에서 돌린다.
+  (imshow/waitKey 는 메인 스레드에서 부르는 것이 안전하다)
+"""
+import collections
+import threading
+import time
+
+
+class DropOldestQueue:
+    """가득 차면 가장 오래된 항목을 버리는 큐"""
+
+    def __init__(self, maxsize=2):
+        self._items = collections.deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1  # deque 가 알아서 왼쪽(가장 오래된)을 밀어낸다
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """항목 하나 꺼내기. timeout 동안 없으면 None"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class StageStats:
+    """단계별 처리량 / 처리 시간 집계"""
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.busy = 0.0  # 실제로 일한 시간 (초)
+        self.started = None
+
+    def add(self, elapsed):
+        if self.started is None:
+            self.started = time.perf_counter() - elapsed
+        self.count += 1
+        self.busy += elapsed
+
+    def fps(self):
+        """벽시계 기준 초당 처리 개수"""
+        if self.started is None:
+            return 0.0
+        wall = time.perf_counter() - self.started
+        return self.count / wall if wall > 0 else 0.0
+
+    def mean_ms(self):
+        return self.busy / self.count * 1000 if self.count else 0.0
+
+    def as_dict(self):
+        return {"stage": self.name, "count": self.count,
+                "fps": round(self.fps(), 2), "mean_ms": round(self.mean_ms(), 3)}
+
+
+class Stage(threading.Thread):
+    """큐에서 꺼내 func 를 적용하고 다음 큐로 넘기는 단계
+
+    func(item) 이 None 을 돌려주면 그 항목은 버린다.
+    inbox 가 없으면 소스 단계: func() 이 None 을 돌려주면 스트림 끝.
+    """
+
+    def __init__(self, name, func, inbox=None, outbox=None, upstream=None):
+        super().__init__(name=name, daemon=True)
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.upstream = upstream
+        self.stats = StageStats(name)
+        self.stop_event = threading.Event()
+
+    def _upstream_done(self):
+        return self.upstream is not None and not self.upstream.is_alive()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            if self.inbox is None:
+                t0 = time.perf_counter()
+                item = self.func()
+                if item is None:
+                    break
+            else:
+                item = self.inbox.get(timeout=0.05)
+                if item is None:
+                    if self._upstream_done() and not len(self.inbox):
+                        break
+                    continue
+                t0 = time.perf_counter()
+                item = self.func(item)
+            self.stats.add(time.perf_counter() - t0)
+            if item is not None and self.outbox is not None:
+                self.outbox.put(item)
+
+
+class Pipeline:
+    """capture → (처리 단계들) → 출력 으로 이어지는 파이프라인
+
+    source() 는 프레임(또는 None = 끝)을 돌려준다.
+    stages 는 (이름, func) 목록으로, 각 func 는 item(dict)을 받아 item 을 돌려준다.
+    item 에는 "seq", "t_capture", "frame" 이 들어 있다.
+    timestamp(frame) 를 주면 t_capture 로 그 값을 쓴다 (기본은 source() 가 돌아온 시각).
+    """
+
+    def __init__(self, source, stages, queue_size=2, timestamp=None):
+        self._seq = 0
+        clock = timestamp or (lambda frame: time.perf_counter())
+        self.queues = []
+        self.threads = []
+
+        def capture():
+            frame = source()
+            if frame is None:
+                return None
+            self._seq += 1
+            return {"seq": self._seq, "t_capture": clock(frame), "frame": frame}
+
+        upstream = None
+        inbox = None
+        for name, func in [("capture", capture)] + list(stages):
+            outbox = DropOldestQueue(queue_size)
+            stage = Stage(name, func, inbox=inbox, outbox=outbox, upstream=upstream)
+            self.queues.append(outbox)
+            self.threads.append(stage)
+            upstream, inbox = stage, outbox
+
+        self.output = inbox
+        self.last = upstream
+        self.sink_stats = StageStats("output")
+        self.latencies = collections.deque(maxlen=1000)  # capture → 출력 (초)
+
+    def start(self):
+        for t in self.threads:
+            t.start()
+        return self
+
+    def stop(self):
+        for t in self.threads:
+            t.stop_event.set()
+
+    def join(self, timeout=None):
+        for t in self.threads:
+            t.join(timeout)
+
+    def run(self, sink):
+        """출력 단계를 현재 스레드에서 돌린다. sink(item) 이 False 면 중단"""
+        self.start()
+        try:
+            while True:
+                item = self.output.get(timeout=0.05)
+                if item is None:
+                    if not self.last.is_alive() and not len(self.output):
+                        break
+                    continue
+                t0 = time.perf_counter()
+                keep_going = sink(item)
+                now = time.perf_counter()
+                self.sink_stats.add(now - t0)
+                self.latencies.append(now - item["t_capture"])
+                if keep_going is False:
+                    break
+        finally:
+            self.stop()
+            self.join(1.0)
+
+    def stats(self):
+        """단계별 처리량, 버린 프레임 수, 평균 종단 지연"""
+        rows = [t.stats.as_dict() for t in self.threads] + [self.sink_stats.as_dict()]
+        for row, q in zip(rows, self.queues):
+            row["dropped"] = q.dropped
+        lat = list(self.latencies)
+        return {
+            "stages": rows,
+            "latency_ms": round(sum(lat) / len(lat) * 1000, 3) if lat else 0.0,
+        }
+
+    def report(self):
+        s = self.stats()
+        for row in s["stages"]:
+            print(f"[{row['stage']:>10}] {row['fps']:6.1f} fps  "
+                  f"{row['mean_ms']:7.2f} ms/frame  dropped={row.get('dropped', 0)}")
+        print(f"capture → output 평균 지연: {s['latency_ms']:.1f} ms")
@@ -0,0 +1,312 @@
+"""여러 프로세스에서 MediaPipe 를 돌리는 추론 풀
+
+한 프로세스의 hands.process 는 코어 하나만 쓴다. InferencePool 은 작업 프로세스 N 개가
+각자 Hands 를 하나씩 들고, 프레임은 multiprocessing.shared_memory 의 슬롯으로 넘긴다.
+큐에는 (번호, 슬롯) 만 오가고 프레임 자체는 pickle 하지 않는다.
+결과는 랜드마크 배열만 돌려받아 부모 프로세스에서 HandResult 로 다시 만든다.
+
+    ordered=True  : 프레임 순서대로 결과를 내보낸다 (늦은 번호를 기다림)
+    ordered=False : 먼저 끝난 결과를 바로 내보내고, 그보다 오래된 결과는 버린다 (최저 지연)
+
+앱에서는 PooledCamera + PooledDetector 로 끼운다 (ReplayCamera / ReplayDetector 와 같은 짝).
+PooledCamera.read() 는 추론이 끝난 프레임을 돌려주고, PooledDetector.detect() 는
+그 프레임의 결과를 돌려주므로 run() / Pipeline 은 바뀌지 않는다.
+캡처 시각은 카메라에서 읽은 순간에 재 두었다가 capture_time() 으로 알려준다
+(read() 가 돌아오는 시각은 추론이 끝난 뒤라 지연 / 스무딩 / 판정 시각으로 쓰면 안 된다).
+
+작업 프로세스마다 연속이 아닌 프레임을 받으므로 MediaPipe 추적(tracking) 이득은 줄어든다.
+"""
+import collections
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from handpiano.camera import frame_time
+from handpiano.frames import FrameNormalizer
+from handpiano.results import HandResult, result_from_arrays
+
+
+def _worker(shm_name, shape, dtype, fmt, tasks, results, factory, kwargs):
+    # Ctrl-C 는 같은 프로세스 그룹 전체에 간다. 종료는 부모가 None 을 보내 정리한다
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        from handpiano.hands import create_hands, landmark_array
+
+        frames = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        hands = (factory or create_hands)(**kwargs)
+        normalizer = FrameNormalizer(fmt)
+        results.put(("ready", os.getpid(), None, None, 0.0))
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, slot = task
+            t0 = time.perf_counter()
+            result = hands.process(normalizer.to_rgb(frames[slot]))
+            landmarks, is_left = landmark_array(result)
+            results.put((seq, slot, landmarks, is_left, time.perf_counter() - t0))
+        del frames
+    finally:
+        shm.close()
+
+
+class InferencePool:
+    """N 개 작업 프로세스 + 공유 메모리 프레임 슬롯
+
+    workers : 작업 프로세스 수 (Hands 인스턴스 수)
+    slots   : 동시에 처리 중일 수 있는 프레임 수 (기본 workers * 2)
+    factory : Hands 대신 쓸 객체를 만드는 최상위 함수 (process(rgb) 만 있으면 됨)
+    """
+
+    def __init__(self, workers=2, slots=None, ordered=True, factory=None, **hands_kwargs):
+        self.workers = workers
+        self.slots = slots or workers * 2
+        self.ordered = ordered
+        self.factory = factory
+        self.hands_kwargs = hands_kwargs
+        self.submitted = 0
+        self.completed = 0
+        self.stale = 0           # ordered=False 에서 늦게 도착해 버린 결과
+        self.busy = 0.0          # 작업 프로세스들이 추론에 쓴 시간 합
+        self._ctx = multiprocessing.get_context("spawn")  # 스레드가 도는 부모에서 fork 하지 않는다
+        self._shm = None
+        self._frames = None
+        self._free = queue.Queue()
+        self._procs = []
+        self._tasks = self._results = None
+        self._done = {}          # 순서 맞추기용: 번호 → 결과
+        self._tags = {}          # 번호 → submit 때 같이 준 값 (원본 프레임 등)
+        self._next = 1           # ordered: 다음에 내보낼 번호
+        self._last = 0           # 마지막으로 내보낸 번호
+        self._lock = threading.Lock()
+
+    def start(self, shape, dtype=np.uint8, fmt="RGB888", timeout=60.0):
+        """첫 프레임 모양을 알고 나서 슬롯과 프로세스를 만든다. 모델 로딩까지 기다림"""
+        shape = (self.slots,) + tuple(shape)
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._frames = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        for slot in range(self.slots):
+            self._free.put(slot)
+
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        for _ in range(self.workers):
+            p = self._ctx.Process(
+                target=_worker, daemon=True,
+                args=(self._shm.name, shape, np.dtype(dtype).str, fmt, self._tasks,
+                      self._results, self.factory, self.hands_kwargs))
+            p.start()
+            self._procs.append(p)
+        deadline = time.perf_counter() + timeout
+        ready = 0
+        while ready < self.workers:  # 모델 로딩이 끝났다는 "ready" 를 모두 받을 때까지
+            try:
+                self._results.get(timeout=0.5)
+                ready += 1
+            except queue.Empty:
+                dead = [p.exitcode for p in self._procs if not p.is_alive()]
+                if dead or time.perf_counter() > deadline:
+                    self.close()
+                    raise RuntimeError(f"추론 작업 프로세스 시작 실패 (exit {dead})")
+
+    @property
+    def started(self):
+        return self._shm is not None
+
+    def submit(self, frame, tag=None, timeout=None):
+        """프레임을 빈 슬롯에 복사하고 번호를 돌려준다. 슬롯이 없으면 기다림 (None = 시간 초과)
+
+        tag 는 결과와 함께 get() 에서 그대로 돌려받는다.
+        """
+        try:
+            slot = self._free.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        np.copyto(self._frames[slot], frame)
+        with self._lock:
+            self.submitted += 1
+            seq = self.submitted
+            self._tags[seq] = tag
+        self._tasks.put((seq, slot))
+        return seq
+
+    def get(self, timeout=None):
+        """(번호, tag, HandResult) 하나. 시간 안에 없으면 None
+
+        작업 프로세스가 죽으면 RuntimeError (그 프로세스가 맡은 번호는 영영 오지 않는다).
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            ready = self._pop_ready()
+            if ready is not None:
+                return ready
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                # 오래 막혀 있지 않도록 나눠 기다리며 작업 프로세스가 살아 있는지 본다
+                got = self._results.get(timeout=min(remaining or 0.5, 0.5))
+            except queue.Empty:
+                self._check_workers()
+                continue
+            seq, slot, landmarks, is_left, elapsed = got
+            self._free.put(slot)  # 결과가 왔으면 슬롯은 바로 재사용 가능
+            self.completed += 1
+            self.busy += elapsed
+            if seq <= self._last:  # ordered=False 에서 더 새 결과가 이미 나감
+                self.stale += 1
+                self._pop_tag(seq)
+                continue
+            self._done[seq] = result_from_arrays(landmarks, is_left)
+
+    def _check_workers(self):
+        dead = [p.exitcode for p in self._procs if not p.is_alive()]
+        if dead:
+            raise RuntimeError(f"추론 작업 프로세스가 죽었다 (exit {dead}, "
+                               f"처리 중 {self.in_flight()} 프레임)")
+
+    def _pop_tag(self, seq):
+        with self._lock:
+            return self._tags.pop(seq, None)
+
+    def _pop_ready(self):
+        if self.ordered:
+            if self._next in self._done:
+                seq = self._next
+                self._next += 1
+                self._last = seq
+                return seq, self._pop_tag(seq), self._done.pop(seq)
+            return None
+        if not self._done:
+            return None
+        seq = max(self._done)
+        result = self._done.pop(seq)
+        for old in self._done:  # 더 새 결과가 이미 나왔으므로 버림
+            self.stale += 1
+            self._pop_tag(old)
+        self._done.clear()
+        self._last = seq
+        return seq, self._pop_tag(seq), result
+
+    @property
+    def last(self):
+        """마지막으로 내보낸 번호 (그 이하 프레임은 더 이상 결과가 오지 않는다)"""
+        return self._last
+
+    def in_flight(self):
+        return self.submitted - self.completed
+
+    def stats(self):
+        return {"workers": self.workers, "submitted": self.submitted,
+                "completed": self.completed, "stale": self.stale,
+                "busy_ms": round(self.busy * 1000, 1)}
+
+    def close(self):
+        if self._tasks is not None:
+            for _ in self._procs:
+                self._tasks.put(None)
+        for p in self._procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        self._procs = []
+        if self._shm is not None:
+            self._frames = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class PooledCamera:
+    """카메라 + 추론 풀: read() 는 추론이 끝난 프레임을 순서대로 (또는 최신만) 돌려준다"""
+
+    def __init__(self, camera, pool):
+        self.camera = camera
+        self.pool = pool
+        # id(프레임) → 결과. Pipeline 큐에서 버려진 프레임 몫이 쌓이지 않게 개수를 제한
+        self._results = collections.OrderedDict()
+        self._feeder = None
+        self._eof = threading.Event()
+        self._ready = threading.Event()  # 풀이 뜨거나 카메라가 끝나면 set
+        self._stopping = False
+        self._t_capture = None           # read() 가 마지막으로 돌려준 프레임의 캡처 시각
+
+    @property
+    def normalizer(self):
+        return self.camera.normalizer
+
+    def start(self):
+        self.camera.start()
+        self._eof.clear()
+        self._stopping = False
+        self._feeder = threading.Thread(target=self._feed, name="pool-feed", daemon=True)
+        self._feeder.start()
+
+    def _feed(self):
+        try:
+            while not self._stopping:
+                frame = self.camera.read()
+                if frame is None:
+                    break
+                t_capture = frame_time(self.camera, frame)
+                if not self.pool.started:
+                    self.pool.start(frame.shape, frame.dtype, self.camera.normalizer.fmt)
+                    self._ready.set()
+                while not self._stopping:
+                    if self.pool.submit(frame, tag=(frame, t_capture), timeout=0.1) is not None:
+                        break
+        finally:
+            self._eof.set()
+            self._ready.set()
+
+    def read(self):
+        self._ready.wait()
+        if not self.pool.started:
+            return None
+        while True:
+            got = self.pool.get(timeout=0.1)
+            if got is None:
+                if self._eof.is_set() and self.pool.in_flight() == 0:
+                    return None
+                continue
+            _, (frame, self._t_capture), result = got
+            self._results[id(frame)] = result
+            while len(self._results) > 64:
+                self._results.popitem(last=False)
+            return frame
+
+    def capture_time(self, frame):
+        return self._t_capture
+
+    def result_of(self, frame):
+        return self._results.pop(id(frame), None)
+
+    def stop(self):
+        self._stopping = True
+        if self._feeder is not None:
+            self._feeder.join(timeout=2)
+        self.camera.stop()
+        self.pool.close()
+
+
+class PooledDetector:
+    """PooledCamera 가 이미 계산한 결과를 돌려주는 검출기"""
+
+    def __init__(self, camera):
+        self.camera = camera
+
+    def detect(self, frame):
+        # 결과 목록에서 밀려난 프레임 (Pipeline 큐에 64 장 넘게 쌓인 경우) 은 손 없음으로
+        result = self.camera.result_of(frame)
+        return HandResult() if result is None else result
+
+    def stats(self):
+        return self.camera.pool.stats()
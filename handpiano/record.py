@@ -0,0 +1,205 @@
+"""카메라 세션 녹화 / 재생
+
+녹화 폴더 구성
+    meta.json      : 크기, 프레임 포맷, fps, 프레임 저장 방식, 프레임 수, (분류기 학습용) 라벨
+    frames.avi     : (video) MJPEG 로 압축한 BGR 프레임
+    frames.raw     : (raw)   카메라 원본 프레임을 그대로 이어 붙인 파일
+    landmarks.npz  : t (N,), seq (N,), landmarks (N, 손, 21, 3), is_left (N, 손),
+                     finger_count (N,)   ─ 손이 없는 자리는 NaN / False
+
+재생은 두 가지로 쓸 수 있다.
+    ReplayCamera   : 녹화 프레임을 카메라처럼 다시 흘려보냄 (실시간 또는 최대 속도)
+    ReplayDetector : MediaPipe 대신 녹화된 랜드마크를 결과로 돌려줌
+    load_session   : 랜드마크 배열만 읽어 count / 필터 / 음 로직을 PC 에서 벤치마크
+"""
+import collections
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+from handpiano.frames import FrameNormalizer
+from handpiano.results import result_from_arrays
+
+FRAME_MODES = ("video", "raw", "none")
+
+
+class SessionRecorder:
+    """파이프라인 item(frame, t_capture, landmarks, is_left, finger_count)을 디스크에 남긴다"""
+
+    def __init__(self, path, camera, frames="video", fps=30, max_hands=2, label=None):
+        if frames not in FRAME_MODES:
+            raise ValueError(f"알 수 없는 프레임 저장 방식: {frames}")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.camera = camera  # normalizer 는 camera.start() 뒤에 생길 수 있다
+        self.frames = frames
+        self.fps = fps
+        self.max_hands = max_hands
+        self.label = label    # 녹화 내내 든 손 모양의 정답 (classifier 학습용)
+        self.shape = None
+        self._writer = None
+        self._raw = None
+        self._t, self._seq, self._lm, self._left, self._count = [], [], [], [], []
+
+    def add(self, item):
+        frame = item["frame"]
+        if self.shape is None:
+            self.shape = frame.shape
+            self._open(frame)
+        if self.frames == "video":
+            self._writer.write(self.camera.normalizer.to_bgr(frame))
+        elif self.frames == "raw":
+            self._raw.write(np.ascontiguousarray(frame).tobytes())
+
+        lm = np.full((self.max_hands, 21, 3), np.nan, dtype=np.float32)
+        left = np.zeros(self.max_hands, dtype=bool)
+        landmarks = item.get("landmarks")
+        if landmarks is not None and len(landmarks):
+            n = min(len(landmarks), self.max_hands)
+            lm[:n] = landmarks[:n]
+            left[:n] = item["is_left"][:n]
+        self._t.append(item["t_capture"])
+        self._seq.append(item.get("seq", len(self._seq) + 1))
+        self._lm.append(lm)
+        self._left.append(left)
+        self._count.append(item.get("finger_count", -1))
+
+    def _open(self, frame):
+        height, width = frame.shape[:2]
+        if self.frames == "video":
+            fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+            self._writer = cv2.VideoWriter(os.path.join(self.path, "frames.avi"),
+                                           fourcc, self.fps, (width, height))
+        elif self.frames == "raw":
+            self._raw = open(os.path.join(self.path, "frames.raw"), "wb")
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.release()
+        if self._raw is not None:
+            self._raw.close()
+
+        t = np.array(self._t, dtype=np.float64)
+        np.savez_compressed(
+            os.path.join(self.path, "landmarks.npz"),
+            t=t - t[0] if len(t) else t,
+            seq=np.array(self._seq, dtype=np.int64),
+            landmarks=np.array(self._lm, dtype=np.float32).reshape(-1, self.max_hands, 21, 3),
+            is_left=np.array(self._left, dtype=bool).reshape(-1, self.max_hands),
+            finger_count=np.array(self._count, dtype=np.int16),
+        )
+        # video 는 BGR 로 저장되므로 재생 포맷도 BGR(= RGB888)
+        fmt = "RGB888" if self.frames == "video" else self.camera.normalizer.fmt
+        meta = {
+            "frames": self.frames,
+            "count": len(self._t),
+            "shape": list(self.shape) if self.shape else None,
+            "format": fmt,
+            "fps": self.fps,
+            "label": self.label,
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+
+def load_session(path):
+    """meta 와 landmarks.npz 배열을 dict 하나로"""
+    with open(os.path.join(path, "meta.json")) as f:
+        session = json.load(f)
+    with np.load(os.path.join(path, "landmarks.npz")) as data:
+        session.update({key: data[key] for key in data.files})
+    return session
+
+
+class ReplayCamera:
+    """녹화 폴더를 카메라처럼 읽는다
+
+    realtime=True 면 녹화된 시각 간격을 지키고, False 면 최대 속도로 흘려보낸다.
+    어느 쪽이든 capture_time() 은 녹화된 시각 (start() 기준) 을 돌려주므로
+    dwell 필터 / One-Euro 처럼 시각을 쓰는 단계가 녹화 때와 같은 결과를 낸다.
+    (최대 속도 재생에서는 캡처 시각이 실제 시각보다 앞서 가므로 지연 지표는 의미 없다)
+    프레임을 저장하지 않은 녹화(none)는 검은 프레임을 돌려준다.
+    """
+
+    def __init__(self, path, realtime=True):
+        self.path = path
+        self.realtime = realtime
+        self.session = load_session(path)
+        self.normalizer = FrameNormalizer(self.session["format"])
+        self.index = -1  # 마지막으로 읽은 프레임 번호
+        # 파이프라인에서는 검출이 캡처보다 늦으므로 프레임 객체 → 번호를 따로 기억
+        self._indices = collections.OrderedDict()
+        self._cap = None
+        self._raw = None
+        self._blank = None
+        self._t0 = None
+
+    def start(self):
+        self.index = -1
+        self._t0 = time.perf_counter()
+        shape = tuple(self.session["shape"] or (480, 640, 3))
+        mode = self.session["frames"]
+        if mode == "video":
+            self._cap = cv2.VideoCapture(os.path.join(self.path, "frames.avi"))
+        elif mode == "raw":
+            self._raw = np.memmap(os.path.join(self.path, "frames.raw"), dtype=np.uint8,
+                                  mode="r", shape=(self.session["count"],) + shape)
+        else:
+            self._blank = np.zeros(shape, dtype=np.uint8)
+
+    def read(self):
+        i = self.index + 1
+        if i >= self.session["count"]:
+            return None
+        if self.realtime:
+            delay = self._t0 + float(self.session["t"][i]) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        if self._cap is not None:
+            ret, frame = self._cap.read()
+            if not ret:
+                return None
+        elif self._raw is not None:
+            frame = np.array(self._raw[i])
+        else:
+            frame = self._blank.copy()
+        self.index = i
+        self._indices[id(frame)] = i
+        while len(self._indices) > 64:  # 큐에서 버려진 프레임 몫
+            self._indices.popitem(last=False)
+        return frame
+
+    def index_of(self, frame):
+        """read() 가 돌려준 프레임의 녹화 번호"""
+        return self._indices.pop(id(frame), self.index)
+
+    def capture_time(self, frame):
+        """녹화된 캡처 시각을 start() 시각 기준 perf_counter 로 옮긴 값"""
+        i = self._indices.get(id(frame), self.index)
+        return self._t0 + float(self.session["t"][i])
+
+    def stop(self):
+        if self._cap is not None:
+            self._cap.release()
+        self._raw = None
+
+
+class ReplayDetector:
+    """MediaPipe 대신 녹화된 랜드마크를 돌려주는 검출기 (ReplayCamera 와 짝)"""
+
+    def __init__(self, camera):
+        self.camera = camera
+        self.processed = 0
+
+    def detect(self, frame):
+        session = self.camera.session
+        i = self.camera.index_of(frame)
+        self.processed += 1
+        return result_from_arrays(session["landmarks"][i], session["is_left"][i])
+
+    def stats(self):
+        return {"processed": self.processed}
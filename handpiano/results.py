@@ -0,0 +1,71 @@
+"""MediaPipe Hands 결과와 같은 모양의 가벼운 객체
+
+녹화 재생, 합성 랜드마크처럼 MediaPipe 를 돌리지 않고 결과만 흉내 낼 때 쓴다.
+result.multi_hand_landmarks[i].landmark[j].x / y / z,
+result.multi_handedness[i].classification[0].label 로 읽을 수 있고,
+mp_drawing.draw_landmarks 에도 그대로 넘길 수 있다.
+"""
+import numpy as np
+
+
+class Landmark:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def HasField(self, name):
+        # draw_landmarks 가 visibility / presence 를 확인할 때 쓴다 (없음)
+        return False
+
+
+class HandLandmarks:
+    __slots__ = ("landmark",)
+
+    def __init__(self, points):
+        self.landmark = [Landmark(x, y, z) for x, y, z in points]
+
+
+class Classification:
+    __slots__ = ("label", "score", "index")
+
+    def __init__(self, label, score=1.0):
+        self.label = label
+        self.score = score
+        self.index = 0 if label == "Left" else 1
+
+
+class Handedness:
+    __slots__ = ("classification",)
+
+    def __init__(self, label, score=1.0):
+        self.classification = [Classification(label, score)]
+
+
+class HandResult:
+    """hands.process() 결과 대용. 손이 없으면 두 목록 모두 None
+
+    t_capture : 결과를 낸 프레임의 캡처 시각. 결과가 늦게 오는 검출기(tasks)만 채운다
+    """
+
+    __slots__ = ("multi_hand_landmarks", "multi_handedness", "t_capture")
+
+    def __init__(self, multi_hand_landmarks=None, multi_handedness=None, t_capture=None):
+        self.multi_hand_landmarks = multi_hand_landmarks or None
+        self.multi_handedness = multi_handedness or None
+        self.t_capture = t_capture
+
+
+def result_from_arrays(landmarks, is_left, scores=None):
+    """(손, 21, 3) 배열 + 왼손 여부 → HandResult. NaN 으로 채운 손은 빠진다"""
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    hands, handedness = [], []
+    for i, hand in enumerate(landmarks):
+        if np.isnan(hand).any():
+            continue
+        hands.append(HandLandmarks(hand.tolist()))
+        score = 1.0 if scores is None else float(scores[i])
+        handedness.append(Handedness("Left" if is_left[i] else "Right", score))
+    return HandResult(hands, handedness)
@@ -0,0 +1,134 @@
+"""마지막 손 위치 주변만 잘라서 추론하는 ROI 검출기
+
+손을 한 번 찾으면 다음 프레임은 이전 랜드마크를 감싸는 정사각형(여백 포함)만
+잘라 작은 고정 크기로 줄인 뒤 MediaPipe 에 넘긴다.
+결과 랜드마크는 전체 프레임 좌표로 되돌려 놓으므로 뒤 단계는 차이를 모른다.
+ROI 안에서 손을 놓치면 같은 프레임을 전체 크기로 다시 검출한다.
+
+잘라낸 이미지는 전체 프레임과 좌표계가 다르므로 전체 프레임용 Hands 와 추적 상태를 섞지 않도록
+crop_hands (별도 인스턴스) 로 검출한다. crop_hands 는 추적 모드로 둔다: ROI 가 매 프레임
+손을 가운데에 두고 따라가므로 잘라낸 이미지 안에서 손은 거의 안 움직이고, MediaPipe 가
+이전 랜드마크로 추적을 이어 가 손바닥 검출을 건너뛴다. static_image_mode=True 로 두면
+ROI 프레임마다 손바닥 검출을 다시 돌려 전체 프레임 추적 모드보다 느려질 수 있다
+(benchmarks/bench_roi.py 로 비교).
+
+ROI 는 이미 찾은 손만 감싸므로 그 밖에서 새로 들어온 손은 보이지 않는다.
+찾은 손이 max_hands 보다 적으면 full_every 프레임마다 한 번은 전체 프레임을 본다.
+
+작은 이미지만 변환 / 복사하므로 색 변환과 MediaPipe 입력 준비 비용이 크게 준다.
+"""
+import cv2
+import numpy as np
+
+from handpiano.frames import FrameNormalizer
+
+
+class RoiDetector:
+    """HandDetector 를 감싸 ROI 추론을 한다
+
+    crop_hands : ROI 전용 Hands (전체 프레임용과 따로 만든 추적 모드 인스턴스)
+    size       : ROI 를 줄일 한 변 크기 (px)
+    pad        : 손 bounding box 에 더할 여백 (변 길이 대비 비율, 양쪽 각각)
+    min_side   : ROI 정사각형의 최소 한 변 (원본 px)
+    max_hands  : 찾을 손 개수 (Hands 의 max_num_hands 와 같게)
+    full_every : 손이 max_hands 보다 적을 때 이 프레임 수마다 전체 프레임을 본다
+    """
+
+    def __init__(self, detector, crop_hands, size=256, pad=0.5, min_side=128, max_hands=1,
+                 full_every=15):
+        self.detector = detector
+        self.crop_hands = crop_hands
+        self.size = size
+        self.pad = pad
+        self.min_side = min_side
+        self.max_hands = max_hands
+        self.full_every = full_every
+        self.roi = None          # (x0, y0, side) 원본 px
+        self.roi_frames = 0      # ROI 에서 손을 찾은 프레임
+        self.full_frames = 0
+        self.forced_full = 0     # 손이 모자라서 ROI 대신 전체 프레임을 본 횟수
+        self.roi_inferences = 0  # ROI 추론 횟수 (놓쳐서 전체 프레임을 다시 본 경우 포함)
+        self._hands = 0          # 마지막 결과의 손 개수
+        self._since_full = 0     # 마지막 전체 프레임 추론 뒤 지난 프레임
+        self._normalizer = None  # ROI 전용 (RGB 버퍼 크기가 고정되도록 따로 둔다)
+        self._small = None
+
+    def _next_roi(self, result, width, height):
+        """이전 결과의 랜드마크를 감싸는 정사각형. 프레임보다 커지면 None"""
+        if not result.multi_hand_landmarks:
+            return None
+        xs = [p.x for hand in result.multi_hand_landmarks for p in hand.landmark]
+        ys = [p.y for hand in result.multi_hand_landmarks for p in hand.landmark]
+        x_min, x_max = min(xs) * width, max(xs) * width
+        y_min, y_max = min(ys) * height, max(ys) * height
+
+        side = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.pad)
+        side = int(max(side, self.min_side))
+        if side >= min(width, height):
+            return None
+        cx, cy = (x_min + x_max) / 2, (y_min + y_max) / 2
+        x0 = int(np.clip(cx - side / 2, 0, width - side))
+        y0 = int(np.clip(cy - side / 2, 0, height - side))
+        return x0, y0, side
+
+    def _detect_roi(self, frame):
+        x0, y0, side = self.roi
+        height, width = frame.shape[:2]
+        if self._normalizer is None:
+            self._normalizer = FrameNormalizer(self.detector.camera.normalizer.fmt)
+
+        # 원본 배치 그대로 작게 줄인 뒤 변환 → 변환은 size x size 픽셀만
+        crop = frame[y0:y0 + side, x0:x0 + side]
+        self._small = cv2.resize(crop, (self.size, self.size), dst=self._small,
+                                 interpolation=cv2.INTER_LINEAR)
+        result = self.crop_hands.process(self._normalizer.to_rgb(self._small))
+        self.roi_inferences += 1
+        if not result.multi_hand_landmarks:
+            return None
+
+        # ROI 정규화 좌표 → 전체 프레임 정규화 좌표
+        sx, sy = side / width, side / height
+        ox, oy = x0 / width, y0 / height
+        for hand in result.multi_hand_landmarks:
+            for p in hand.landmark:
+                p.x = ox + p.x * sx
+                p.y = oy + p.y * sy
+                p.z = p.z * sx
+        return result
+
+    def reset(self):
+        """ROI 는 원본 px 좌표라 프레임 크기가 바뀌면 (거버너 축소) 전체 프레임부터 다시"""
+        self.roi = None
+
+    def detect(self, frame):
+        result = None
+        if self.roi is not None:
+            if self._hands < self.max_hands and self._since_full >= self.full_every:
+                self.forced_full += 1  # ROI 밖에 새 손이 있는지 확인
+            else:
+                result = self._detect_roi(frame)
+                if result is not None:
+                    self.roi_frames += 1
+
+        if result is None:  # 처음 / ROI 에서 놓침 / 손이 모자람 → 전체 프레임
+            result = self.detector.detect(frame)
+            self.full_frames += 1
+            self._since_full = 0
+        else:
+            self._since_full += 1
+
+        self._hands = len(result.multi_hand_landmarks or ())
+        height, width = frame.shape[:2]
+        self.roi = self._next_roi(result, width, height)
+        return result
+
+    def stats(self):
+        stats = dict(self.detector.stats())
+        # 안쪽 HandDetector 는 전체 프레임 추론만 센다
+        stats["processed"] = stats.get("processed", 0) + self.roi_inferences
+        stats.update(roi_frames=self.roi_frames, full_frames=self.full_frames,
+                     forced_full=self.forced_full)
+        return stats
+
+    def close(self):
+        self.crop_hands.close()
@@ -0,0 +1,188 @@
+"""pipi 게임 채점 엔진: 캡처 시각 기준 판정
+
+예전 check_answer 는 맞는 손가락 수를 들고 있는 프레임마다 +10 이라
+점수가 프레임 속도와 처리 지연에 따라 달라졌다. 여기서는
+    - 채보(chart): (시각, 음) 목록을 미리 정해 두고
+    - 손가락 개수가 바뀐 "첫 프레임"의 캡처 시각(t_capture) 을 손동작 시작으로 보고
+    - 그 시각 - latency_offset 과 목표 시각의 차이로 perfect / good / miss 를 정한다.
+점수는 프레임 수가 아니라 손동작 시각에만 달려 있으므로 녹화 랜드마크로 똑같이 재현된다.
+
+    python -m handpiano.scoring --session DIR [--chart chart.json] [--latency-offset 0.08]
+"""
+import argparse
+import json
+import random
+
+PERFECT = 0.10   # 초. |차이| 가 이 안이면 perfect
+GOOD = 0.25      # 이 안이면 good, 목표 시각 + GOOD 까지 못 맞추면 miss
+POINTS = {"perfect": 100, "good": 50, "miss": 0}
+
+
+class ChartNote:
+    __slots__ = ("time", "note", "grade", "error")
+
+    def __init__(self, time, note):
+        self.time = time      # 게임 시작 기준 목표 시각 (초)
+        self.note = note      # 손가락 개수 (NOTE_FREQ 키)
+        self.grade = None     # 판정 전에는 None
+        self.error = None     # 손동작 시각 - 목표 시각 (초, 보정 후)
+
+    def as_dict(self):
+        return {"time": self.time, "note": self.note}
+
+
+class Chart:
+    """목표 음 목록 (시각 순)"""
+
+    def __init__(self, notes):
+        self.notes = sorted(notes, key=lambda n: n.time)
+
+    @classmethod
+    def random(cls, count=20, interval=3.0, lead_in=2.0, notes=(1, 2, 3, 4, 5), seed=None):
+        """interval 초마다 하나씩 (한 손으로 낼 수 있는 1~5 손가락). seed 를 주면 항상 같다"""
+        rng = random.Random(seed)
+        return cls([ChartNote(lead_in + i * interval, rng.choice(notes)) for i in range(count)])
+
+    @classmethod
+    def load(cls, path):
+        """[{"time": 초, "note": 손가락 수}, ...] JSON"""
+        with open(path) as f:
+            return cls([ChartNote(float(n["time"]), int(n["note"])) for n in json.load(f)])
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump([n.as_dict() for n in self.notes], f, indent=1)
+
+    @property
+    def end(self):
+        return self.notes[-1].time + GOOD if self.notes else 0.0
+
+
+class ScoringEngine:
+    """프레임마다 update(손가락 개수, 캡처 시각) → 새로 내려진 판정 목록
+
+    latency_offset : 손동작이 캡처 시각에 찍히기까지 늘 생기는 지연 (스무딩 필터 등).
+                     판정할 때 손동작 시각에서 이만큼 뺀다.
+    """
+
+    def __init__(self, chart, latency_offset=0.0, perfect=PERFECT, good=GOOD):
+        self.chart = chart
+        self.latency_offset = latency_offset
+        self.perfect = perfect
+        self.good = good
+        self.t0 = None          # 게임 시작 캡처 시각
+        self.score = 0
+        self.combo = 0
+        self.max_combo = 0
+        self.counts = {grade: 0 for grade in POINTS}
+        self._prev = None       # 직전 프레임 손가락 개수
+        self._next = 0          # 아직 miss 처리 안 된 첫 음 번호
+
+    def start(self, t0):
+        self.t0 = t0
+
+    def elapsed(self, t):
+        return t - self.t0
+
+    def update(self, fingers, t):
+        if self.t0 is None:
+            self.start(t)
+        now = self.elapsed(t)
+        judged = []
+
+        if fingers != self._prev:
+            self._prev = fingers
+            note = self._match(fingers, now - self.latency_offset)
+            if note is not None:
+                judged.append(note)
+
+        # 창이 지나도록 못 맞춘 음은 miss
+        notes = self.chart.notes
+        while self._next < len(notes) and notes[self._next].time + self.good < now - self.latency_offset:
+            note = notes[self._next]
+            if note.grade is None:
+                self._grade(note, "miss", None)
+                judged.append(note)
+            self._next += 1
+        return judged
+
+    def _match(self, fingers, onset):
+        """onset 에 가장 가까운, 아직 판정 안 된 같은 음 (창 안에 있을 때만)"""
+        best = None
+        for note in self.chart.notes[self._next:]:
+            if note.time - self.good > onset:
+                break
+            if note.grade is None and note.note == fingers:
+                if best is None or abs(note.time - onset) < abs(best.time - onset):
+                    best = note
+        if best is None or abs(best.time - onset) > self.good:
+            return None
+        error = onset - best.time
+        self._grade(best, "perfect" if abs(error) <= self.perfect else "good", error)
+        return best
+
+    def _grade(self, note, grade, error):
+        note.grade = grade
+        note.error = error
+        self.counts[grade] += 1
+        self.score += POINTS[grade]
+        self.combo = self.combo + 1 if grade != "miss" else 0
+        self.max_combo = max(self.max_combo, self.combo)
+
+    def target(self, t, lead=1.5):
+        """t 시점에 화면에 보여줄 음: 목표 시각 lead 초 전부터 판정될 때까지. 없으면 None"""
+        now = self.elapsed(t) if self.t0 is not None else 0.0
+        for note in self.chart.notes[self._next:]:
+            if note.time - lead > now:
+                return None
+            if note.grade is None:
+                return note
+        return None
+
+    @property
+    def finished(self):
+        return self._next >= len(self.chart.notes)
+
+    def summary(self):
+        errors = [n.error for n in self.chart.notes if n.error is not None]
+        mean = sum(errors) / len(errors) if errors else 0.0
+        return {"score": self.score, "max_combo": self.max_combo, **self.counts,
+                "mean_error_ms": round(mean * 1000, 1)}
+
+
+def replay_session(session, chart, latency_offset=0.0, counts=None):
+    """녹화 세션의 (t, finger_count) 로 채점. 같은 입력이면 항상 같은 결과
+
+    counts 를 주면 저장된 finger_count 대신 쓴다 (다른 분류기 / 스무딩 비교용).
+    """
+    counts = session["finger_count"] if counts is None else counts
+    engine = ScoringEngine(chart, latency_offset)
+    engine.start(float(session["t"][0]) if len(session["t"]) else 0.0)
+    for fingers, t in zip(counts.tolist(), session["t"].tolist()):
+        engine.update(fingers, t)
+    # 녹화가 채보보다 짧으면 남은 음은 miss
+    engine.update(engine._prev, engine.t0 + chart.end + engine.latency_offset + 1e-9)
+    return engine
+
+
+def main(argv=None):
+    from handpiano.record import load_session
+
+    parser = argparse.ArgumentParser(description="녹화 세션으로 pipi 게임 채점 재현")
+    parser.add_argument("--session", required=True, help="--record 로 남긴 폴더")
+    parser.add_argument("--chart", default=None, help="채보 JSON (없으면 --chart-seed 로 랜덤)")
+    parser.add_argument("--chart-seed", type=int, default=0)
+    parser.add_argument("--latency-offset", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    session = load_session(args.session)
+    chart = Chart.load(args.chart) if args.chart else Chart.random(seed=args.chart_seed)
+    engine = replay_session(session, chart, args.latency_offset)
+    for note in chart.notes:
+        error = "" if note.error is None else f"{note.error * 1000:+.0f} ms"
+        print(f"{note.time:7.2f}s  {note.note}  {note.grade:<8} {error}")
+    print(engine.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""손가락 개수 / 랜드마크 시간 필터
+
+count_fingers 결과는 매 프레임 새로 계산되므로 한 프레임만 흔들려도 음이 바뀐다.
+여기 필터들은 count_fingers 와 부저 사이에 끼워서 그런 깜빡임을 걸러낸다.
+
+    none          : 그대로 통과
+    majority:N    : 최근 N 프레임 다수결. 바뀐 값이 N//2+1 프레임 이어져야 반영
+    dwell:SEC     : 새 값이 SEC 초 이상 유지돼야 반영
+    OneEuroFilter : 랜드마크 좌표 자체를 부드럽게 (count 전에 적용)
+
+개수 필터는 원래 값이 바뀐 시각부터 출력이 따라 바뀐 시각까지를 재서
+추가 지연(latencies)으로 남긴다.
+"""
+import collections
+import math
+
+import numpy as np
+
+
+class CountFilter:
+    """개수 필터 공통: update(value, t) → 걸러진 값, 추가 지연 기록"""
+
+    def __init__(self):
+        self.value = 0
+        self.latencies = collections.deque(maxlen=1000)  # 출력이 바뀔 때마다 추가 지연 (초)
+        self._raw = None
+        self._raw_since = 0.0
+
+    def update(self, value, t):
+        if value != self._raw:
+            self._raw, self._raw_since = value, t
+        out = self._filter(value, t)
+        if out != self.value:
+            if out == self._raw:
+                self.latencies.append(t - self._raw_since)
+            self.value = out
+        return out
+
+    def _filter(self, value, t):
+        return value
+
+    def reset(self):
+        self.value = 0
+        self._raw = None
+
+
+class PassThrough(CountFilter):
+    """필터 없음"""
+
+
+class MajorityFilter(CountFilter):
+    """최근 window 프레임 다수결 (동점이면 지금 값 유지)"""
+
+    def __init__(self, window=5):
+        super().__init__()
+        self.window = window
+        self._recent = collections.deque(maxlen=window)
+
+    def _filter(self, value, t):
+        self._recent.append(value)
+        counts = collections.Counter(self._recent)
+        best, n = counts.most_common(1)[0]
+        if counts.get(self.value, 0) == n:
+            return self.value
+        return best
+
+    def reset(self):
+        super().reset()
+        self._recent.clear()
+
+
+class DwellFilter(CountFilter):
+    """새 값이 dwell 초 이상 이어질 때만 바꾼다"""
+
+    def __init__(self, dwell=0.1):
+        super().__init__()
+        self.dwell = dwell
+        self._candidate = None
+        self._since = 0.0
+
+    def _filter(self, value, t):
+        if value == self.value:
+            self._candidate = None
+            return self.value
+        if value != self._candidate:
+            self._candidate, self._since = value, t
+        if t - self._since >= self.dwell:
+            return value
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._candidate = None
+
+
+def make_filter(spec="none"):
+    """"none" / "majority:5" / "dwell:0.1" 문자열로 필터 만들기"""
+    name, _, arg = spec.partition(":")
+    if name == "none":
+        return PassThrough()
+    if name == "majority":
+        return MajorityFilter(int(arg or 5))
+    if name == "dwell":
+        return DwellFilter(float(arg or 0.1))
+    raise ValueError(f"알 수 없는 필터: {spec}")
+
+
+class OneEuroFilter:
+    """랜드마크 배열용 One-Euro 필터 (Casiez et al. 2012)
+
+    천천히 움직일 때는 강하게, 빠르게 움직일 때는 약하게 걸러서
+    떨림은 줄이고 빠른 동작의 지연은 작게 유지한다.
+    손 개수가 바뀌면 새로 시작한다.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.05, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._dx = None
+        self._t = None
+
+    @staticmethod
+    def _alpha(dt, cutoff):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, x, t):
+        x = np.asarray(x, dtype=np.float32)
+        if self._x is None or self._x.shape != x.shape or t < self._t:
+            self._x, self._dx, self._t = x.copy(), np.zeros_like(x), t
+            return self._x
+        if t == self._t:  # 같은 결과가 다시 옴 (tasks 검출기는 새 결과가 없으면 이전 것을 준다)
+            return self._x
+
+        dt = t - self._t
+        dx = (x - self._x) / dt
+        a_d = self._alpha(dt, self.d_cutoff)
+        self._dx = a_d * dx + (1 - a_d) * self._dx
+
+        cutoff = self.min_cutoff + self.beta * np.abs(self._dx)
+        a = self._alpha(dt, cutoff)
+        self._x = a * x + (1 - a) * self._x
+        self._t = t
+        return self._x
+
+
+# -------------------------------
+# 평가: 음 바뀜 횟수와 추가 지연
+# -------------------------------
+def flips_per_second(values, times):
+    values = np.asarray(values)
+    duration = times[-1] - times[0] if len(times) > 1 else 0
+    if duration <= 0:
+        return 0.0
+    return float(np.count_nonzero(values[1:] != values[:-1]) / duration)
+
+
+def evaluate(filt, values, times, budget=0.15):
+    """녹화된 (개수, 시각) 열에 필터를 돌려 전후 비교
+
+    budget: 허용하는 추가 지연 (초). p95 가 이를 넘으면 within_budget=False
+    """
+    filt.reset()
+    filt.latencies.clear()
+    out = [filt.update(v, t) for v, t in zip(values, times)]
+    lat = np.array(filt.latencies) if filt.latencies else np.zeros(1)
+    p95 = float(np.percentile(lat, 95))
+    return {
+        "flips_per_s_raw": round(flips_per_second(values, times), 3),
+        "flips_per_s": round(flips_per_second(out, times), 3),
+        "latency_mean_ms": round(float(lat.mean()) * 1000, 1),
+        "latency_p95_ms": round(p95 * 1000, 1),
+        "latency_max_ms": round(float(lat.max()) * 1000, 1),
+        "within_budget": p95 <= budget,
+    }
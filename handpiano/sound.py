@@ -0,0 +1,123 @@
+"""소리 출력 (sink)
+
+모든 sink 는 play(freq) / stop() / close() 와 동시에 낼 수 있는 음 수 voices 를 제공한다.
+voices 가 2 이상인 sink(handpiano.synth.SynthSink)는 play(freq, voice=i) 로 목소리를 고른다.
+"""
+import time
+
+BUZZER_PIN = 18
+
+
+class NullSink:
+    """아무 소리도 내지 않는 sink (GPIO 없는 PC / 테스트용)"""
+
+    voices = 1
+
+    def play(self, freq):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class PwmBuzzer:
+    """RPi.GPIO 소프트웨어 PWM 부저
+
+    매 프레임 play() / stop() 을 불러도 음이 실제로 바뀔 때만 하드웨어를 건드린다.
+    hold    : 한 음을 낸 뒤 다른 음으로 바꾸기까지 최소 유지 시간 (초)
+    release : 손이 사라져도 이 시간 동안은 소리를 유지 (한두 프레임 놓침 무시)
+    gpio    : RPi.GPIO 대신 쓸 모듈 (예: handpiano.fakegpio.FakeGPIO())
+    """
+
+    voices = 1
+
+    def __init__(self, pin=BUZZER_PIN, duty=50, hold=0.0, release=0.05,
+                 gpio=None, clock=time.monotonic):
+        if gpio is None:
+            import RPi.GPIO as gpio
+
+        self.GPIO = gpio
+        self.duty = duty
+        self.hold = hold
+        self.release = release
+        self.clock = clock
+        gpio.setmode(gpio.BCM)
+        gpio.setup(pin, gpio.OUT)
+        self.pwm = gpio.PWM(pin, 440)
+        self.pwm.stop()
+
+        self.freq = None         # 지금 울리고 있는 주파수 (None = 꺼짐)
+        self.writes = 0          # 실제 PWM 호출 수
+        self._since = 0.0        # 현재 음을 시작한 시각
+        self._release_at = None  # 이 시각이 지나면 끈다
+
+    def play(self, freq):
+        now = self.clock()
+        self._release_at = None
+        if freq == self.freq:
+            return
+        if self.freq is not None and now - self._since < self.hold:
+            return  # 아직 최소 유지 시간 전
+
+        if self.freq is None:
+            # 꺼져 있을 때는 주파수를 먼저 맞추고 켠다 (이전 음이 잠깐 나는 것 방지)
+            self.pwm.ChangeFrequency(freq)
+            self.pwm.start(self.duty)
+            self.writes += 2
+        else:
+            self.pwm.ChangeFrequency(freq)
+            self.writes += 1
+        self.freq = freq
+        self._since = now
+
+    def stop(self):
+        if self.freq is None:
+            return
+        now = self.clock()
+        if self._release_at is None:
+            self._release_at = now + self.release
+        if now >= self._release_at:
+            self._off()
+
+    def _off(self):
+        self.pwm.stop()
+        self.writes += 1
+        self.freq = None
+        self._release_at = None
+
+    def close(self):
+        if self.freq is not None:
+            self._off()
+        self.GPIO.cleanup()
+
+
+def fake_buzzer(**kwargs):
+    """FakeGPIO 위에서 도는 부저 (하드웨어 호출은 sink.GPIO.calls 에 기록)"""
+    from handpiano.fakegpio import FakeGPIO
+
+    return PwmBuzzer(gpio=FakeGPIO(), **kwargs)
+
+
+def synth(output):
+    def open_synth(**kwargs):
+        from handpiano.synth import SynthSink
+
+        return SynthSink(output=output, **kwargs)
+    return open_synth
+
+
+SINKS = {
+    "buzzer": PwmBuzzer,
+    "fake": fake_buzzer,
+    "null": NullSink,
+    "synth": synth("alsa"),
+    "synth-wav": synth("wav"),
+    "synth-null": synth("null"),
+}
+
+
+def open_sink(kind="buzzer", **kwargs):
+    return SINKS[kind](**kwargs)
@@ -0,0 +1,111 @@
+"""시작 시간 줄이기: 카메라 / sink(GPIO) / MediaPipe 로딩을 동시에, 첫 음까지 시간 측정
+
+Pi 에서는 mediapipe import + Hands 생성 + 첫 process(그래프 초기화) 와
+picamera2 import + 카메라 시작이 각각 수 초씩 걸린다. 이걸 차례로 하지 않고
+스레드로 동시에 돌린다. (대부분 C 확장 / 장치 대기라 GIL 에 덜 묶인다)
+
+    startup = Startup()
+    done = startup.parallel(camera=camera.start, sink=open_sink, detector=make_detector)
+    ...
+    startup.mark("first_frame")
+    if startup.mark("first_note"):
+        print(startup.report())
+
+시각은 프로세스 시작(/proc/self/stat) 기준이라 파이썬 자체 import 시간도 들어간다.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+
+def process_start():
+    """프로세스가 시작된 perf_counter 시각 (/proc 가 없으면 지금)"""
+    now = time.perf_counter()
+    try:
+        with open("/proc/self/stat") as f:
+            # comm 에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 센다. starttime 은 22번째 필드
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return now - (uptime - started)
+    except (OSError, ValueError, IndexError):
+        return now
+
+
+class Startup:
+    """시작 단계별 소요 시간과 첫 프레임 / 첫 음 시각"""
+
+    def __init__(self, t0=None):
+        self.t0 = process_start() if t0 is None else t0
+        self.durations = {}  # 작업 이름 → 걸린 시간 (초)
+        self.marks = {}      # 이름 → 프로세스 시작부터 시각 (초)
+
+    def parallel(self, **tasks):
+        """이름=함수 들을 동시에 실행하고 이름 → 반환값. 하나라도 실패하면 그 예외를 다시 던진다"""
+        results, errors = {}, {}
+
+        def run(name, func):
+            t = time.perf_counter()
+            try:
+                results[name] = func()
+            except BaseException as e:  # 메인 스레드에서 다시 던진다
+                errors[name] = e
+            finally:
+                self.durations[name] = time.perf_counter() - t
+
+        threads = [threading.Thread(target=run, args=item, name=f"startup-{item[0]}")
+                   for item in tasks.items()]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.mark("ready")
+        for e in errors.values():
+            raise e
+        return results
+
+    def mark(self, name):
+        """처음 부를 때만 기록하고 True"""
+        if name in self.marks:
+            return False
+        self.marks[name] = time.perf_counter() - self.t0
+        return True
+
+    def report(self):
+        parts = [f"{name} {sec:.2f}s" for name, sec in self.durations.items()]
+        marks = [f"{name} {sec:.2f}s" for name, sec in self.marks.items()]
+        return f"startup: [{', '.join(parts)}] → {', '.join(marks)}"
+
+
+def warm_up(detector, width=640, height=480):
+    """검출기 안쪽 Hands 에 검은 프레임을 한 번 넣어 그래프 / 모델 초기화를 미리 끝낸다
+
+    Hands 가 없고 warm_up(width, height) 을 가진 검출기 (TasksHandDetector) 는 그걸 부른다.
+    """
+    inner = detector
+    while inner is not None:
+        hands = getattr(inner, "hands", None)
+        if hands is not None:
+            hands.process(np.zeros((height, width, 3), dtype=np.uint8))
+            break
+        if hasattr(inner, "warm_up"):
+            inner.warm_up(width, height)
+            break
+        inner = getattr(inner, "detector", None)
+    return detector
+
+
+def close_detector(detector):
+    """검출기 래퍼 체인을 따라 close() 가 있는 것 (TasksHandDetector, Hands 등) 을 닫는다"""
+    closed = set()
+    inner = detector
+    while inner is not None:
+        for obj in (inner, getattr(inner, "hands", None)):
+            close = getattr(obj, "close", None)
+            if close is not None and id(obj) not in closed:
+                closed.add(id(obj))
+                close()
+        inner = getattr(inner, "detector", None)
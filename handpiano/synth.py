@@ -0,0 +1,200 @@
+"""블록 단위 다성(polyphonic) 웨이브테이블 신스
+
+부저는 한 번에 한 음만 낼 수 있어서 together.py 는 왼손 "코드"를 +20Hz 로 흉내 냈다.
+SynthSink 는 목소리(voice)마다 위상과 AR 엔벨로프를 따로 가지고,
+고정 크기 블록을 NumPy 로 한 번에 계산해 섞는다 (목소리 × 블록 2차원 배열).
+
+    sink.play(freq, voice=0) / sink.stop(voice=None → 전부) / sink.close()
+
+출력
+    alsa : sounddevice(PortAudio → ALSA) 콜백. 블록 크기 = 콜백 크기라 지연이 일정하다
+    wav  : WAV 파일 (실시간 속도로 렌더해 손 동작과 시간이 맞는다)
+    null : 렌더만 하고 버림 (벤치마크 / 테스트)
+
+카메라 스레드는 이벤트를 deque 에 넣기만 하고, 오디오 쪽이 블록 시작 때 꺼내 반영한다.
+"""
+import collections
+import threading
+import time
+import wave
+
+import numpy as np
+
+WAVEFORMS = ("sine", "triangle", "square", "organ")
+
+
+def make_wavetable(kind="sine", size=2048):
+    """한 주기 파형 (끝에 첫 샘플을 하나 더 붙여 선형 보간 때 경계 검사가 없게)"""
+    phase = np.arange(size) / size
+    if kind == "sine":
+        table = np.sin(2 * np.pi * phase)
+    elif kind == "triangle":
+        table = 1 - 4 * np.abs(phase - 0.5)
+    elif kind == "square":
+        # 대역 제한: 홀수 배음 합으로 만든다 (계단 파형의 앨리어싱 방지)
+        table = sum(np.sin(2 * np.pi * k * phase) / k for k in range(1, 16, 2)) * 4 / np.pi
+    elif kind == "organ":
+        table = sum(np.sin(2 * np.pi * k * phase) * g
+                    for k, g in ((1, 1.0), (2, 0.5), (3, 0.25), (4, 0.125)))
+        table /= np.abs(table).max()
+    else:
+        raise ValueError(f"알 수 없는 파형: {kind}")
+    return np.append(table, table[0]).astype(np.float32)
+
+
+class Synth:
+    """목소리 max_voices 개를 블록 단위로 렌더링
+
+    attack / release : 엔벨로프 상승 / 하강 시간 (초)
+    gain             : 전체 음량 (목소리 수로 나누지 않는다 → 섞은 뒤 clip)
+    """
+
+    def __init__(self, rate=44100, block=256, max_voices=8, waveform="sine",
+                 attack=0.01, release=0.08, gain=0.3):
+        self.rate = rate
+        self.block = block
+        self.max_voices = max_voices
+        self.gain = gain
+        self.release = release
+        self.table = make_wavetable(waveform)
+        self.size = len(self.table) - 1
+
+        self.attack_step = 1.0 / max(1, attack * rate)
+        self.release_step = 1.0 / max(1, release * rate)
+        self.freq = np.zeros(max_voices, dtype=np.float32)
+        self.phase = np.zeros(max_voices, dtype=np.float64)
+        self.level = np.zeros(max_voices, dtype=np.float32)  # 엔벨로프 현재 값
+        self.on = np.zeros(max_voices, dtype=bool)
+        self.events = collections.deque()  # (voice, freq 또는 None)
+        self.rendered = 0                  # 렌더한 블록 수
+
+        self._n = np.arange(1, block + 1, dtype=np.float32)
+        self._out = np.zeros(block, dtype=np.float32)
+
+    def note_on(self, voice, freq):
+        self.events.append((voice, float(freq)))
+
+    def note_off(self, voice):
+        self.events.append((voice, None))
+
+    def _apply_events(self):
+        while self.events:
+            voice, freq = self.events.popleft()
+            if freq is None:
+                self.on[voice] = False
+            else:
+                self.freq[voice] = freq
+                self.on[voice] = True
+
+    def render(self, out=None):
+        """한 블록 (block,) float32 [-1, 1]. out 을 주면 거기에 쓴다"""
+        self._apply_events()
+        out = self._out if out is None else out
+        active = np.flatnonzero(self.on | (self.level > 0))
+        if len(active) == 0:
+            out[:] = 0
+            self.rendered += 1
+            return out
+
+        # 엔벨로프: 켜진 목소리는 1 까지 올리고, 꺼진 목소리는 0 까지 내린다
+        slope = np.where(self.on[active], self.attack_step, -self.release_step)
+        env = np.clip(self.level[active, None] + slope[:, None] * self._n, 0.0, 1.0)
+        self.level[active] = env[:, -1]
+
+        # 웨이브테이블 선형 보간 (목소리 × 블록)
+        inc = self.freq[active] * self.size / self.rate
+        idx = self.phase[active, None] + inc[:, None] * (self._n - 1)
+        idx %= self.size
+        i0 = idx.astype(np.int32)
+        frac = (idx - i0).astype(np.float32)
+        table = self.table
+        wave_ = table[i0] + (table[i0 + 1] - table[i0]) * frac
+        self.phase[active] = (self.phase[active] + inc * self.block) % self.size
+
+        np.sum(wave_ * env, axis=0, out=out)
+        out *= self.gain
+        np.clip(out, -1.0, 1.0, out=out)
+        self.rendered += 1
+        return out
+
+
+class SynthSink:
+    """Synth + 출력 장치. 부저와 같은 play / stop / close, 목소리 번호만 추가"""
+
+    def __init__(self, output="null", path="synth.wav", rate=44100, block=256,
+                 max_voices=8, waveform="sine", **synth_kwargs):
+        self.synth = Synth(rate=rate, block=block, max_voices=max_voices,
+                           waveform=waveform, **synth_kwargs)
+        self.voices = max_voices
+        self.freq = [None] * max_voices  # 목소리별 현재 주파수 (같은 값이면 이벤트 생략)
+        self.underruns = 0
+        self._stream = None
+        self._wav = None
+        self._thread = None
+        self._running = True
+
+        if output == "alsa":
+            import sounddevice
+
+            self._stream = sounddevice.OutputStream(
+                samplerate=rate, blocksize=block, channels=1, dtype="float32",
+                latency="low", callback=self._callback)
+            self._stream.start()
+        elif output in ("wav", "null"):
+            if output == "wav":
+                self._wav = wave.open(path, "wb")
+                self._wav.setnchannels(1)
+                self._wav.setsampwidth(2)
+                self._wav.setframerate(rate)
+            self._thread = threading.Thread(target=self._pump, name="synth", daemon=True)
+            self._thread.start()
+        else:
+            raise ValueError(f"알 수 없는 신스 출력: {output}")
+
+    def _callback(self, outdata, frames, time_info, status):
+        if status.output_underflow:
+            self.underruns += 1
+        self.synth.render(outdata[:, 0])
+
+    def _pump(self):
+        """장치가 없을 때 콜백 대신 블록 주기에 맞춰 렌더"""
+        period = self.synth.block / self.synth.rate
+        next_t = time.perf_counter()
+        pcm = np.empty(self.synth.block, dtype=np.int16)
+        while self._running:
+            block = self.synth.render()
+            if self._wav is not None:
+                np.multiply(block, 32767, out=pcm, casting="unsafe")
+                self._wav.writeframes(pcm.tobytes())
+            next_t += period
+            delay = next_t - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -period:
+                self.underruns += 1
+                next_t = time.perf_counter()
+
+    def play(self, freq, voice=0):
+        if self.freq[voice] != freq:
+            self.freq[voice] = freq
+            self.synth.note_on(voice, freq)
+
+    def stop(self, voice=None):
+        """voice 를 안 주면 모든 목소리를 끈다 (단음 sink 와 같은 호출 방식)"""
+        voices = range(self.voices) if voice is None else (voice,)
+        for v in voices:
+            if self.freq[v] is not None:
+                self.freq[v] = None
+                self.synth.note_off(v)
+
+    def close(self):
+        self.stop()
+        if self._stream is not None:
+            time.sleep(self.synth.release)  # release 꼬리까지 들리게
+            self._stream.stop()
+            self._stream.close()
+        if self._thread is not None:
+            self._running = False
+            self._thread.join()
+        if self._wav is not None:
+            self._wav.close()
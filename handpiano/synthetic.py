@@ -0,0 +1,211 @@
+"""합성 손 랜드마크: 정답(손가락 개수, 왼손 여부)을 아는 21점 스트림
+
+카메라 앞에 손이 없어도 개수 세기 / 스무딩 / 추적 / 채점 경로를 돌려 볼 수 있게
+MediaPipe 랜드마크와 같은 모양 (정규화 x, y + 상대 z, 거울 영상 기준 손 방향) 을 만든다.
+
+    손 모양    : 손가락 5개 각각 펴짐 / 접힘 템플릿을 골라 붙인다 (엄지는 x 방향)
+    변형       : 손목 기준 회전 (천천히 흔들림), 크기, 화면 비율, 위치 이동
+    잡음       : 관절별 가우시안 흔들림, glitch 확률로 한 프레임 손가락 하나 뒤집힘
+    빠짐       : dropout 확률로 그 프레임에 손이 안 보임 (NaN / 결과에서 빠짐)
+    라벨 오류  : label_flip 확률로 Left / Right 가 뒤바뀐 결과
+    두 손      : 왼손은 화면 왼쪽, 오른손은 오른쪽. cross=True 면 주기적으로 자리를 바꾼다
+
+generate(n) 은 n 프레임을 한 번에 배열로 만든다 (청크로 이어 부르면 시간과 동작이 이어진다).
+process(image) 는 hands.process 대신 끼우는 자리로, 한 프레임씩 HandResult 를 돌려준다.
+
+    python piano.py --camera synthetic --backend synthetic --headless --sound null
+    python -m benchmarks.bench_synthetic --frames 2000000
+"""
+import numpy as np
+
+from handpiano.results import result_from_arrays
+
+# 개수 → 펴진 손가락 (엄지, 검지, 중지, 약지, 새끼). FingerCounter 가 세는 방식과 같다
+COUNT_STATES = np.array([
+    [0, 0, 0, 0, 0],
+    [0, 1, 0, 0, 0],
+    [0, 1, 1, 0, 0],
+    [0, 1, 1, 1, 0],
+    [0, 1, 1, 1, 1],
+    [1, 1, 1, 1, 1],
+], dtype=bool)
+
+# 오른손 정준 좌표 (손목 원점, 손목~중지 MCP = 1, y 는 아래로, 거울 영상이라 엄지가 -x)
+_MCP = {1: (-0.35, -0.95), 2: (0.0, -1.0), 3: (0.3, -0.92), 4: (0.55, -0.78)}
+_DIR = {1: (-0.12, -1.0), 2: (0.0, -1.0), 3: (0.1, -1.0), 4: (0.22, -1.0)}
+_LEN = {1: (0.45, 0.27, 0.22), 2: (0.5, 0.3, 0.24), 3: (0.46, 0.28, 0.22), 4: (0.36, 0.22, 0.2)}
+
+
+def _templates():
+    """(5, 2, 4, 3): 손가락별 [접힘, 펴짐] 의 관절 4개 좌표"""
+    out = np.zeros((5, 2, 4, 3), dtype=np.float32)
+    # 엄지: CMC, MCP 는 고정, IP / TIP 가 바깥(-x) 또는 손바닥 쪽(+x) 으로
+    cmc, mcp = np.array([-0.25, -0.2]), np.array([-0.5, -0.38])
+    for state, (d1, d2) in ((1, ((-0.8, -0.6), (-0.8, -0.6))), (0, ((0.6, -0.5), (1.0, 0.1)))):
+        ip = mcp + np.array(d1) * 0.32
+        tip = ip + np.array(d2) * 0.3
+        out[0, state, :, :2] = (cmc, mcp, ip, tip)
+    for f in range(1, 5):
+        mcp = np.array(_MCP[f])
+        d = np.array(_DIR[f]) / np.hypot(*_DIR[f])
+        l1, l2, l3 = _LEN[f]
+        pip = mcp + d * l1
+        out[f, 1, :, :2] = (mcp, pip, pip + d * l2, pip + d * (l2 + l3))
+        # 접힘: PIP 까지 올라갔다가 손바닥 쪽으로 꺾여 끝이 PIP 보다 아래
+        pip = mcp + d * l1 * 0.85
+        dip = pip - d * l2 * 0.9
+        out[f, 0, :, :2] = (mcp, pip, dip, dip - d * l3 * 0.5 + (0.05, 0))
+    # z: 손가락 끝으로 갈수록 카메라 쪽 (MediaPipe 처럼 음수)
+    out[..., 2] = -0.04 * np.arange(1, 5, dtype=np.float32)
+    return out
+
+
+TEMPLATES = _templates()
+
+
+class SyntheticHands:
+    """hands.process 자리에 끼우는 합성 손 (create_hands 와 같은 인자를 받는다)
+
+    counts     : 고를 손가락 개수 (0~5)
+    hold       : 한 동작을 유지하는 평균 프레임 수 (±50%)
+    rotation   : 손목 기준 최대 기울기 (도)
+    noise      : 관절 좌표 표준편차 (정규화 단위)
+    glitch     : 한 프레임 동안 손가락 하나가 뒤집힐 확률
+    dropout    : 손이 안 보일 확률
+    label_flip : 왼손 / 오른손 라벨이 틀릴 확률
+    cross      : 두 손이 주기적으로 자리를 바꾼다
+    aspect     : 화면 세로 / 가로 (정규화 x 에 곱함)
+    """
+
+    def __init__(self, max_num_hands=1, counts=range(6), hold=30, rotation=20.0, noise=0.003,
+                 glitch=0.0, dropout=0.0, label_flip=0.0, cross=False, fps=30, aspect=0.75,
+                 seed=0, chunk=1024, **_):
+        self.hands = max_num_hands
+        self.counts = np.asarray(counts)
+        self.hold = hold
+        self.rotation = np.radians(rotation)
+        self.noise = noise
+        self.glitch = glitch
+        self.dropout = dropout
+        self.label_flip = label_flip
+        self.cross = cross
+        self.fps = fps
+        self.aspect = aspect
+        self.chunk = chunk
+        self.rng = np.random.default_rng(seed)
+        self.frame = 0                                   # 다음에 만들 프레임 번호
+        self._segment = np.zeros((self.hands, 2), dtype=np.int64)  # 손마다 (남은 프레임, 개수)
+        self._phase = self.rng.uniform(0, 2 * np.pi, (self.hands, 3))
+        self._size = self.rng.uniform(0.13, 0.18, self.hands)
+        self._buffer = None
+        self._pos = 0
+        self.last = None      # process() 가 마지막으로 돌려준 프레임의 정답
+
+    # -------------------------------
+    # 배열로 한 번에
+    # -------------------------------
+    def _counts(self, n):
+        """(n, 손) 정답 개수. 구간 길이를 한 번에 뽑아 np.repeat"""
+        out = np.empty((n, self.hands), dtype=np.int64)
+        lo, hi = max(1, self.hold // 2), max(2, self.hold * 3 // 2)
+        for h in range(self.hands):
+            left, count = self._segment[h]
+            first = min(left, n)
+            out[:first, h] = count
+            rest = n - first
+            if rest:
+                k = rest // lo + 1
+                lengths = self.rng.integers(lo, hi, k)
+                values = self.rng.choice(self.counts, k)
+                filled = np.repeat(values, lengths)
+                out[first:, h] = filled[:rest]
+                used = np.searchsorted(np.cumsum(lengths), rest, side="left")
+                left, count = int(lengths[:used + 1].sum() - rest), int(values[used])
+            else:
+                left -= n
+            self._segment[h] = left, count
+        return out
+
+    def generate(self, n):
+        """n 프레임 → dict
+            landmarks (n, 손, 21, 3) float32 (안 보이는 손은 NaN)
+            is_left   (n, 손) bool  : 결과 라벨 (label_flip 이 반영됨)
+            true_left (n, 손) bool  : 실제 손
+            count     (n, 손) int   : 정답 손가락 개수
+            visible   (n, 손) bool
+            t         (n,)   초
+        """
+        rng = self.rng
+        hands = self.hands
+        idx = self.frame + np.arange(n)
+        t = idx / self.fps
+        self.frame += n
+
+        count = self._counts(n)
+        states = COUNT_STATES[count]                                  # (n, 손, 5)
+        if self.glitch:
+            flip = rng.random((n, hands)) < self.glitch
+            finger = rng.integers(0, 5, (n, hands))
+            states[flip, finger[flip]] ^= True
+
+        # 손가락 템플릿 고르기 → (n, 손, 21, 3)
+        pts = np.empty((n, hands, 21, 3), dtype=np.float32)
+        pts[..., 0, :] = 0
+        for f in range(5):
+            pts[..., 1 + 4 * f:5 + 4 * f, :] = np.where(states[..., f, None, None],
+                                                       TEMPLATES[f, 1], TEMPLATES[f, 0])
+
+        # 한 손만이면 오른손, 두 손이면 [왼손, 오른손]
+        true_left = np.broadcast_to(np.arange(hands) == 0 if hands > 1 else False,
+                                    (n, hands)).copy()
+        mirror = np.where(true_left, -1.0, 1.0).astype(np.float32)
+
+        phase = self._phase
+        theta = self.rotation * np.sin(2 * np.pi * t[:, None] / 7.0 + phase[:, 0])
+        c, s = np.cos(theta).astype(np.float32), np.sin(theta).astype(np.float32)
+        size = (self._size * (1 + 0.1 * np.sin(2 * np.pi * t[:, None] / 11.0 + phase[:, 1])))
+        x = pts[..., 0] * mirror[..., None]
+        y = pts[..., 1]
+        xr = (c[..., None] * x - s[..., None] * y) * size[..., None]
+        yr = (s[..., None] * x + c[..., None] * y) * size[..., None]
+
+        # 손목 위치: 왼손은 왼쪽, 오른손은 오른쪽 (cross 면 cos 로 자리 바꿈)
+        if hands > 1 and self.cross:
+            swing = 0.22 * np.cos(2 * np.pi * t / 6.0)[:, None]
+            cx = 0.5 + np.where(true_left, -swing, swing)
+        else:
+            home = np.where(true_left, 0.3, 0.7) if hands > 1 else np.full((n, hands), 0.5)
+            cx = home + 0.05 * np.sin(2 * np.pi * t[:, None] / 5.0 + phase[:, 2])
+        cy = 0.75 + 0.03 * np.sin(2 * np.pi * t[:, None] / 3.0 + phase[:, 2])
+
+        pts[..., 0] = cx[..., None] + xr * self.aspect
+        pts[..., 1] = cy[..., None] + yr
+        pts[..., 2] *= size[..., None]
+        if self.noise:
+            pts += rng.standard_normal(pts.shape, dtype=np.float32) * np.float32(self.noise)
+
+        visible = np.ones((n, hands), dtype=bool)
+        if self.dropout:
+            visible = rng.random((n, hands)) >= self.dropout
+            pts[~visible] = np.nan
+        is_left = true_left.copy()
+        if self.label_flip:
+            is_left ^= rng.random((n, hands)) < self.label_flip
+        return {"landmarks": pts, "is_left": is_left, "true_left": true_left, "count": count,
+                "visible": visible, "t": t}
+
+    # -------------------------------
+    # hands.process 자리
+    # -------------------------------
+    def process(self, image=None):
+        """다음 프레임의 HandResult (image 는 보지 않는다)"""
+        if self._buffer is None or self._pos >= len(self._buffer["t"]):
+            self._buffer = self.generate(self.chunk)
+            self._pos = 0
+        i = self._pos
+        self._pos += 1
+        self.last = {key: value[i] for key, value in self._buffer.items()}
+        return result_from_arrays(self.last["landmarks"], self.last["is_left"])
+
+    def close(self):
+        pass
@@ -0,0 +1,224 @@
+"""Tkinter 피아노 건반 게임 (pipi.py, pipi_2.py)
+
+카메라 루프는 작업 스레드에서, Tkinter 는 메인 스레드에서 돈다.
+카메라 스레드는 Tk 를 직접 건드리지 않고, 바뀐 상태만 (키, 값) 이벤트로 큐에 넣는다.
+Tk 쪽은 root.after 주기마다 큐를 비우고, 화면과 달라진 항목만 itemconfig 한다.
+
+채점은 scoring.ScoringEngine 이 카메라 스레드에서 프레임 캡처 시각으로 한다.
+화면에 보이는 목표 음도 같은 시간축(첫 프레임 캡처 시각 기준)의 채보에서 나온다.
+"""
+import queue
+import threading
+import tkinter as tk
+
+from handpiano.app import (camera_from_args, classifier_from_args, detect_item,
+                           display_from_args, filters_from_args, metrics_from_args,
+                           overlay_from_args, recorder_from_args, run, start_up)
+from handpiano.gesture import FingerCounter
+from handpiano.hands import landmark_array
+from handpiano.notes import NOTE_FREQ
+from handpiano.scoring import Chart, ScoringEngine
+
+
+class PianoGame:
+    """8개 건반 + 채보 노트 + 점수"""
+
+    UI_INTERVAL = 33  # 화면 갱신 주기 (ms)
+
+    def __init__(self, root, engine):
+        self.root = root
+        self.engine = engine
+        root.title("Hand Piano Game")
+        self.canvas = tk.Canvas(root, width=640, height=300, bg="white")
+        self.canvas.pack()
+
+        # 8개 건반(도레미파솔라시도) + 음계/손가락 개수 표시
+        self.keys = []
+        self.key_labels = []
+        for i in range(8):
+            x0 = i * 80
+            x1 = x0 + 80
+            rect = self.canvas.create_rectangle(x0, 100, x1, 300,
+                                                fill="white", outline="black", width=2)
+            self.keys.append(rect)
+
+            # 건반 안에 음 이름 + 손가락 개수 표시
+            note_name, freq = NOTE_FREQ[i+1]
+            label = self.canvas.create_text(
+                x0 + 40, 200,   # 건반 중앙 위치
+                text=f"{note_name}\n({i+1} 손가락)",
+                font=("Arial", 12, "bold"),
+                fill="black"
+            )
+            self.key_labels.append(label)
+
+        # 점수 표시
+        self.score_text = self.canvas.create_text(320, 20, text="Score: 0",
+                                                  font=("Arial", 16), fill="black")
+        self.judgement_text = self.canvas.create_text(320, 45, text="",
+                                                      font=("Arial", 14), fill="gray")
+        self.note_object = None
+        self._target = None                     # 지금 그려진 목표 (시각, 음)
+
+        self.events = queue.SimpleQueue()
+        self.itemconfig_calls = 0
+        self._posted = {}                       # 카메라 스레드가 마지막으로 보낸 값
+        self._lit = None                        # 지금 칠해져 있는 건반 번호
+        self._shown_score = 0
+
+    # -------------------------------
+    # 카메라 스레드 쪽
+    # -------------------------------
+    def post(self, key, value):
+        """값이 바뀌었을 때만 이벤트를 보낸다"""
+        if self._posted.get(key) != value:
+            self._posted[key] = value
+            self.events.put((key, value))
+
+    def update(self, fingers, t_capture):
+        """한 프레임 결과 반영 (판정 + 이벤트)"""
+        engine = self.engine
+        for note in engine.update(fingers, t_capture):
+            error = "" if note.error is None else f" {note.error * 1000:+.0f}ms"
+            self.post("judgement", f"{note.grade.upper()}{error}  combo {engine.combo}")
+        target = engine.target(t_capture)
+        self.post("target", None if target is None else (target.time, target.note))
+        self.post("fingers", fingers)
+        self.post("score", engine.score)
+        if engine.finished:
+            self.post("done", engine.summary())
+
+    def close(self):
+        self.events.put(("quit", None))
+
+    # -------------------------------
+    # Tk 메인 스레드 쪽
+    # -------------------------------
+    def poll(self):
+        """큐에 쌓인 이벤트를 키별 마지막 값으로 합쳐서 한 번에 반영"""
+        latest = {}
+        while True:
+            try:
+                key, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            latest[key] = value
+
+        if "quit" in latest:
+            self.root.quit()
+            return
+        if "target" in latest and latest["target"] != self._target:
+            self.show_target(latest["target"])
+        if "judgement" in latest:
+            self._itemconfig(self.judgement_text, text=latest["judgement"])
+        if "done" in latest:
+            summary = latest["done"]
+            self._itemconfig(self.judgement_text,
+                             text=f"끝! perfect {summary['perfect']} / good {summary['good']}"
+                                  f" / miss {summary['miss']}  최대 콤보 {summary['max_combo']}")
+        if "fingers" in latest:
+            self.highlight_key(latest["fingers"])
+        if "score" in latest and latest["score"] != self._shown_score:
+            self._shown_score = latest["score"]
+            self._itemconfig(self.score_text, text=f"Score: {self._shown_score}")
+        self.root.after(self.UI_INTERVAL, self.poll)
+
+    def _itemconfig(self, item, **kwargs):
+        self.itemconfig_calls += 1
+        self.canvas.itemconfig(item, **kwargs)
+
+    def show_target(self, target):
+        """채보의 다음 목표 음 표시 (판정되거나 창이 지나면 사라진다)"""
+        self._target = target
+        if self.note_object:
+            self.canvas.delete(self.note_object)
+            self.note_object = None
+        if target is not None:
+            note = target[1]
+            self.note_object = self.canvas.create_text(note*80 - 40, 75, text=NOTE_FREQ[note][0],
+                                                       font=("Arial", 20, "bold"), fill="red")
+
+    def highlight_key(self, fingers):
+        """누른 건반 시각화 (바뀐 건반만 다시 칠한다)"""
+        lit = fingers if fingers in NOTE_FREQ else None
+        if lit == self._lit:
+            return
+        if self._lit is not None:
+            self._itemconfig(self.keys[self._lit - 1], fill="white")
+        if lit is not None:
+            self._itemconfig(self.keys[lit - 1], fill="lightblue")
+        self._lit = lit
+
+
+def play_game(args, window="Hand Piano Game", classifier=None):
+    camera = camera_from_args(args)
+    classifier = classifier_from_args(args, classifier or FingerCounter(handed=True))
+    recorder = recorder_from_args(args, camera)
+    display = display_from_args(args, window)
+    overlay = overlay_from_args(args)
+    euro, smoother = filters_from_args(args)
+
+    # 학습한 분류기는 6~8 도 낼 수 있으므로 랜덤 채보도 그 클래스에서 고른다
+    notes = [int(c) for c in getattr(classifier, "classes", range(1, 6)) if c in NOTE_FREQ]
+    chart = (Chart.load(args.chart) if args.chart
+             else Chart.random(seed=args.chart_seed, notes=notes))
+    engine = ScoringEngine(chart, latency_offset=args.latency_offset)
+
+    root = tk.Tk()
+    game = PianoGame(root, engine)
+    # 카메라 / 부저 / MediaPipe 준비는 camera_loop 스레드에서 → 창은 바로 뜬다
+    ready = {}
+
+    def infer(item):
+        result = detect_item(ready["detector"], item)
+
+        landmarks, is_left = landmark_array(result)
+        if euro is not None:
+            landmarks = euro.update(landmarks, item["t_capture"])
+        counts = classifier.count_array(landmarks, is_left)
+        finger_count = int(counts[-1]) if len(counts) else 0
+        finger_count = smoother.update(finger_count, item["t_capture"])
+
+        item["result"] = result
+        item["landmarks"], item["is_left"] = landmarks, is_left
+        item["finger_count"] = finger_count
+        return item
+
+    def output(item):
+        startup, sink = ready["startup"], ready["sink"]
+        startup.mark("first_frame")
+        finger_count = item["finger_count"]
+        if finger_count in NOTE_FREQ:
+            sink.play(NOTE_FREQ[finger_count][1])
+            if startup.mark("first_note"):
+                print(startup.report())
+        else:
+            sink.stop()
+        game.update(finger_count, item["t_capture"])
+
+        if display.wants_frame():
+            # 건반 / 음 이름은 Tk 창에 있으므로 카메라 창에는 손과 개수만
+            frame = overlay.render(camera.normalizer.to_bgr(item["frame"]), item["landmarks"],
+                                   [(f"Fingers: {finger_count}", (10, 30), (0, 255, 0))])
+            display.show(frame)
+        return display.poll()
+
+    def camera_loop():
+        try:
+            metrics = metrics_from_args(args)
+            startup, sink, detector = start_up(args, camera, metrics=metrics, max_num_hands=1,
+                                               min_detection_confidence=0.8,
+                                               min_tracking_confidence=0.8)
+            ready.update(startup=startup, sink=sink, detector=detector)
+            run(camera, infer, output, pipeline=args.pipeline, sink=sink, detector=detector,
+                recorder=recorder, display=display, started=True, metrics=metrics)
+        finally:
+            game.close()  # root.quit() 은 Tk 스레드가 poll 에서 부른다
+
+    # -------------------------------
+    # 멀티스레드 실행 (카메라 + Tkinter GUI 동시 실행)
+    # -------------------------------
+    t = threading.Thread(target=camera_loop, daemon=True)
+    t.start()
+    game.poll()
+    root.mainloop()
@@ -0,0 +1,113 @@
+"""프레임 사이에서 손에 고정 ID 붙이기
+
+MediaPipe 의 Left / Right 라벨은 프레임마다 가끔 뒤집힌다. together.py 처럼 손마다
+역할(멜로디 / 코드)이 있으면 라벨이 튈 때마다 역할이 바뀐다.
+HandTracker 는 손바닥 중심(손목 + 네 손가락 뿌리)끼리 가장 가까운 것을 이어
+ID 를 유지하고, 왼손 / 오른손은 ID 마다 누적 투표로 정한다.
+
+    tracker = HandTracker()
+    tracks = tracker.update(landmarks, is_left, t)   # 입력 손 순서대로 Track
+    track.id, track.is_left, track.state[...]
+
+track.state 는 아래 단계가 ID 별로 쓰는 dict (스무딩 필터, 마지막 손가락 개수 등).
+손 개수에 제한이 없으므로 여러 사람이 같이 쓰는 경우에도 그대로 쓴다.
+"""
+import itertools
+
+import numpy as np
+
+PALM = [0, 5, 9, 13, 17]  # 손목 + 검지 / 중지 / 약지 / 새끼 뿌리
+
+
+class Track:
+    """ID 하나의 상태"""
+
+    def __init__(self, track_id, landmarks, is_left, t):
+        self.id = track_id
+        self.landmarks = landmarks
+        self.center = palm_center(landmarks)
+        self.vote = 1.0 if is_left else -1.0  # > 0 이면 왼손
+        self.first_seen = t
+        self.last_seen = t
+        self.hits = 1
+        self.missing = 0
+        self.state = {}
+
+    @property
+    def is_left(self):
+        return self.vote > 0
+
+    @property
+    def label(self):
+        return "Left" if self.is_left else "Right"
+
+    def __repr__(self):
+        return f"Track(id={self.id}, {self.label}, hits={self.hits})"
+
+
+def palm_center(landmarks):
+    """(..., 21, 3) → (..., 2) 손바닥 중심 x, y (정규화 좌표)"""
+    return landmarks[..., PALM, :2].mean(axis=-2)
+
+
+class HandTracker:
+    """최근접 이웃 매칭으로 손 ID 를 유지
+
+    max_distance : 이 거리(정규화 좌표)보다 멀면 다른 손으로 본다
+    decay        : 손잡이 투표에서 이전 표의 비중 (1 에 가까울수록 잘 안 뒤집힘)
+    max_missing  : 이 프레임 수 넘게 안 보이면 ID 를 버린다
+    """
+
+    def __init__(self, max_distance=0.15, decay=0.9, max_missing=5):
+        self.max_distance = max_distance
+        self.decay = decay
+        self.max_missing = max_missing
+        self.tracks = []
+        self._ids = itertools.count(1)
+
+    def update(self, landmarks, is_left, t=0.0):
+        """(H, 21, 3) 랜드마크 + (H,) 왼손 여부 → 입력 순서대로 Track 목록"""
+        landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3)
+        assigned = self._match(palm_center(landmarks)) if len(landmarks) else {}
+
+        out = []
+        for i, (hand, left) in enumerate(zip(landmarks, np.asarray(is_left).tolist())):
+            track = assigned.get(i)
+            if track is None:
+                track = Track(next(self._ids), hand, left, t)
+                self.tracks.append(track)
+            else:
+                track.landmarks = hand
+                track.center = palm_center(hand)
+                track.vote = self.decay * track.vote + (1 - self.decay) * (1 if left else -1)
+                track.last_seen = t
+                track.hits += 1
+            track.missing = 0
+            out.append(track)
+
+        seen = {id(track) for track in out}
+        for track in self.tracks:
+            if id(track) not in seen:
+                track.missing += 1
+        self.tracks = [track for track in self.tracks if track.missing <= self.max_missing]
+        return out
+
+    def _match(self, centers):
+        """입력 손 번호 → 기존 Track. 가까운 쌍부터 탐욕적으로 묶는다"""
+        if not self.tracks:
+            return {}
+        previous = np.array([track.center for track in self.tracks])
+        dist = np.linalg.norm(centers[:, None, :] - previous[None, :, :], axis=-1)
+        assigned, used = {}, set()
+        for flat in np.argsort(dist, axis=None):
+            i, j = divmod(int(flat), len(self.tracks))
+            if dist[i, j] > self.max_distance:
+                break
+            if i in assigned or j in used:
+                continue
+            assigned[i] = self.tracks[j]
+            used.add(j)
+        return assigned
+
+    def reset(self):
+        self.tracks = []
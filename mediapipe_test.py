@@ -1,42 +1,6 @@
-import cv2
-import mediapipe as mp
-from picamera2 import Picamera2
+# Picamera2 + MediaPipe 손 인식 확인
+from handpiano import app
 
-# -------------------------------
-# MediaPipe Hand Tracking 설정
-# -------------------------------
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.7)
-
-# -------------------------------
-# Picamera2 초기화
-# -------------------------------
-picam2 = Picamera2()
-preview_config = picam2.create_preview_configuration(main={"size": (640, 480)})
-picam2.configure(preview_config)
-picam2.start()
-
-try:
-    while True:
-        # 카메라 프레임 읽기
-        frame = picam2.capture_array()
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # MediaPipe로 손 검출
-        result = hands.process(rgb)
-
-        if result.multi_hand_landmarks:
-            for hand_landmarks in result.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-
-        cv2.imshow("MediaPipe Hands Test", frame)
-
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-
-except KeyboardInterrupt:
-    pass
-finally:
-    picam2.stop()
-    cv2.destroyAllWindows()
\ No newline at end of file
+if __name__ == "__main__":
+    args = app.parse_args("MediaPipe Hands Test", camera="picamera2")
+    app.show_hands(args, window="MediaPipe Hands Test")
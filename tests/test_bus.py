@@ -0,0 +1,125 @@
+"""프레임 버스: 최신 프레임만 읽기, 캡처 시각 전달, 살아 있는 소켓 보호"""
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from handpiano.bus import BusCamera, FrameBusPublisher
+from handpiano.frames import FrameNormalizer
+
+
+class CountingCamera:
+    """n 번째 프레임은 n % 256 으로 가득 찬 프레임. 캡처 시각은 1000 + n"""
+
+    def __init__(self, frames, fps=None, shape=(48, 64, 3)):
+        self.frames = frames
+        self.fps = fps
+        self.shape = shape
+        self.normalizer = FrameNormalizer("RGB888")
+        self._n = 0
+
+    def start(self):
+        self._n = 0
+
+    def read(self):
+        if self._n >= self.frames:
+            return None
+        if self.fps:
+            time.sleep(1 / self.fps)
+        self._n += 1
+        return np.full(self.shape, self._n % 256, dtype=np.uint8)
+
+    def capture_time(self, frame):
+        return 1000.0 + self._n
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "bus.sock")
+
+
+def test_subscriber_reads_only_latest_with_capture_time(path):
+    camera = CountingCamera(frames=100)
+    publisher = FrameBusPublisher(camera, path, slots=4)
+    publisher.publish(camera.read(), 1001.0)  # 첫 프레임에서 소켓을 연다
+    subscriber = BusCamera(path)
+    subscriber.start()
+    try:
+        while publisher.subscribers == 0:
+            time.sleep(0.001)
+        for _ in range(9):
+            frame = camera.read()
+            publisher.publish(frame, camera.capture_time(frame))
+
+        frame = subscriber.read()
+        assert subscriber.subscriber.last == 10
+        assert (frame == 10).all()
+        assert subscriber.capture_time(frame) == 1010.0
+
+        for _ in range(5):
+            frame = camera.read()
+            publisher.publish(frame, camera.capture_time(frame))
+        frame = subscriber.read()
+        assert (frame == 15).all() and subscriber.capture_time(frame) == 1015.0
+        assert subscriber.subscriber.skipped == 4
+    finally:
+        subscriber.stop()
+        publisher.close()
+
+
+def test_slow_subscriber_skips_but_never_tears(path):
+    """느린 구독자는 중간 프레임을 건너뛰고, 받은 프레임은 번호 / 내용 / 시각이 맞다"""
+    publisher = FrameBusPublisher(CountingCamera(frames=300, fps=1000), path, slots=3)
+    thread = threading.Thread(target=publisher.serve, daemon=True)
+    thread.start()
+    while not publisher.subscribers:
+        try:
+            subscriber = BusCamera(path)
+            subscriber.start()
+            break
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.001)
+
+    seen = []
+    try:
+        while (frame := subscriber.read()) is not None:
+            seq = subscriber.subscriber.last
+            assert (frame == seq % 256).all()
+            assert subscriber.capture_time(frame) == 1000.0 + seq
+            seen.append(seq)
+            time.sleep(0.01)
+    finally:
+        thread.join(5)
+        subscriber.stop()
+    assert seen == sorted(set(seen))
+    assert subscriber.subscriber.skipped > 0
+    assert len(seen) < 300
+
+
+def test_refuses_live_socket_but_replaces_stale_one(path):
+    camera = CountingCamera(frames=10)
+    first = FrameBusPublisher(camera, path)
+    first.publish(camera.read())
+    try:
+        second = FrameBusPublisher(CountingCamera(frames=10), path)
+        with pytest.raises(RuntimeError):
+            second.publish(np.zeros((48, 64, 3), dtype=np.uint8))
+        assert second._shm is None  # 공유 메모리를 만들기 전에 멈춘다
+    finally:
+        first.close()
+
+    # 비정상 종료로 남은 소켓 파일 (listen 하는 프로세스 없음)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    third = FrameBusPublisher(CountingCamera(frames=10), path)
+    try:
+        third.publish(np.zeros((48, 64, 3), dtype=np.uint8))
+        assert third.subscribers == 0
+    finally:
+        third.close()
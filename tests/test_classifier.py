@@ -0,0 +1,91 @@
+"""학습 분류기: 회전 / 크기 / 위치 불변 특징, 합성 손으로 학습, 저장 / 불러오기"""
+import numpy as np
+import pytest
+
+from handpiano.classifier import (FEATURES, LandmarkClassifier, accuracy, features,
+                                  load_dataset, train)
+from handpiano.synthetic import SyntheticHands
+
+
+def synthetic(n, seed, hands=1, **kwargs):
+    data = SyntheticHands(max_num_hands=hands, seed=seed, aspect=1.0, **kwargs).generate(n)
+    lm = data["landmarks"].reshape(-1, 21, 3)
+    return lm, data["true_left"].reshape(-1), data["count"].reshape(-1)
+
+
+def transform(lm, angle, scale, shift):
+    """손목 기준 회전 + 크기 + 이동"""
+    c, s = np.cos(angle), np.sin(angle)
+    rel = lm - lm[..., :1, :]
+    out = rel.copy()
+    out[..., 0] = c * rel[..., 0] - s * rel[..., 1]
+    out[..., 1] = s * rel[..., 0] + c * rel[..., 1]
+    return (out * scale + lm[..., :1, :] + [shift[0], shift[1], 0]).astype(np.float32)
+
+
+def test_features_are_rotation_scale_and_translation_invariant():
+    lm, _, _ = synthetic(50, seed=1)
+    base = features(lm)
+    assert base.shape == (50, FEATURES)
+    for angle, scale, shift in [(0.7, 1.0, (0, 0)), (-1.2, 0.5, (0.1, -0.2)),
+                                (np.pi, 2.0, (-0.3, 0.05))]:
+        np.testing.assert_allclose(features(transform(lm, angle, scale, shift)), base,
+                                   atol=1e-4)
+
+
+def test_left_hand_is_mirrored_to_right():
+    lm, _, _ = synthetic(20, seed=2)
+    mirrored = lm.copy()
+    mirrored[..., 0] = 2 * lm[..., :1, 0] - lm[..., 0]  # 손목 기준 좌우 반전
+    np.testing.assert_allclose(features(mirrored, np.ones(20, bool)),
+                               features(lm, np.zeros(20, bool)), atol=1e-5)
+
+
+@pytest.fixture(scope="module")
+def model():
+    lm, left, y = synthetic(3000, seed=3, hands=2, rotation=35.0, noise=0.004)
+    return train(features(lm, left), y, hidden=32, epochs=15, seed=0)
+
+
+def test_training_learns_counts_on_unseen_hands(model):
+    assert model.classes.tolist() == [0, 1, 2, 3, 4, 5]
+    lm, left, y = synthetic(1000, seed=4, hands=2, rotation=35.0, noise=0.004)
+    assert accuracy(model, lm, left, y) > 0.95
+
+
+def test_missing_hands_count_zero(model):
+    lm, left, _ = synthetic(2, seed=5, hands=2)
+    lm = lm.reshape(2, 2, 21, 3)
+    lm[1, 0] = np.nan
+    counts = model.count_array(lm, left.reshape(2, 2))
+    assert counts.shape == (2, 2) and counts[1, 0] == 0
+
+
+def test_save_load_round_trip(model, tmp_path):
+    path = tmp_path / "gesture.npz"
+    model.save(path)
+    loaded = LandmarkClassifier.load(path)
+    assert loaded.classes.tolist() == model.classes.tolist()
+    lm, left, _ = synthetic(500, seed=6, hands=2, rotation=35.0)
+    # float16 저장이라 경계의 몇 개만 다를 수 있다
+    agree = (loaded.count_array(lm, left) == model.count_array(lm, left)).mean()
+    assert agree > 0.99
+
+
+def test_dataset_from_recorded_sessions(tmp_path):
+    from handpiano.camera import SyntheticCamera
+    from handpiano.record import SessionRecorder
+
+    for label in (1, 4):
+        lm, left, _ = synthetic(50, seed=label)
+        recorder = SessionRecorder(str(tmp_path / str(label)), camera=SyntheticCamera(),
+                                   frames="none", max_hands=1, label=label)
+        for i in range(50):
+            recorder.add({"frame": np.zeros((4, 4, 3), np.uint8), "t_capture": i / 30,
+                          "landmarks": lm[i:i + 1], "is_left": left[i:i + 1]})
+        recorder.close()
+
+    (lm, _, y), (lm_test, _, y_test) = load_dataset([str(tmp_path / "1"), str(tmp_path / "4")],
+                                                    test_fraction=0.2)
+    assert len(y) == 80 and len(y_test) == 20
+    assert set(y.tolist()) == set(y_test.tolist()) == {1, 4}
@@ -0,0 +1,71 @@
+"""미리보기 서버: 임시 포트에 띄워 한 장을 받아 본다"""
+import http.client
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from handpiano.display import BOUNDARY, HeadlessDisplay, PreviewServer
+
+
+@pytest.fixture
+def server():
+    server = PreviewServer(port=0, fps=50, width=160)
+    yield server
+    server.close()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_serves_one_resized_frame(server):
+    host, port = server.address
+    display = HeadlessDisplay(server)
+    assert not display.wants_frame()  # 보는 사람이 없으면 그리지 않는다
+
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    conn.request("GET", "/")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert BOUNDARY in response.getheader("Content-Type")
+    assert wait_for(display.wants_frame)
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[:, :, 2] = 200  # BGR 빨강
+    display.show(frame)
+    assert not display.wants_frame()  # 다음 미리보기 시각 전
+
+    assert response.readline().strip() == f"--{BOUNDARY}".encode()
+    headers = {}
+    while (line := response.readline().strip()):
+        key, _, value = line.decode().partition(": ")
+        headers[key] = value
+    assert headers["Content-Type"] == "image/jpeg"
+    jpeg = response.read(int(headers["Content-Length"]))
+    image = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert image.shape == (120, 160, 3)
+    assert image[:, :, 2].mean() > 180 and image[:, :, 0].mean() < 20
+    response.close()  # 응답이 소켓을 쥐고 있으므로 둘 다 닫아야 끊긴다
+    conn.close()
+    assert server.sent >= 1
+
+    # 끊긴 것은 다음 프레임을 쓰다가 알게 된다 → 그 뒤로는 다시 그리지 않는다
+    def gone():
+        display.show(frame)
+        return server.clients == 0
+    assert wait_for(gone)
+    assert not display.wants_frame()
+
+
+def test_unknown_path_is_404(server):
+    conn = http.client.HTTPConnection(*server.address, timeout=5)
+    conn.request("GET", "/other")
+    assert conn.getresponse().status == 404
+    conn.close()
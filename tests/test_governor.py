@@ -0,0 +1,198 @@
+"""Governor: 온도 / 추론 시간 궤적에 따라 단계를 내리고 올리는지, 히스테리시스가 있는지"""
+from handpiano.governor import (LEVELS, Governor, SimulatedSensors, TemperatureCurve,
+                                simulate)
+
+
+class FixedSensors:
+    def __init__(self, temp=50.0, throttle=0):
+        self.temp = temp
+        self.throttle = throttle
+
+    def temperature(self):
+        return self.temp
+
+    def throttled(self):
+        return self.throttle
+
+
+def drive(governor, sensors, seconds, step=0.5, inference=None):
+    """가상 시간으로 update → [(초, 단계)]"""
+    trace = []
+    t = 0.0
+    while t <= seconds:
+        if isinstance(sensors, TemperatureCurve):
+            sensors.now = t
+        if inference is not None:
+            governor.observe(inference(t) if callable(inference) else inference)
+        governor.update(t)
+        trace.append((t, governor.index))
+        t += step
+    return trace
+
+
+def index_at(trace, when):
+    return [index for t, index in trace if t <= when][-1]
+
+
+def test_steps_down_one_level_per_period_when_hot():
+    sensors = TemperatureCurve([(0, 50.0), (10, 80.0), (60, 80.0)], throttle_at=100.0)
+    governor = Governor(sensors, period=2.0)
+    trace = drive(governor, sensors, 60)
+    # 75C 는 t=8.33 에 넘는다. 그 뒤 판단(2초마다)마다 한 칸씩, 끝 단계에서 멈춘다
+    assert index_at(trace, 8.0) == 0
+    assert index_at(trace, 10.0) == 1
+    assert index_at(trace, 12.0) == 2
+    assert all(b - a <= 1 for (_, a), (_, b) in zip(trace, trace[1:]))
+    assert governor.index == len(LEVELS) - 1
+
+
+def test_steps_up_only_after_hold_when_cool():
+    sensors = FixedSensors(temp=50.0)
+    governor = Governor(sensors, period=2.0, hold=10.0, start=3)
+    trace = drive(governor, sensors, 40, inference=0.01)
+    # 첫 판단 t=2 에서 여유 시작 → t=12 에 한 칸, 다시 10 초 뒤 한 칸
+    assert index_at(trace, 11.5) == 3
+    assert index_at(trace, 12.0) == 2
+    assert index_at(trace, 21.5) == 2
+    assert index_at(trace, 22.0) == 1
+    assert index_at(trace, 32.0) == 0
+    assert governor.index == 0
+
+
+def test_no_change_between_cool_and_hot():
+    sensors = FixedSensors(temp=70.0)  # cool 65 <= 70 < hot 75
+    governor = Governor(sensors, start=2)
+    drive(governor, sensors, 120, inference=0.01)
+    assert governor.index == 2
+    assert governor.changes == 0
+
+
+def test_warm_spell_resets_hold():
+    """올릴 조건이 hold 안에 한 번이라도 깨지면 처음부터 다시 센다"""
+    sensors = TemperatureCurve([(0, 50.0), (7, 50.0), (7.5, 70.0), (9, 70.0), (9.5, 50.0),
+                                (60, 50.0)])
+    governor = Governor(sensors, period=2.0, hold=10.0, start=1)
+    trace = drive(governor, sensors, 30, inference=0.01)
+    # t=8 판단에서 70C (cool 아님) → t=10 부터 다시 10 초
+    assert index_at(trace, 19.5) == 1
+    assert index_at(trace, 20.0) == 0
+
+
+def test_temperature_hysteresis_cycle():
+    """75C 넘으면 내려가고, 65C 밑으로 식어야만 다시 올라간다"""
+    sensors = TemperatureCurve([(0, 60.0), (10, 78.0), (20, 78.0), (30, 70.0), (80, 70.0),
+                                (90, 60.0), (200, 60.0)], throttle_at=100.0)
+    governor = Governor(sensors, period=2.0, hold=10.0)
+    trace = drive(governor, sensors, 200, inference=0.01)
+    lowest = index_at(trace, 30.0)
+    assert lowest > 0
+    assert index_at(trace, 85.0) == lowest  # 70C: 그대로
+    assert governor.index == 0              # 60C 로 식은 뒤 다시 0 단계까지
+
+
+def test_slow_inference_steps_down_and_recovers():
+    sensors = FixedSensors(temp=50.0)
+    governor = Governor(sensors, target_latency=0.08, period=2.0, hold=10.0, alpha=1.0)
+    slow_until = 7.0
+    trace = drive(governor, sensors, 60,
+                  inference=lambda t: 0.12 if t < slow_until else 0.02)
+    assert index_at(trace, 6.0) == 3        # t=2, 4, 6 판단에서 한 칸씩 내림
+    assert index_at(trace, 7.5) == 3
+    assert index_at(trace, 16.0) == 3       # t=8 부터 여유, hold 10 초 전
+    assert governor.index == 0
+
+
+def test_inference_between_headroom_and_target_holds_level():
+    sensors = FixedSensors(temp=50.0)
+    governor = Governor(sensors, target_latency=0.08, headroom=0.6, start=2)
+    drive(governor, sensors, 120, inference=0.06)  # 0.048 < 0.06 < 0.08
+    assert governor.index == 2
+
+
+def test_only_current_throttle_bits_step_down():
+    past = FixedSensors(temp=50.0, throttle=0x40000)  # 과거에 스로틀링이 있었다는 비트
+    governor = Governor(past)
+    drive(governor, past, 20, inference=0.01)
+    assert governor.index == 0
+
+    now = FixedSensors(temp=50.0, throttle=0x4)
+    governor = Governor(now)
+    drive(governor, now, 5, inference=0.01)
+    assert governor.index == 2
+
+
+def test_governed_simulation_avoids_throttling():
+    seconds = 30 * 60
+    throttled = {}
+    for name, levels in (("fixed", LEVELS[:1]), ("governed", LEVELS)):
+        sensors = SimulatedSensors(ambient=40.0)
+        governor = Governor(sensors, levels=levels)
+        trace = simulate(governor, sensors, seconds, base_inference=0.03)
+        throttled[name] = sum(1 for _, temp, _, _ in trace if temp >= sensors.throttle_at)
+    assert throttled["fixed"] > 0
+    assert throttled["governed"] == 0
+
+
+class FrameCamera:
+    def __init__(self):
+        from handpiano.frames import FrameNormalizer
+
+        self.normalizer = FrameNormalizer("RGB888")
+
+
+def test_scale_change_resets_motion_gate_and_roi():
+    """축소 단계가 바뀌어도 움직임 게이트 썸네일 / ROI 좌표가 새 프레임 크기에 맞는다"""
+    from handpiano.camera import SyntheticCamera
+    from handpiano.governor import GovernedDetector
+    from handpiano.hands import HandDetector
+    from handpiano.motion import MotionGatedDetector
+    from handpiano.roi import RoiDetector
+    from handpiano.synthetic import SyntheticHands
+
+    camera = FrameCamera()
+    roi = RoiDetector(HandDetector(SyntheticHands(), camera), SyntheticHands(), size=128,
+                      min_side=64)
+    gate = MotionGatedDetector(roi, threshold=0.0)
+    governor = Governor(TemperatureCurve([(0, 90.0), (1, 90.0)]), period=0.0)
+    detector = GovernedDetector(gate, governor)
+
+    source = SyntheticCamera(640, 480, frames=40)
+    source.start()
+    scales = set()
+    while (frame := source.read()) is not None:
+        detector.detect(frame)
+        scales.add(governor.level.scale)
+        if roi.roi is not None:
+            # ROI 는 이번 프레임을 추론한 크기 기준 (단계는 추론 뒤 update 에서 바뀐다)
+            x0, y0, side = roi.roi
+            h, w = int(480 * detector._scale), int(640 * detector._scale)
+            assert x0 + side <= w and y0 + side <= h
+    assert scales == {1.0, 0.75, 0.5}
+    assert roi.roi_frames > 0
+    assert gate.processed > 0
+
+
+def test_pi_sensors_read_in_background(monkeypatch):
+    import threading
+
+    from handpiano import governor as module
+
+    calls = []
+
+    def slow_throttled():
+        calls.append(threading.current_thread().name)
+        return 0
+
+    monkeypatch.setattr(module, "throttled", slow_throttled)
+    monkeypatch.setattr(module, "cpu_temperature", lambda: 50.0)
+    sensors = module.PiSensors(period=0.01)
+    try:
+        sensors.throttled()
+        for _ in range(100):
+            if calls:
+                break
+            threading.Event().wait(0.01)
+        assert calls and all(name == "governor-sensors" for name in calls)
+        assert sensors.temperature() == 50.0
+    finally:
+        sensors.close()
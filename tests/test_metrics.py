@@ -0,0 +1,58 @@
+"""PianoMetrics: 캡처 시각 기준 fps, 실제로 소리가 바뀐 호출만 세는 MeteredSink"""
+import time
+
+import pytest
+
+from handpiano.metrics import PianoMetrics
+from handpiano.sound import fake_buzzer
+
+
+def test_capture_fps_uses_capture_times_not_scrapes():
+    metrics = PianoMetrics()
+    now = time.perf_counter()
+    for i in range(200):  # 지난 4 초 동안 50 fps
+        metrics.captured(now - 4 + i * 0.02)
+    assert metrics.frames.value == 0  # 출력까지 간 프레임 수와는 상관없다
+    first = metrics._fps()
+    assert first == pytest.approx(50, rel=0.05)
+    assert metrics._fps() == first  # 스크레이프가 값을 바꾸지 않는다
+
+
+def test_capture_fps_drops_to_zero_when_camera_stops():
+    metrics = PianoMetrics()
+    now = time.perf_counter()
+    for i in range(60):  # 마지막 프레임이 3 초 전
+        metrics.captured(now - 5 + i * 0.033)
+    assert metrics._fps() == 0.0
+
+
+def test_stop_counts_when_buzzer_goes_silent():
+    metrics = PianoMetrics()
+    clock = [0.0]
+    buzzer = fake_buzzer(release=0.1, clock=lambda: clock[0])
+    sink = metrics.watch_sink(buzzer)
+    sink.play(440)
+    sink.play(440)
+    assert metrics.note_changes.value == 1
+    sink.stop()  # release 동안은 아직 울린다
+    clock[0] = 0.05
+    sink.stop()
+    assert metrics.note_changes.value == 1
+    clock[0] = 0.2
+    sink.stop()  # 이 호출에서 꺼진다
+    sink.stop()
+    assert buzzer.freq is None
+    assert metrics.note_changes.value == 2
+
+
+def test_play_during_hold_counts_when_note_changes():
+    metrics = PianoMetrics()
+    clock = [0.0]
+    sink = metrics.watch_sink(fake_buzzer(hold=0.2, clock=lambda: clock[0]))
+    sink.play(440)
+    clock[0] = 0.1
+    sink.play(494)  # hold 전이라 440 유지
+    assert metrics.note_changes.value == 1
+    clock[0] = 0.3
+    sink.play(494)
+    assert metrics.note_changes.value == 2
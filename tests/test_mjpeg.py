@@ -0,0 +1,98 @@
+"""libcamera-vid 스트림 읽기: 청크 경계에 걸친 마커, 프레임 사이 잡음, 최신 프레임만"""
+import io
+
+import cv2
+import numpy as np
+import pytest
+
+from handpiano.mjpeg import MjpegStreamReader, Yuv420StreamReader
+
+
+class ChunkedStream:
+    """readinto 가 한 번에 최대 limit 바이트만 채우는 스트림 (파이프처럼 조금씩)"""
+
+    def __init__(self, data, limit):
+        self.stream = io.BytesIO(data)
+        self.limit = limit
+
+    def readinto(self, view):
+        return self.stream.readinto(view[:self.limit])
+
+
+def jpeg(value, size=(32, 24)):
+    frame = np.full((size[1], size[0], 3), value, dtype=np.uint8)
+    ok, data = cv2.imencode(".jpg", frame)
+    assert ok
+    return data.tobytes()
+
+
+def read_all(reader):
+    frames = []
+    while (frame := reader.read(timeout=2.0)) is not None:
+        frames.append(frame)
+    return frames
+
+
+def brightness(frame):
+    return int(round(frame.mean()))
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 64])
+def test_markers_split_across_reads(limit):
+    values = [20, 60, 100, 140, 180]
+    data = b"".join(jpeg(v) for v in values)
+    reader = MjpegStreamReader(ChunkedStream(data, limit), chunk_size=limit).start()
+    frames = read_all(reader)
+    assert reader.parsed == len(values)
+    assert frames and abs(brightness(frames[-1]) - values[-1]) <= 2
+    assert len(frames) + reader.dropped == len(values)
+
+
+def test_garbage_between_frames_is_skipped():
+    rng = np.random.default_rng(0)
+    values = [30, 90, 150, 210]
+    parts = []
+    for v in values:
+        # 0xFF 가 없는 잡음 → SOI / EOI 로 잘못 읽힐 수 없다
+        parts.append(rng.integers(0, 0xFF, 50, dtype=np.uint8).tobytes())
+        parts.append(jpeg(v))
+    parts.append(b"\x00\x01trailing")
+    reader = MjpegStreamReader(ChunkedStream(b"".join(parts), 100), chunk_size=100).start()
+    frames = read_all(reader)
+    assert reader.parsed == len(values)
+    assert abs(brightness(frames[-1]) - values[-1]) <= 2
+
+
+def test_truncated_last_frame_is_not_emitted():
+    data = jpeg(40) + jpeg(200)[:-20]
+    reader = MjpegStreamReader(io.BytesIO(data)).start()
+    frames = read_all(reader)
+    assert reader.parsed == 1
+    assert [abs(brightness(f) - 40) <= 2 for f in frames] == [True]
+
+
+def test_only_latest_frame_in_a_burst_is_decoded():
+    values = [10, 50, 90, 130, 170, 210]
+    data = b"".join(jpeg(v) for v in values)
+    # 한 번의 read 에 여섯 장이 다 들어온다 → 마지막 것만 디코드
+    reader = MjpegStreamReader(io.BytesIO(data), chunk_size=len(data)).start()
+    frames = read_all(reader)
+    assert reader.parsed == len(values)
+    assert reader.decoded == 1
+    assert len(frames) == 1 and abs(brightness(frames[0]) - values[-1]) <= 2
+
+
+@pytest.mark.parametrize("limit", [5, 1000, 1 << 20])
+def test_yuv420_reads_fixed_size_frames(limit):
+    width, height = 16, 8
+    values = [16, 128, 235]
+    # Y = v, U = V = 128 → 회색. BT.601 제한 범위라 16~235 가 0~255 로 늘어난다
+    data = b"".join(np.concatenate([np.full(width * height, v, dtype=np.uint8),
+                                    np.full(width * height // 2, 128, dtype=np.uint8)]).tobytes()
+                    for v in values)
+    reader = Yuv420StreamReader(ChunkedStream(data, limit), width, height).start()
+    frames = read_all(reader)
+    assert reader.parsed == len(values)
+    assert frames[-1].shape == (height, width, 3)
+    assert abs(brightness(frames[-1]) - 255) <= 1
+    assert len(frames) + reader.dropped == len(values)
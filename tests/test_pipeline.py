@@ -0,0 +1,73 @@
+"""파이프라인: 가장 오래된 것부터 버리는 큐, 단계별 집계, 스트림 끝에서 정리"""
+import threading
+import time
+
+from handpiano.camera import SyntheticCamera
+from handpiano.pipeline import DropOldestQueue, Pipeline
+
+
+def test_drop_oldest_queue_keeps_newest():
+    q = DropOldestQueue(2)
+    for i in range(5):
+        q.put(i)
+    assert q.dropped == 3 and len(q) == 2
+    assert [q.get(), q.get()] == [3, 4]
+    t0 = time.perf_counter()
+    assert q.get(timeout=0.05) is None
+    assert time.perf_counter() - t0 >= 0.04
+
+
+def test_get_wakes_up_on_put():
+    q = DropOldestQueue(2)
+    threading.Timer(0.02, q.put, args=("frame",)).start()
+    assert q.get(timeout=2) == "frame"
+
+
+def synthetic_source(frames):
+    camera = SyntheticCamera(64, 48, frames=frames)
+    camera.start()
+    return camera.read
+
+
+def test_every_frame_is_counted_once_and_stream_end_stops_all_stages():
+    def slow(item):
+        time.sleep(0.005)  # 캡처보다 느린 추론 → 앞 큐에서 버려진다
+        item["done"] = True
+        return item
+
+    outputs = []
+    p = Pipeline(synthetic_source(40), [("inference", slow)])
+    p.run(lambda item: outputs.append(item["seq"]))
+
+    assert not any(t.is_alive() for t in p.threads)
+    capture, inference, output = p.stats()["stages"]
+    assert capture["count"] == 40
+    # 단계마다 받은 것 = 처리한 것 + 큐에서 버린 것
+    assert inference["count"] + capture["dropped"] == 40
+    assert output["count"] + inference["dropped"] == inference["count"]
+    assert capture["dropped"] > 0
+    assert output["count"] == len(outputs)
+    assert outputs == sorted(outputs) and outputs[-1] == 40  # 마지막 프레임은 버리지 않는다
+    assert inference["mean_ms"] >= 5.0
+
+
+def test_sink_false_stops_infinite_source():
+    p = Pipeline(synthetic_source(None), [("inference", lambda item: item)])
+    seen = []
+
+    def sink(item):
+        seen.append(item)
+        return len(seen) < 5
+
+    p.run(sink)
+    p.join(1.0)
+    assert len(seen) == 5
+    assert not any(t.is_alive() for t in p.threads)
+
+
+def test_timestamp_hook_and_latency():
+    p = Pipeline(synthetic_source(10), [], timestamp=lambda frame: time.perf_counter() - 1.0)
+    p.run(lambda item: None)
+    # 캡처 시각을 1 초 전으로 주면 종단 지연도 1 초 이상
+    assert p.stats()["latency_ms"] >= 1000
+    assert len(p.latencies) == p.stats()["stages"][-1]["count"]
@@ -0,0 +1,122 @@
+"""추론 풀: ordered / unordered 전달 순서, 늦은 결과 버리기, 작업 프로세스가 죽었을 때
+
+작업 프로세스는 spawn 으로 뜨므로 factory 는 이 모듈의 최상위 클래스여야 한다.
+"""
+import os
+import time
+
+import numpy as np
+import pytest
+
+from handpiano.frames import FrameNormalizer
+from handpiano.pool import InferencePool, PooledCamera, PooledDetector
+from handpiano.results import HandResult, result_from_arrays
+
+SHAPE = (8, 8, 3)
+
+
+class ValueHands:
+    """프레임 첫 픽셀 값 v 를 그대로 랜드마크 x 로 돌려준다. v ms 만큼 걸리고, 255 면 죽는다"""
+
+    def __init__(self, **_):
+        pass
+
+    def process(self, rgb):
+        value = int(rgb[0, 0, 0])
+        if value == 255:
+            os._exit(3)
+        time.sleep(value / 1000)
+        return result_from_arrays(np.full((1, 21, 3), value, dtype=np.float32), [True])
+
+
+def frame_of(value):
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def value_of(result):
+    return int(result.multi_hand_landmarks[0].landmark[0].x)
+
+
+def run_pool(values, ordered, workers=2):
+    pool = InferencePool(workers, ordered=ordered, factory=ValueHands)
+    pool.start(SHAPE)
+    try:
+        for value in values:
+            pool.submit(frame_of(value), tag=value)
+        out = []
+        while len(out) + pool.stale < len(values):  # 도착이 아니라 내보낸 / 버린 수로
+            got = pool.get(timeout=5)
+            if got is None:
+                break
+            out.append(got)
+        return out, pool.stats()
+    finally:
+        pool.close()
+
+
+def test_ordered_delivers_every_frame_in_order():
+    # 첫 프레임이 가장 느려도 번호 순서대로 모두 나온다
+    values = [80, 1, 1, 1]
+    out, stats = run_pool(values, ordered=True)
+    assert [seq for seq, _, _ in out] == [1, 2, 3, 4]
+    assert [tag for _, tag, _ in out] == values
+    assert [value_of(result) for _, _, result in out] == values
+    assert stats["stale"] == 0
+
+
+def test_unordered_drops_results_older_than_delivered():
+    # 느린 1 번이 끝나기 전에 2~4 번이 나가므로 1 번은 늦은 결과로 버려진다
+    values = [80, 1, 1, 1]
+    out, stats = run_pool(values, ordered=False)
+    seqs = [seq for seq, _, _ in out]
+    assert seqs == sorted(seqs) and 1 not in seqs
+    assert all(value_of(result) == tag for _, tag, result in out)
+    assert stats["stale"] == len(values) - len(out) >= 1
+    assert stats["completed"] == len(values)
+
+
+class ListCamera:
+    def __init__(self, values):
+        self.values = list(values)
+        self.normalizer = FrameNormalizer("RGB888")
+
+    def start(self):
+        pass
+
+    def read(self):
+        return frame_of(self.values.pop(0)) if self.values else None
+
+    def stop(self):
+        pass
+
+
+def test_dead_worker_raises_instead_of_waiting_forever():
+    camera = PooledCamera(ListCamera([1, 255, 1, 1, 1]), InferencePool(2, factory=ValueHands))
+    camera.start()
+    t0 = time.perf_counter()
+    try:
+        with pytest.raises(RuntimeError):
+            while camera.read() is not None:
+                pass
+    finally:
+        camera.stop()
+    assert time.perf_counter() - t0 < 30
+
+
+def test_pooled_camera_pairs_frames_with_results():
+    values = [5, 6, 7, 8, 9]
+    camera = PooledCamera(ListCamera(values), InferencePool(2, factory=ValueHands))
+    detector = PooledDetector(camera)
+    camera.start()
+    seen = []
+    try:
+        while (frame := camera.read()) is not None:
+            result = detector.detect(frame)
+            assert value_of(result) == frame[0, 0, 0]
+            seen.append(int(frame[0, 0, 0]))
+        # 결과 목록에서 밀려났거나 모르는 프레임은 None 대신 손 없는 결과
+        unknown = detector.detect(frame_of(1))
+        assert isinstance(unknown, HandResult) and unknown.multi_hand_landmarks is None
+    finally:
+        camera.stop()
+    assert seen == values
@@ -0,0 +1,83 @@
+"""RoiDetector: ROI 좌표 되돌리기, 손이 모자랄 때 주기적인 전체 프레임 검출"""
+import numpy as np
+
+from handpiano.frames import FrameNormalizer
+from handpiano.hands import HandDetector, landmark_array
+from handpiano.results import result_from_arrays
+from handpiano.roi import RoiDetector
+
+
+class FrameCamera:
+    normalizer = FrameNormalizer("RGB888")
+
+
+def hand_at(cx, cy, half=0.05):
+    """중심 (cx, cy) 에 21 점을 정사각형으로 흩은 손"""
+    rng = np.random.default_rng(0)
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, :2] = [cx, cy] + rng.uniform(-half, half, (21, 2))
+    return hand
+
+
+class ScriptedHands:
+    """process 호출마다 hands() 가 주는 손들을 결과로 돌려준다"""
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.calls = 0
+
+    def process(self, rgb):
+        self.calls += 1
+        found = self.hands()
+        return result_from_arrays(found, [False] * len(found))
+
+
+def test_roi_result_is_mapped_back_to_frame_coordinates():
+    full = ScriptedHands(lambda: [hand_at(0.3, 0.4)])
+    crop = ScriptedHands(lambda: [hand_at(0.5, 0.5, half=0.1)])
+    detector = RoiDetector(HandDetector(full, FrameCamera()), crop, size=64, min_side=64)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    detector.detect(frame)
+    x0, y0, side = detector.roi
+    landmarks, _ = landmark_array(detector.detect(frame))
+    # ROI 가운데 (0.5, 0.5) → 원본 ROI 중심
+    center = landmarks[0, :, :2].mean(axis=0)
+    assert np.allclose(center, [(x0 + side / 2) / 640, (y0 + side / 2) / 480], atol=0.02)
+    assert detector.roi_frames == 1 and detector.full_frames == 1
+
+
+def test_missing_hand_forces_periodic_full_frame():
+    """손 하나를 ROI 로 따라가는 동안 ROI 밖에 들어온 두 번째 손도 찾는다"""
+    frame_no = [0]
+    second = hand_at(0.8, 0.7)
+
+    def full_view():
+        return [hand_at(0.2, 0.3)] + ([second] if frame_no[0] >= 3 else [])
+
+    full = ScriptedHands(full_view)
+    crop = ScriptedHands(lambda: [hand_at(0.5, 0.5, half=0.1)])
+    detector = RoiDetector(HandDetector(full, FrameCamera()), crop, size=64, min_side=64,
+                           max_hands=2, full_every=5)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    counts = []
+    for frame_no[0] in range(12):
+        counts.append(len(detector.detect(frame).multi_hand_landmarks or ()))
+    # 0: 전체, 1~5: ROI, 6: 강제 전체 → 두 손. 두 손을 감싸면 프레임보다 커져 전체 프레임 유지
+    assert counts[:6] == [1] * 6
+    assert counts[6] == 2
+    assert detector.forced_full == 1
+    assert full.calls == 1 + 6 and crop.calls == 5
+
+
+def test_enough_hands_stays_on_roi():
+    full = ScriptedHands(lambda: [hand_at(0.3, 0.4)])
+    crop = ScriptedHands(lambda: [hand_at(0.5, 0.5, half=0.1)])
+    detector = RoiDetector(HandDetector(full, FrameCamera()), crop, size=64, min_side=64,
+                           max_hands=1, full_every=2)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    for _ in range(20):
+        detector.detect(frame)
+    assert full.calls == 1 and detector.forced_full == 0
+    assert detector.stats()["processed"] == 20
@@ -0,0 +1,110 @@
+"""ScoringEngine / replay_session: 캡처 시각 기준 perfect / good / miss 판정"""
+import numpy as np
+import pytest
+
+from handpiano.scoring import Chart, ChartNote, ScoringEngine, replay_session
+
+FPS = 100
+T0 = 50.0  # 캡처 시각은 perf_counter 기준이라 0 에서 시작하지 않는다
+
+
+def chart():
+    return Chart([ChartNote(1.0, 1), ChartNote(2.0, 2), ChartNote(3.0, 3), ChartNote(4.0, 4)])
+
+
+def session(changes, duration):
+    """[(게임 시각, 손가락 수)] 로 바뀌는 FPS 프레임 녹화"""
+    t = np.arange(int(duration * FPS)) / FPS
+    counts = np.zeros(len(t), dtype=np.int64)
+    for when, fingers in changes:
+        counts[t >= when - 1e-9] = fingers
+    return {"t": T0 + t, "finger_count": counts}
+
+
+def grades(c):
+    return [n.grade for n in c.notes]
+
+
+def test_perfect_good_and_miss():
+    c = chart()
+    # 1: +50ms perfect, 2: +200ms good, 3: 안 냄 (miss), 4: -150ms good
+    rec = session([(1.05, 1), (2.2, 2), (2.6, 0), (3.85, 4)], duration=5.0)
+    engine = replay_session(rec, c)
+    assert grades(c) == ["perfect", "good", "miss", "good"]
+    assert [n.error for n in c.notes] == pytest.approx([0.05, 0.2, None, -0.15], abs=1e-6)
+    summary = engine.summary()
+    assert summary == {"score": 200, "max_combo": 2, "perfect": 1, "good": 2, "miss": 1,
+                       "mean_error_ms": pytest.approx(33.3, abs=0.1)}
+    assert engine.finished
+
+
+def test_outside_window_is_miss():
+    c = Chart([ChartNote(1.0, 2)])
+    engine = replay_session(session([(1.3, 2)], duration=2.0), c)  # +300ms > good
+    assert grades(c) == ["miss"]
+    assert engine.summary()["score"] == 0
+
+
+def test_wrong_note_does_not_count():
+    c = Chart([ChartNote(1.0, 2)])
+    replay_session(session([(1.0, 3)], duration=2.0), c)
+    assert grades(c) == ["miss"]
+
+
+def test_onset_is_first_frame_of_change():
+    """같은 개수를 계속 들고 있어도 판정은 바뀐 첫 프레임 한 번뿐"""
+    c = Chart([ChartNote(1.0, 1), ChartNote(1.2, 1)])
+    replay_session(session([(0.95, 1)], duration=2.0), c)
+    assert grades(c) == ["perfect", "miss"]
+
+
+def test_latency_offset_moves_onset_earlier():
+    rec = session([(1.18, 1)], duration=2.0)
+    plain, offset = Chart([ChartNote(1.0, 1)]), Chart([ChartNote(1.0, 1)])
+    replay_session(rec, plain)
+    replay_session(rec, offset, latency_offset=0.1)
+    assert grades(plain) == ["good"]
+    assert grades(offset) == ["perfect"]
+    assert offset.notes[0].error == pytest.approx(0.08, abs=1e-6)
+
+
+def test_miss_is_reported_once_window_passes():
+    c = Chart([ChartNote(1.0, 1)])
+    engine = ScoringEngine(c)
+    engine.start(T0)
+    assert engine.update(0, T0 + 1.2) == []
+    judged = engine.update(0, T0 + 1.26)
+    assert [n.grade for n in judged] == ["miss"]
+    assert engine.update(0, T0 + 1.3) == []
+
+
+def test_short_recording_misses_remaining_notes():
+    c = chart()
+    engine = replay_session(session([(1.0, 1)], duration=1.5), c)
+    assert grades(c) == ["perfect", "miss", "miss", "miss"]
+    assert engine.finished
+
+
+def test_replay_is_deterministic():
+    rec = session([(1.05, 1), (2.2, 2), (3.0, 3), (3.9, 4)], duration=5.0)
+    first = replay_session(rec, chart()).summary()
+    assert all(replay_session(rec, chart()).summary() == first for _ in range(3))
+
+
+def test_target_shows_next_unjudged_note():
+    c = chart()
+    engine = ScoringEngine(c)
+    engine.start(T0)
+    assert engine.target(T0 + 0.0, lead=0.5) is None
+    assert engine.target(T0 + 0.6, lead=0.5) is c.notes[0]
+    engine.update(1, T0 + 1.0)
+    assert engine.target(T0 + 1.1, lead=0.5) is None
+    assert engine.target(T0 + 1.6, lead=0.5) is c.notes[1]
+
+
+def test_chart_seed_and_json_round_trip(tmp_path):
+    a, b = Chart.random(count=10, seed=7), Chart.random(count=10, seed=7)
+    assert [n.as_dict() for n in a.notes] == [n.as_dict() for n in b.notes]
+    path = tmp_path / "chart.json"
+    a.save(path)
+    assert [n.as_dict() for n in Chart.load(path).notes] == [n.as_dict() for n in a.notes]
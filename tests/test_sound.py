@@ -0,0 +1,95 @@
+"""PwmBuzzer: 바뀔 때만 PWM 호출 + hold / release 디바운스 (FakeGPIO 기록으로 확인)"""
+from handpiano.fakegpio import FakeGPIO
+from handpiano.sound import PwmBuzzer
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_buzzer(**kwargs):
+    clock = Clock()
+    gpio = FakeGPIO(clock=clock)
+    buzzer = PwmBuzzer(gpio=gpio, clock=clock, **kwargs)
+    gpio.calls.clear()  # 초기화 때의 stop() 은 빼고 센다
+    return buzzer, gpio, clock
+
+
+def test_repeated_note_writes_once():
+    buzzer, gpio, clock = make_buzzer()
+    for _ in range(30):
+        buzzer.play(440)
+        clock.now += 1 / 30
+    assert gpio.count("ChangeFrequency") == 1
+    assert gpio.count("start") == 1
+    assert gpio.count("stop") == 0
+    assert buzzer.writes == 2
+
+
+def test_note_change_only_changes_frequency():
+    buzzer, gpio, clock = make_buzzer()
+    for freq in [440] * 5 + [494] * 5 + [523] * 5:
+        buzzer.play(freq)
+        clock.now += 1 / 30
+    assert [c[3] for c in gpio.calls if c[2] == "ChangeFrequency"] == [(440,), (494,), (523,)]
+    assert gpio.count("start") == 1
+    assert gpio.count("stop") == 0
+
+
+def test_frequency_is_set_before_start():
+    buzzer, gpio, _ = make_buzzer()
+    buzzer.play(440)
+    assert [c[2] for c in gpio.calls] == ["ChangeFrequency", "start"]
+
+
+def test_release_delay_is_honoured():
+    buzzer, gpio, clock = make_buzzer(release=0.1)
+    buzzer.play(440)
+    for _ in range(3):  # 0.00 ~ 0.09 초: 아직 유지
+        clock.now += 0.03
+        buzzer.stop()
+    assert gpio.count("stop") == 0
+    assert buzzer.freq == 440
+    clock.now += 0.2
+    buzzer.stop()
+    buzzer.stop()
+    assert gpio.count("stop") == 1
+    assert buzzer.freq is None
+
+
+def test_dropout_shorter_than_release_keeps_sounding():
+    buzzer, gpio, clock = make_buzzer(release=0.1)
+    buzzer.play(440)
+    for _ in range(2):  # 손을 두 프레임 놓침
+        clock.now += 1 / 30
+        buzzer.stop()
+    clock.now += 1 / 30
+    buzzer.play(440)
+    clock.now += 1.0
+    buzzer.play(440)  # release 타이머는 play() 가 취소했으므로 계속 울린다
+    assert gpio.count("stop") == 0
+    assert gpio.count("start") == 1
+
+
+def test_hold_delays_note_change():
+    buzzer, gpio, clock = make_buzzer(hold=0.2)
+    buzzer.play(440)
+    clock.now += 0.1
+    buzzer.play(494)
+    assert buzzer.freq == 440
+    clock.now += 0.15
+    buzzer.play(494)
+    assert buzzer.freq == 494
+    assert gpio.count("ChangeFrequency") == 2
+
+
+def test_close_stops_and_cleans_up():
+    buzzer, gpio, _ = make_buzzer()
+    buzzer.play(440)
+    buzzer.close()
+    assert gpio.count("stop") == 1
+    assert gpio.calls[-1][2] == "cleanup"
@@ -0,0 +1,87 @@
+"""검출기 체인: 예열 / 닫기가 래퍼 안쪽까지 닿는지, 늦게 온 결과의 캡처 시각"""
+import numpy as np
+
+from handpiano.app import detect_item
+from handpiano.motion import MotionGatedDetector
+from handpiano.results import HandResult
+from handpiano.smoothing import OneEuroFilter
+from handpiano.startup import close_detector, warm_up
+
+
+class RecordingHands:
+    def __init__(self):
+        self.shapes = []
+        self.closed = False
+
+    def process(self, rgb):
+        self.shapes.append(rgb.shape)
+        return HandResult()
+
+    def close(self):
+        self.closed = True
+
+
+class HandsDetector:
+    def __init__(self):
+        self.hands = RecordingHands()
+
+
+class AsyncDetector:
+    """Hands 없이 warm_up 을 직접 가진 검출기 (TasksHandDetector 처럼)"""
+
+    def __init__(self):
+        self.warmed = None
+        self.closed = False
+        self.pending = []
+
+    def warm_up(self, width, height):
+        self.warmed = (width, height)
+
+    def detect(self, frame):
+        # 이번 프레임은 나중에, 지금은 이전 프레임 결과 (캡처 시각 포함)
+        self.pending.append(HandResult(t_capture=len(self.pending) * 0.1))
+        return self.pending[-2] if len(self.pending) > 1 else HandResult()
+
+    def close(self):
+        self.closed = True
+
+
+def test_warm_up_reaches_hands_through_wrappers():
+    inner = HandsDetector()
+    warm_up(MotionGatedDetector(inner), 320, 240)
+    assert inner.hands.shapes == [(240, 320, 3)]
+
+
+def test_warm_up_calls_detector_warm_up_without_hands():
+    inner = AsyncDetector()
+    detector = MotionGatedDetector(inner)
+    assert warm_up(detector, 320, 240) is detector
+    assert inner.warmed == (320, 240)
+
+
+def test_close_detector_closes_chain_once():
+    inner = HandsDetector()
+    async_inner = AsyncDetector()
+    close_detector(MotionGatedDetector(inner))
+    close_detector(MotionGatedDetector(async_inner))
+    assert inner.hands.closed and async_inner.closed
+
+
+def test_late_result_carries_its_own_capture_time():
+    detector = AsyncDetector()
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    first = {"frame": frame, "t_capture": 5.0}
+    detect_item(detector, first)
+    assert first["t_capture"] == 5.0       # 결과에 시각이 없으면 그대로
+    second = {"frame": frame, "t_capture": 5.1}
+    detect_item(detector, second)
+    assert second["t_capture"] == 0.0      # 첫 프레임 결과 → 첫 프레임 캡처 시각
+
+
+def test_one_euro_repeated_timestamp_keeps_state():
+    euro = OneEuroFilter()
+    euro.update(np.zeros(3), 0.0)
+    moved = euro.update(np.ones(3), 0.1).copy()
+    # 같은 결과가 같은 시각으로 다시 오면 초기화하지 않고 직전 값을 그대로
+    assert np.array_equal(euro.update(np.ones(3), 0.1), moved)
+    assert (moved < 1).all()
@@ -0,0 +1,44 @@
+"""합성 손: 만든 랜드마크를 규칙 기반 FingerCounter 로 세면 정답 개수와 같다"""
+import numpy as np
+import pytest
+
+from handpiano.gesture import FingerCounter, count_fingers_array
+from handpiano.hands import landmark_array
+from handpiano.synthetic import SyntheticHands
+
+
+@pytest.mark.parametrize("hands", [1, 2])
+def test_generated_landmarks_match_ground_truth_counts(hands):
+    data = SyntheticHands(max_num_hands=hands, seed=hands).generate(5000)
+    counted = count_fingers_array(data["landmarks"], data["true_left"])
+    np.testing.assert_array_equal(counted, data["count"])
+    assert set(np.unique(data["count"]).tolist()) == set(range(6))
+
+
+def test_ground_truth_survives_rotation_and_crossing_hands():
+    # 기본 회전 20 도 + 두 손 자리 바꾸기에서도 (잡음 / glitch 없이) 정답 그대로
+    data = SyntheticHands(max_num_hands=2, cross=True, seed=7).generate(3000)
+    counted = count_fingers_array(data["landmarks"], data["true_left"])
+    np.testing.assert_array_equal(counted, data["count"])
+
+
+def test_glitch_and_dropout_are_the_only_disagreements():
+    hands = SyntheticHands(max_num_hands=2, glitch=0.05, dropout=0.1, seed=3)
+    data = hands.generate(4000)
+    counted = count_fingers_array(data["landmarks"], data["true_left"])
+    visible = data["visible"]
+    assert (counted[~visible] == 0).all()               # 안 보이는 손은 0
+    wrong = (counted != data["count"]) & visible
+    # 손가락 하나가 뒤집히면 개수는 정확히 1 차이
+    assert (np.abs(counted - data["count"])[wrong] == 1).all()
+    assert 0.02 < wrong.sum() / visible.sum() < 0.08
+
+
+def test_process_results_carry_the_same_truth():
+    hands = SyntheticHands(max_num_hands=2, seed=11, chunk=64)
+    counter = FingerCounter(handed=True)
+    for _ in range(200):  # 청크 경계를 여러 번 넘는다
+        landmarks, is_left = landmark_array(hands.process())
+        truth = hands.last
+        assert is_left.tolist() == truth["is_left"].tolist()
+        assert counter.count_array(landmarks, is_left).tolist() == truth["count"].tolist()
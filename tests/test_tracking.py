@@ -0,0 +1,95 @@
+"""HandTracker: 교차할 때 ID 유지, 손잡이 투표, 두 손보다 많을 때"""
+import numpy as np
+
+from handpiano.tracking import HandTracker
+
+SHAPE = np.random.default_rng(0).normal(0, 0.02, (21, 3)).astype(np.float32)
+
+
+def hand_at(x, y):
+    return SHAPE + np.array([x, y, 0], dtype=np.float32)
+
+
+def frame(hands, order=None):
+    """[(x, y, 왼손?)] → (landmarks, is_left), order 로 입력 순서를 섞는다"""
+    order = range(len(hands)) if order is None else order
+    picked = [hands[i] for i in order]
+    landmarks = np.array([hand_at(x, y) for x, y, _ in picked]).reshape(-1, 21, 3)
+    return landmarks, np.array([left for _, _, left in picked], dtype=bool)
+
+
+def test_ids_survive_crossing_and_input_order_swaps():
+    tracker = HandTracker()
+    rng = np.random.default_rng(1)
+    ids = None
+    for x in np.linspace(0.2, 0.8, 31):  # 한 프레임 0.02 씩, 가운데서 엇갈린다
+        hands = [(x, 0.4, True), (1.0 - x, 0.6, False)]
+        order = rng.permutation(2)
+        tracks = tracker.update(*frame(hands, order))
+        by_hand = {int(i): track.id for i, track in zip(order, tracks)}
+        if ids is None:
+            ids = by_hand
+        assert by_hand == ids
+    assert len(tracker.tracks) == 2
+
+
+def test_single_frame_label_flips_do_not_change_handedness():
+    tracker = HandTracker(decay=0.9)
+    for i in range(60):
+        flipped = i % 10 == 5  # 열 프레임에 한 번 라벨이 튄다
+        (track,) = tracker.update(*frame([(0.5, 0.5, not flipped)]))
+        assert track.is_left
+    assert track.id == 1
+
+
+def test_sustained_label_change_flips_vote():
+    tracker = HandTracker(decay=0.9)
+    for _ in range(20):
+        tracker.update(*frame([(0.5, 0.5, True)]))
+    flipped_at = None
+    for i in range(60):
+        (track,) = tracker.update(*frame([(0.5, 0.5, False)]))
+        if flipped_at is None and not track.is_left:
+            flipped_at = i
+    assert flipped_at is not None and flipped_at > 1
+    assert track.id == 1
+
+
+def test_more_than_two_hands_keep_ids():
+    tracker = HandTracker()
+    rng = np.random.default_rng(2)
+    homes = [(0.2, 0.3), (0.8, 0.3), (0.2, 0.7), (0.8, 0.7)]
+    ids = None
+    for step in range(40):
+        drift = 0.05 * np.sin(step / 6)
+        hands = [(x + drift, y - drift, i % 2 == 0) for i, (x, y) in enumerate(homes)]
+        order = rng.permutation(4)
+        tracks = tracker.update(*frame(hands, order))
+        by_hand = {int(i): track.id for i, track in zip(order, tracks)}
+        if ids is None:
+            ids = by_hand
+        assert by_hand == ids
+    assert sorted(ids.values()) == [1, 2, 3, 4]
+    is_left = {track.id: track.is_left for track in tracker.tracks}
+    assert {i: is_left[track_id] for i, track_id in ids.items()} == \
+        {0: True, 1: False, 2: True, 3: False}
+
+
+def test_missing_hand_keeps_id_briefly_then_gets_new_one():
+    tracker = HandTracker(max_missing=3)
+    a, b = (0.3, 0.5, True), (0.7, 0.5, False)
+    first = {track.is_left: track.id for track in tracker.update(*frame([a, b]))}
+    for _ in range(3):
+        tracker.update(*frame([a]))
+    again = {track.is_left: track.id for track in tracker.update(*frame([a, b]))}
+    assert again == first
+    for _ in range(4):
+        tracker.update(*frame([a]))
+    later = {track.is_left: track.id for track in tracker.update(*frame([a, b]))}
+    assert later[True] == first[True]
+    assert later[False] not in first.values()
+
+
+def test_no_hands():
+    tracker = HandTracker()
+    assert tracker.update(np.zeros((0, 21, 3)), np.zeros(0, dtype=bool)) == []